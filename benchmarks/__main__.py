@@ -0,0 +1,43 @@
+"""Run the benchmark suite.
+
+Usage: ``poetry run python -m benchmarks [-k PATTERN] [--json FILE] [--compare FILE]``
+"""
+
+import argparse
+import sys
+
+# Importing the modules registers their benchmarks.
+from . import display, parallel, primitives, render
+from .harness import compare, dump, load, run
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "-k", metavar="PATTERN", default="", help="select benchmarks by regex"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="timing rounds per benchmark"
+    )
+    parser.add_argument("--json", metavar="FILE", help="save results to a JSON file")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="compare against saved results"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.k, args.repeat, verbose=args.compare is None)
+    if args.json:
+        dump(results, args.json)
+    if args.compare:
+        return 1 if compare(results, load(args.compare), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""Per-pixel throughput of the built-in displays."""
+
+import random
+
+from dotmatrix.displays import Block, Braille, Unit
+
+from .harness import SIZES, benchmark
+
+DISPLAYS = (Braille, Block, Unit)
+# Amount of pixels accessed per timed call.
+PIXELS = 10_000
+
+
+def _points(size):
+    rng = random.Random(0)
+    return [(rng.randrange(size), rng.randrange(size)) for _ in range(PIXELS)]
+
+
+def _setitem(display, size):
+    def setup():
+        d, ps = display(size, size), _points(size)
+
+        def bench():
+            for p in ps:
+                d[p] = True
+
+        return bench
+
+    return setup
+
+
+def _set_many(display, size):
+    def setup():
+        d, ps = display(size, size), _points(size)
+        return lambda: d.set_many(ps, True)
+
+    return setup
+
+
+def _getitem(display, size):
+    def setup():
+        d, ps = display(size, size), _points(size)
+        for p in ps[::2]:
+            d[p] = True
+
+        def bench():
+            for p in ps:
+                d[p]
+
+        return bench
+
+    return setup
+
+
+def _blit(display, size):
+    def setup():
+        d, layer = display(size, size), display(size, size)
+        layer.set_many(_points(size), True)
+        return lambda: d.blit(layer, (0, 0), "xor")
+
+    return setup
+
+
+def _frame(display, size):
+    # A whole frame, setting every eighth pixel and rendering the result, i.e.
+    # work proportional to the area: the time should scale linearly with it.
+    def setup():
+        d = display(size, size)
+        ps = [(x, y) for y in range(size) for x in range(y % 8, size, 8)]
+
+        def bench():
+            for p in ps:
+                d[p] = True
+            d.render()
+
+        return bench
+
+    return setup
+
+
+def _scroll(display, size):
+    def setup():
+        d = display(size, size)
+        d.set_many(_points(size), True)
+        return lambda: d.scroll(-1, 0)
+
+    return setup
+
+
+for _display in DISPLAYS:
+    for _size in SIZES:
+        _name = f"{_display.__name__}/{_size}"
+        benchmark(f"display/setitem/{_name}")(_setitem(_display, _size))
+        benchmark(f"display/set_many/{_name}")(_set_many(_display, _size))
+        benchmark(f"display/getitem/{_name}")(_getitem(_display, _size))
+        benchmark(f"display/blit/{_name}")(_blit(_display, _size))
+        benchmark(f"display/scroll/{_name}")(_scroll(_display, _size))
+        benchmark(f"display/frame/{_name}")(_frame(_display, _size))
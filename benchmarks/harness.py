@@ -0,0 +1,137 @@
+"""Minimal benchmark registry and runner, based on :mod:`timeit`."""
+
+import json
+import platform
+import re
+import statistics
+import timeit
+from typing import Callable, Dict
+
+import dotmatrix
+
+__all__ = ("SIZES", "benchmark", "run", "dump", "load", "compare")
+
+
+# Canvas sizes (width and height) most benchmarks are run at.
+SIZES = (64, 256, 1024)
+
+Setup = Callable[[], Callable[[], object]]
+Results = Dict[str, Dict[str, float]]
+
+_registry: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark.
+
+    The decorated function prepares everything needed and returns the
+    callable that is actually timed.
+
+    :param name: unique name of the benchmark
+    :type name: str
+    :return: decorator registering the benchmark
+    :rtype: Callable[[Setup], Setup]
+    """
+
+    def register(setup: Setup) -> Setup:
+        if name in _registry:
+            raise ValueError(f"Duplicate benchmark: {name}")
+        _registry[name] = setup
+        return setup
+
+    return register
+
+
+def run(pattern: str = "", repeat: int = 5, verbose: bool = True) -> Results:
+    """Run all benchmarks whose name matches the given pattern.
+
+    :param pattern: regular expression to select benchmarks by, defaults to ""
+    :type pattern: str, optional
+    :param repeat: amount of timing rounds per benchmark, defaults to 5
+    :type repeat: int, optional
+    :param verbose: print results as they come in, defaults to True
+    :type verbose: bool, optional
+    :return: seconds per call (best and median) per benchmark
+    :rtype: Results
+    """
+    results: Results = {}
+    for name, setup in _registry.items():
+        if not re.search(pattern, name):
+            continue
+        timer = timeit.Timer(setup())
+        number, _ = timer.autorange()
+        times = [t / number for t in timer.repeat(repeat, number)]
+        results[name] = {"best": min(times), "median": statistics.median(times)}
+        if verbose:
+            print(f"{name:<48} {_fmt(results[name]['best']):>10}")
+    return results
+
+
+def dump(results: Results, path: str):
+    """Save results, together with some info on the environment, as JSON.
+
+    :param results: results to save
+    :type results: Results
+    :param path: file to save the results to
+    :type path: str
+    """
+    with open(path, "w") as fp:
+        json.dump(
+            {
+                "dotmatrix": dotmatrix.__version__,
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "results": results,
+            },
+            fp,
+            indent=2,
+        )
+
+
+def load(path: str) -> Results:
+    """Load results previously saved with :func:`dump`.
+
+    :param path: file to load the results from
+    :type path: str
+    :return: the loaded results
+    :rtype: Results
+    """
+    with open(path) as fp:
+        return json.load(fp)["results"]
+
+
+def compare(results: Results, baseline: Results, threshold: float = 0.1) -> int:
+    """Print a comparison of results against a baseline.
+
+    :param results: current results
+    :type results: Results
+    :param baseline: baseline results
+    :type baseline: Results
+    :param threshold: relative slowdown considered a regression, defaults to 0.1
+    :type threshold: float, optional
+    :return: amount of regressions
+    :rtype: int
+    """
+    regressions = 0
+    print(f"{'benchmark':<48} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name in results:
+        if name not in baseline:
+            print(f"{name:<48} {'-':>10} {_fmt(results[name]['best']):>10}")
+            continue
+        old, new = baseline[name]["best"], results[name]["best"]
+        change = new / old - 1
+        flag = ""
+        if change > threshold:
+            regressions += 1
+            flag = "  slower"
+        elif change < -threshold:
+            flag = "  faster"
+        print(f"{name:<48} {_fmt(old):>10} {_fmt(new):>10} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def _fmt(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
@@ -0,0 +1,76 @@
+"""Scaling of tiled rendering with the amount of worker processes."""
+
+import atexit
+import os
+import random
+from array import array
+
+from dotmatrix import Matrix
+from dotmatrix.parallel import TiledRenderer
+
+from .harness import benchmark
+
+# Width and height of the poster sized canvas.
+POSTER = 4096
+# Amount of pixels, and batches thereof, rasterized per timed call.
+PIXELS = 400_000
+BATCHES = 16
+# Worker counts from 1 up to the amount of CPUs, doubling each time.
+WORKERS = sorted(
+    {1 << i for i in range((os.cpu_count() or 1).bit_length())} | {os.cpu_count() or 1}
+)
+
+
+def _matrix():
+    rng = random.Random(0)
+    m = Matrix(POSTER, POSTER)
+    m.scatter(*((rng.randrange(POSTER), rng.randrange(POSTER)) for _ in range(PIXELS)))
+    return m
+
+
+def _batches():
+    rng = random.Random(0)
+    coords = array("i", (rng.randrange(POSTER) for _ in range(2 * PIXELS)))
+    size = len(coords) // BATCHES
+    return [coords[i : i + size] for i in range(0, len(coords), size)]
+
+
+def _renderer(workers):
+    renderer = TiledRenderer(_matrix(), workers=workers)
+    atexit.register(renderer.close)
+    # Start up the worker processes before timing anything.
+    renderer.render()
+    return renderer
+
+
+@benchmark("parallel/render/serial")
+def _render_serial():
+    return _matrix().render
+
+
+@benchmark("parallel/scatter/serial")
+def _scatter_serial():
+    m, batches = _matrix(), _batches()
+
+    def bench():
+        for coords in batches:
+            m.scatter(*zip(coords[0::2], coords[1::2]))
+
+    return bench
+
+
+def _render(workers):
+    return lambda: _renderer(workers).render
+
+
+def _scatter(workers):
+    def setup():
+        renderer, batches = _renderer(workers), _batches()
+        return lambda: renderer.scatter(batches)
+
+    return setup
+
+
+for _workers in WORKERS:
+    benchmark(f"parallel/render/{_workers}")(_render(_workers))
+    benchmark(f"parallel/scatter/{_workers}")(_scatter(_workers))
@@ -0,0 +1,153 @@
+"""Drawing primitives of :class:`dotmatrix.Matrix` across canvas sizes."""
+
+import math
+import random
+from array import array
+
+from dotmatrix import Matrix, Sprite
+from dotmatrix.displays import Braille
+
+from .harness import SIZES, benchmark
+
+
+def _primitive(draw, size):
+    def setup():
+        m = Matrix(size, size, display=Braille)
+        return lambda: draw(m, size)
+
+    return setup
+
+
+def _polygon(m, size):
+    # A star with 16 spikes spanning the whole canvas.
+    c, r = size // 2, size // 2 - 1
+    m.polygon(
+        *(
+            (
+                round(c + r * (1 - i % 2 / 2) * math.cos(i * math.pi / 16)),
+                round(c + r * (1 - i % 2 / 2) * math.sin(i * math.pi / 16)),
+            )
+            for i in range(32)
+        )
+    )
+
+
+def _dots(m, size):
+    # Many small filled circles along the diagonal.
+    for i in range(0, size, 4):
+        m.circle((i, i), 3, fill=True)
+
+
+def _sprites(m, size):
+    # The same as above, stamped from a (cached) sprite.
+    for i in range(0, size, 4):
+        m.show(Sprite.circle(3, fill=True), (i, i))
+
+
+# A long time series, far more values than any canvas is wide.
+SERIES = [math.sin(i / 1000) + math.sin(i / 37) / 4 for i in range(100_000)]
+
+
+PRIMITIVES = {
+    "line": lambda m, s: m.line((0, 0), (s - 1, s // 3)),
+    "circle": lambda m, s: m.circle((s // 2, s // 2), s // 2 - 1),
+    "ellipse": lambda m, s: m.ellipse((s // 2, s // 2), s // 2 - 1, s // 4),
+    "curve": lambda m, s: m.curve((0, 0), (s - 1, 0), (0, s - 1), (s - 1, s - 1)),
+    "spline": lambda m, s: m.spline(
+        *((x, s // 2 + (s // 3 if x % 2 else -s // 3)) for x in range(0, s, 8))
+    ),
+    "plotf": lambda m, s: m.plotf(
+        lambda x: s / 3 * math.sin(x / s * 4 * math.pi), range(s), origin=(0, s // 2)
+    ),
+    "polygon": _polygon,
+    "plot_series": lambda m, s: m.plot_series(SERIES),
+    "iplot_series": lambda m, s: m.iplot_series(iter(SERIES), len(SERIES), -1.25, 1.25),
+    "dots": _dots,
+    "text": lambda m, s: m.text("\n".join(["0123456789 ABCDEF abcdef"] * (s // 8))),
+    "sprites": _sprites,
+    # Shapes reaching far beyond the canvas, only a small part is visible.
+    "line_clipped": lambda m, s: m.line((-100 * s, 0), (100 * s, s // 2)),
+    "circle_clipped": lambda m, s: m.circle((s // 2, 100 * s), 100 * s - s // 2),
+    "ellipse_clipped": lambda m, s: m.ellipse((s // 2, s * 10), 10 * s, 10 * s - 1),
+}
+
+
+for _name, _draw in PRIMITIVES.items():
+    for _size in SIZES:
+        benchmark(f"primitive/{_name}/{_size}")(_primitive(_draw, _size))
+
+
+def _scene(m, size, t):
+    # A static scene with a single moving line on top.
+    _polygon(m, size)
+    _dots(m, size)
+    m.text("dotmatrix", (1, 1))
+    m.line((t % size, 0), (size - 1 - t % size, size - 1))
+
+
+def _frames(retained, size):
+    def setup():
+        m, frame = Matrix(size, size, display=Braille), iter(range(1 << 30))
+        recording = m.record() if retained else None
+
+        def bench():
+            t = next(frame)
+            if recording is None:
+                m.display.fill_rect(0, 0, size - 1, size - 1, False)
+                _scene(m, size, t)
+            else:
+                recording.clear()
+                _scene(m, size, t)
+                recording.flush()
+
+        return bench
+
+    return setup
+
+
+for _size in SIZES:
+    benchmark(f"frame/immediate/{_size}")(_frames(False, _size))
+    benchmark(f"frame/retained/{_size}")(_frames(True, _size))
+
+
+# Amount of shapes drawn per timed call of the batch benchmarks.
+SHAPES = 10_000
+
+
+def _shapes(size, values):
+    rng = random.Random(0)
+    return array("i", (rng.randrange(size) for _ in range(SHAPES * values)))
+
+
+def _batch(draw, values, size):
+    def setup():
+        m, coords = Matrix(size, size, display=Braille), _shapes(size, values)
+        return lambda: draw(m, memoryview(coords))
+
+    return setup
+
+
+def _each_line(m, c):
+    for i in range(0, len(c), 4):
+        m.line((c[i], c[i + 1]), (c[i + 2], c[i + 3]))
+
+
+def _each_circle(m, c):
+    for i in range(0, len(c), 2):
+        m.circle((c[i], c[i + 1]), 3)
+
+
+def _each_point(m, c):
+    m.iscatter((c[i], c[i + 1]) for i in range(0, len(c), 2))
+
+
+BATCHES = {
+    "lines": (lambda m, c: m.lines(c), _each_line, 4),
+    "circles": (lambda m, c: m.circles(c, 3), _each_circle, 2),
+    "points": (lambda m, c: m.points(c[0::2], c[1::2]), _each_point, 2),
+}
+
+for _size in SIZES:
+    for _name, (_batched, _each, _values) in BATCHES.items():
+        benchmark(f"batch/{_name}/{_size}")(_batch(_batched, _values, _size))
+        benchmark(f"batch/{_name}_each/{_size}")(_batch(_each, _values, _size))
@@ -0,0 +1,52 @@
+"""Render time vs. canvas size for the built-in displays."""
+
+import os
+import random
+
+from dotmatrix import Matrix
+from dotmatrix.displays import Block, Braille, ColorBraille, Shade, Unit
+
+from .harness import SIZES, benchmark
+
+DISPLAYS = (Braille, Block, Unit, Shade)
+
+
+def _matrix(display, size):
+    rng = random.Random(0)
+    m = Matrix(size, size, display=display)
+    m.scatter(*((rng.randrange(size), rng.randrange(size)) for _ in range(size * 8)))
+    return m
+
+
+def _colored(size):
+    # Horizontal bands of shapes in different colors.
+    def setup():
+        m = Matrix(size, size, display=ColorBraille)
+        for i, y in enumerate(range(0, size, 16)):
+            m.line((0, y), (size - 1, y + 15), brush=i % 16)
+            m.circle((y, y), 6, brush=(i + 1) % 16)
+        return m.render
+
+    return setup
+
+
+def _render(display, size):
+    return lambda: _matrix(display, size).render
+
+
+def _write(display, size):
+    def setup():
+        m, sink = _matrix(display, size), open(os.devnull, "wb")
+        return lambda: m.render_to(sink)
+
+    return setup
+
+
+for _display in DISPLAYS:
+    for _size in SIZES:
+        _name = f"{_display.__name__}/{_size}"
+        benchmark(f"render/{_name}")(_render(_display, _size))
+        benchmark(f"render_to/{_name}")(_write(_display, _size))
+
+for _size in SIZES:
+    benchmark(f"render/ColorBraille/{_size}")(_colored(_size))
@@ -1,6 +1,8 @@
 from . import displays
+from .font import Font
 from .matrix import Matrix
+from .sprite import Sprite
 
 __version__ = "0.2.0"
 
-__all__ = ("Matrix", "displays")
+__all__ = ("Matrix", "Sprite", "Font", "displays")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Iterable, Protocol, Tuple, TypeVar, Union
+from typing import IO, Any, Iterable, Protocol, Tuple, TypeVar, Union
 
 V = TypeVar("V")
 O = TypeVar("O", covariant=True)
 
 Point = Tuple[int, int]
+# Horizontal run of pixels, i.e. (y, x0, x1) with both x0 and x1 inclusive.
+Span = Tuple[int, int, int]
+# Axis aligned box, i.e. (x0, y0, x1, y1) with both corners inclusive.
+Box = Tuple[int, int, int, int]
 
 
 class UseDefault:
@@ -83,3 +87,236 @@ class Display(Protocol[V, O]):
         :type val: bool
         :raises IndexError: requested pixel is out of the bounds of the matrix
         """
+
+
+class BulkDisplay(Display[V, O], Protocol):
+    """A display that can set many pixels at once.
+
+    Implementing this is optional, a matrix falls back to setting pixels one
+    by one for displays that don't.
+    """
+
+    def set_many(self, ps: Iterable[Point], val: V):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param ps: positions of the pixels to set
+        :type ps: Iterable[Point]
+        :param val: the value to set the pixels to
+        :type val: V
+        """
+
+
+class FlatDisplay(Display[V, O], Protocol):
+    """A display that can set many pixels at once, given by their indices.
+
+    Implementing this is optional, a matrix falls back to setting the pixels
+    via their positions for displays that don't.
+    """
+
+    def set_flat(self, indices: Iterable[int], val: V):
+        """Set the value of many pixels at once.
+
+        :param indices: row-major indices of the pixels to set, i.e.
+            x + y * width, which must all be within bounds
+        :type indices: Iterable[int]
+        :param val: the value to set the pixels to
+        :type val: V
+        """
+
+
+class ArrayDisplay(Display[V, O], Protocol):
+    """A display that can set many pixels at once, given by coordinate arrays.
+
+    Implementing this is optional, a matrix falls back to setting the pixels
+    via their positions for displays that don't.
+    """
+
+    def scatter_array(self, xs: Any, ys: Any, val: V):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply dropped!
+
+        :param xs: x coordinates of the pixels
+        :type xs: Any
+        :param ys: y coordinates of the pixels
+        :type ys: Any
+        :param val: the value to set the pixels to
+        :type val: V
+        """
+
+
+class RowDisplay(Display[V, O], Protocol):
+    """A display that can set whole rows of pixels at once.
+
+    Implementing this is optional, a matrix falls back to setting pixels one
+    by one for displays that don't.
+    """
+
+    def set_row(self, y: int, row: bytes):
+        """Set the values of a whole row of pixels at once.
+
+        :param y: y coordinate of the row
+        :type y: int
+        :param row: one byte per pixel, nonzero meaning set
+        :type row: bytes
+        :raises IndexError: the row is out of bounds or of the wrong length
+        """
+
+
+class BlitDisplay(Display[V, O], Protocol):
+    """A display that can be copied and composited cheaply.
+
+    Implementing this is optional, a matrix falls back to copying and
+    combining pixels one by one for displays that don't.
+    """
+
+    def copy(self) -> "BlitDisplay[V, O]":
+        """Create an independent copy of the display.
+
+        :return: the copy
+        :rtype: BlitDisplay[V, O]
+        """
+
+    def blit(self, src: Display, at: Point = (0, 0), op: str = "or"):
+        """Combine the pixels of another display into this one.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param src: the display to draw
+        :type src: Display
+        :param at: position of the source's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: one of "or", "and", "xor" and "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+
+
+class ScrollDisplay(Display[V, O], Protocol):
+    """A display that can move all of its pixels at once.
+
+    Implementing this is optional, a matrix falls back to moving pixels one
+    by one for displays that don't.
+    """
+
+    def scroll(self, dx: int, dy: int):
+        """Move all pixels by some offset, clearing the pixels left behind.
+
+        Pixels moved out of bounds are dropped.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+
+
+class SpanDisplay(Display[V, O], Protocol):
+    """A display that can set whole runs of pixels at once.
+
+    Implementing this is optional, a matrix falls back to setting pixels one
+    by one for displays that don't.
+    """
+
+    def fill_span(self, y: int, x0: int, x1: int, val: V):
+        """Set the value of a horizontal run of pixels.
+
+        :param y: y coordinate of the run
+        :type y: int
+        :param x0: x coordinate of the first pixel of the run
+        :type x0: int
+        :param x1: x coordinate of the last pixel of the run (inclusive)
+        :type x1: int
+        :param val: the value to set the pixels to
+        :type val: V
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, val: V):
+        """Set the value of an axis aligned rectangle of pixels.
+
+        :param x0: x coordinate of the top left corner
+        :type x0: int
+        :param y0: y coordinate of the top left corner
+        :type y0: int
+        :param x1: x coordinate of the bottom right corner (inclusive)
+        :type x1: int
+        :param y1: y coordinate of the bottom right corner (inclusive)
+        :type y1: int
+        :param val: the value to set the pixels to
+        :type val: V
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+
+
+class DiffDisplay(Display[V, O], Protocol):
+    """A display that can render only what changed since its last render.
+
+    Implementing this is optional, a matrix falls back to rendering the whole
+    display for displays that don't.
+    """
+
+    def render_diff(self, at: Point = (0, 0), *, full: bool = False) -> str:
+        """Render the changes since the last diff render.
+
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :param full: render everything, regardless of changes, defaults to False
+        :type full: bool, optional
+        :return: ANSI escape sequences and text updating the changed characters
+        :rtype: str
+        """
+
+
+class StreamDisplay(Display[V, O], Protocol):
+    """A display that can write its render result to a stream piece by piece.
+
+    Implementing this is optional, a matrix falls back to writing the result of
+    :meth:`Display.render` for displays that don't.
+    """
+
+    def write_to(self, fp: IO[Any]):
+        """Write the current matrix state to a stream.
+
+        :param fp: the stream to write to, text or binary
+        :type fp: IO[Any]
+        """
+
+
+class BufferDisplay(Display[V, O], Protocol):
+    """A display keeping all of its state in a single flat buffer, its data.
+
+    Implementing this is optional, only matrices on such displays can be
+    saved and opened again. Settings fixed on construction, like the
+    characters to render with, are saved as well if the display lists them
+    in a ``buffer_options`` class attribute, as keyword arguments of
+    :meth:`from_buffer` of the same name.
+    """
+
+    data: Any
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buf: Any,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[V, UseDefault] = USE_DEFAULT,
+    ) -> "BufferDisplay[V, O]":
+        """Create a display on top of an existing buffer, without copying it.
+
+        :param buf: bytes like object holding the display's data, read-only
+            buffers giving read-only displays
+        :type buf: Any
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :raises ValueError: the size of the buffer doesn't match the dimensions
+        :return: the display
+        :rtype: BufferDisplay[V, O]
+        """
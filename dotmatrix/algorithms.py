@@ -1,8 +1,39 @@
-from typing import Iterable, Tuple
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from math import ceil, floor, hypot, inf, sqrt
+from operator import add, floordiv, sub
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, cast
 
-from ._types import Point
+from ._types import Box, Point, Span
 
-__all__ = ("de_casteljau", "bresenham_line", "bresenham_circle", "bresenham_ellipse")
+__all__ = (
+    "de_casteljau",
+    "bezier_steps",
+    "forward_differences",
+    "catmull_rom_bezier",
+    "bspline_bezier",
+    "bresenham_line",
+    "line_size",
+    "bresenham_path",
+    "path_size",
+    "bresenham_lines",
+    "bresenham_circle",
+    "circle_size",
+    "circle_offsets",
+    "circle_span_offsets",
+    "bresenham_ellipse",
+    "ellipse_size",
+    "scanline_polygon",
+    "scanline_circle",
+    "scanline_ellipse",
+    "threshold_dither",
+    "bayer_dither",
+    "floyd_steinberg_dither",
+    "minmax_downsample",
+    "iminmax_downsample",
+    "wu_line",
+    "wu_circle",
+)
 
 
 def de_casteljau(t: float, ps: Iterable[Tuple[float, float]]) -> Tuple[float, float]:
@@ -25,13 +56,176 @@ def de_casteljau(t: float, ps: Iterable[Tuple[float, float]]) -> Tuple[float, fl
     return beta[0]
 
 
-def bresenham_line(p0: Point, p1: Point) -> Iterable[Point]:
+def bezier_steps(ps: Sequence[Tuple[float, float]], tolerance: float = 0.5) -> int:
+    """Determine how many segments are needed to approximate a Bezier curve.
+
+    Wang's formula bounds the distance between a curve of degree n and the
+    chain of segments connecting its points at uniformly spaced t by the
+    largest second difference of its control points. The result is the least
+    amount of segments keeping that distance within the tolerance.
+
+    :param ps: control points
+    :type ps: Sequence[Tuple[float, float]]
+    :param tolerance: maximum distance between the curve and the segments,
+        defaults to 0.5
+    :type tolerance: float, optional
+    :return: amount of segments
+    :rtype: int
+    """
+    n = len(ps) - 1
+    if n < 2:
+        return 1
+    bend = max(
+        hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2)
+        for (x0, y0), (x1, y1), (x2, y2) in zip(ps, ps[1:], ps[2:])
+    )
+    return max(1, ceil(sqrt(n * (n - 1) * bend / (8 * tolerance))))
+
+
+def forward_differences(
+    ps: Sequence[Tuple[float, float]], steps: int
+) -> Iterable[Tuple[float, float]]:
+    """Evaluate a Bezier curve at uniformly spaced t via forward differencing.
+
+    The curve is converted into a polynomial once, from which the initial
+    forward differences follow directly. Every further point then takes just
+    n additions per coordinate, n being the degree of the curve.
+
+    :param ps: control points
+    :type ps: Sequence[Tuple[float, float]]
+    :param steps: amount of segments, i.e. the curve is evaluated at t = i /
+        steps for i in 0..steps
+    :type steps: int
+    :yield: points on the curve
+    :rtype: Tuple[float, float]
+    """
+    n, h = len(ps) - 1, 1 / steps
+    # The k-th forward difference of i^j at i = 0, i.e. k! times the Stirling
+    # number of the second kind S(j, k).
+    stirling = [[1] + [0] * n]
+    for j in range(1, n + 1):
+        prev = stirling[-1]
+        stirling.append([0] + [k * (prev[k] + prev[k - 1]) for k in range(1, n + 1)])
+    tables = []
+    for coords in ([x for x, _ in ps], [y for _, y in ps]):
+        # Coefficient j of the polynomial in i = t / h is C(n, j) times the
+        # j-th forward difference of the control points times h^j.
+        coeffs, binom = [], 1
+        for j in range(n + 1):
+            coeffs.append(binom * coords[0] * h**j)
+            coords = [b - a for a, b in zip(coords, coords[1:])]
+            binom = binom * (n - j) // (j + 1)
+        tables.append(
+            [
+                sum(coeffs[j] * stirling[j][k] for j in range(k, n + 1))
+                for k in range(n + 1)
+            ]
+        )
+    xs, ys = tables
+    yield xs[0], ys[0]
+    for _ in range(steps):
+        for i in range(n):
+            xs[i] += xs[i + 1]
+            ys[i] += ys[i + 1]
+        yield xs[0], ys[0]
+
+
+def catmull_rom_bezier(
+    ps: Sequence[Tuple[float, float]], closed: bool = False
+) -> Iterable[Sequence[Tuple[float, float]]]:
+    """Convert a (uniform) Catmull-Rom spline into cubic Bezier curves.
+
+    The spline passes through all of the points, the curve of the first and
+    last one continuing straight towards its neighbour unless it is closed.
+
+    :param ps: points to pass through
+    :type ps: Sequence[Tuple[float, float]]
+    :param closed: connect the last point back to the first one, defaults to
+        False
+    :type closed: bool, optional
+    :yield: control points of the curve between every two points
+    :rtype: Sequence[Tuple[float, float]]
+    """
+    n = len(ps)
+    if closed:
+        ps = [ps[i % n] for i in range(-1, n + 2)]
+    else:
+        ps = [ps[0], *ps, ps[-1]]
+    for (x0, y0), (x1, y1), (x2, y2), (x3, y3) in zip(ps, ps[1:], ps[2:], ps[3:]):
+        yield (
+            (x1, y1),
+            (x1 + (x2 - x0) / 6, y1 + (y2 - y0) / 6),
+            (x2 - (x3 - x1) / 6, y2 - (y3 - y1) / 6),
+            (x2, y2),
+        )
+
+
+def bspline_bezier(
+    ps: Sequence[Tuple[float, float]], closed: bool = False
+) -> Iterable[Sequence[Tuple[float, float]]]:
+    """Convert a uniform cubic B-spline into cubic Bezier curves.
+
+    The spline is pulled towards the points without passing through them,
+    except for the first and last one unless it is closed.
+
+    :param ps: control points
+    :type ps: Sequence[Tuple[float, float]]
+    :param closed: connect the last point back to the first one, defaults to
+        False
+    :type closed: bool, optional
+    :yield: control points of the curve of every span of the spline
+    :rtype: Sequence[Tuple[float, float]]
+    """
+    n = len(ps)
+    if closed:
+        ps = [ps[i % n] for i in range(n + 3)]
+    else:
+        ps = [ps[0], ps[0], *ps, ps[-1], ps[-1]]
+    for (x0, y0), (x1, y1), (x2, y2), (x3, y3) in zip(ps, ps[1:], ps[2:], ps[3:]):
+        yield (
+            ((x0 + 4 * x1 + x2) / 6, (y0 + 4 * y1 + y2) / 6),
+            ((2 * x1 + x2) / 3, (2 * y1 + y2) / 3),
+            ((x1 + 2 * x2) / 3, (y1 + 2 * y2) / 3),
+            ((x1 + 4 * x2 + x3) / 6, (y1 + 4 * y2 + y3) / 6),
+        )
+
+
+def _step_range(
+    p: int, s: int, lo: int, hi: int, q: int, t: int, qlo: int, qhi: int, a: int, b: int
+) -> Tuple[int, int]:
+    """Determine the steps of a line that lie within some bounds.
+
+    The pixel at step k of a line with major delta b and minor delta a <= b is
+    (p + s * k, q + t * j) with j = (2 * a * k + b) // (2 * b). Requiring it to
+    lie within [lo, hi] x [qlo, qhi] bounds k from both sides, as the pixel is
+    monotone in k along both axes.
+    """
+    k0, k1 = (lo - p, hi - p) if s > 0 else (p - hi, p - lo)
+    j0, j1 = (qlo - q, qhi - q) if t > 0 else (q - qhi, q - qlo)
+    if a == 0:
+        if not j0 <= 0 <= j1:
+            return 1, 0
+    else:
+        k0 = max(k0, -((b - 2 * b * j0) // (2 * a)))
+        k1 = min(k1, (2 * b * (j1 + 1) - b - 1) // (2 * a))
+    return max(k0, 0), min(k1, b)
+
+
+def bresenham_line(p0: Point, p1: Point, box: Optional[Box] = None) -> Iterable[Point]:
     """Bresenham's line drawing algorithm.
 
+    If a clipping box is given, only the pixels of the line within it are
+    generated. The visible range of steps is determined upfront (akin to
+    Liang-Barsky clipping, but in integer steps of the line) and the algorithm
+    starts right at the first visible pixel, so the same pixels as without
+    clipping are produced at a cost depending only on the visible part.
+
     :param p0: coordinates of the first point
     :type p0: Point
     :param p1: coordinates of the second point
     :type p1: Point
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
     :yield: points on the line
     :rtype: Point
     """
@@ -40,6 +234,26 @@ def bresenham_line(p0: Point, p1: Point) -> Iterable[Point]:
     dy, sy = -abs(y1 - y0), [-1, 1][y0 < y1]
     err = dx + dy
 
+    if box is not None:
+        bx0, by0, bx1, by1 = box
+        if dx >= -dy:
+            k0, k1 = _step_range(x0, sx, bx0, bx1, y0, sy, by0, by1, -dy, dx)
+        else:
+            k0, k1 = _step_range(y0, sy, by0, by1, x0, sx, bx0, bx1, dx, -dy)
+        if k0 > k1:
+            return
+        # Pixel (x0 + sx * i, y0 + sy * j) of step k, the error term being
+        # dx * (j + 1) + dy * (i + 1) there.
+        if dx == 0 and dy == 0:
+            steps = [(0, 0), (0, 0)]
+        elif dx >= -dy:
+            steps = [(k, (-2 * dy * k + dx) // (2 * dx)) for k in (k0, k1)]
+        else:
+            steps = [((2 * dx * k - dy) // (-2 * dy), k) for k in (k0, k1)]
+        (i0, j0), (i1, j1) = steps
+        x0, y0, x1, y1 = x0 + sx * i0, y0 + sy * j0, x0 + sx * i1, y0 + sy * j1
+        err = dx * (j0 + 1) + dy * (i0 + 1)
+
     while 1:
         yield (x0, y0)
         if x0 == x1 and y0 == y1:
@@ -53,16 +267,193 @@ def bresenham_line(p0: Point, p1: Point) -> Iterable[Point]:
             y0 += sy
 
 
-def bresenham_circle(c: Point, r: int) -> Iterable[Point]:
+def line_size(p0: Point, p1: Point) -> int:
+    """Count the pixels of a line, see :func:`bresenham_line`, without clipping.
+
+    :param p0: coordinates of the first point
+    :type p0: Point
+    :param p1: coordinates of the second point
+    :type p1: Point
+    :return: amount of pixels, one per step along the major axis
+    :rtype: int
+    """
+    return max(abs(p1[0] - p0[0]), abs(p1[1] - p0[1])) + 1
+
+
+def bresenham_path(
+    ps: Iterable[Tuple[float, float]], box: Optional[Box] = None
+) -> Iterable[Point]:
+    """Draw a chain of segments through points rounded to pixels.
+
+    Consecutive points rounding to the same pixel are merged, a path of a
+    single pixel still yields it.
+
+    :param ps: points of the path
+    :type ps: Iterable[Tuple[float, float]]
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
+    :yield: points on the path
+    :rtype: Point
+    """
+    it = iter(ps)
+    x, y = next(it)
+    prev = round(x), round(y)
+    drawn = False
+    for x, y in it:
+        p = round(x), round(y)
+        if p != prev:
+            yield from bresenham_line(prev, p, box)
+            prev, drawn = p, True
+    if not drawn:
+        yield from bresenham_line(prev, prev, box)
+
+
+def path_size(ps: Iterable[Tuple[float, float]]) -> int:
+    """Count the pixels of a path, see :func:`bresenham_path`, without clipping.
+
+    :param ps: points of the path
+    :type ps: Iterable[Tuple[float, float]]
+    :return: amount of pixels
+    :rtype: int
+    """
+    it = iter(ps)
+    x, y = next(it)
+    prev, size = (round(x), round(y)), 0
+    for x, y in it:
+        p = round(x), round(y)
+        if p != prev:
+            size += line_size(prev, p)
+            prev = p
+    return size or 1
+
+
+def bresenham_lines(
+    coords: Sequence[int], box: Optional[Box] = None
+) -> Iterable[Tuple[Iterable[int], Iterable[int]]]:
+    """Bresenham's line drawing algorithm for a batch of lines.
+
+    Produces the same pixels as :func:`bresenham_line` does for every line,
+    but computes the minor coordinates of a whole line at once, from the
+    closed form of its steps, instead of stepping through its pixels. The
+    coordinates are generated as separate lazy iterables per line, so they
+    can be zipped to points or combined into flat indices without creating
+    a tuple per pixel.
+
+    :param coords: the lines' end points as flat x0, y0, x1, y1 quadruples,
+        e.g. an :class:`array.array` or a memoryview
+    :type coords: Sequence[int]
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
+    :yield: x and y coordinates of the pixels of each (visible) line
+    :rtype: Tuple[Iterable[int], Iterable[int]]
+    """
+    bx0, by0, bx1, by1 = (
+        (-(1 << 62), -(1 << 62), 1 << 62, 1 << 62) if box is None else box
+    )
+    for x0, y0, x1, y1 in zip(coords[0::4], coords[1::4], coords[2::4], coords[3::4]):
+        dx, sx = abs(x1 - x0), [-1, 1][x0 < x1]
+        dy, sy = abs(y1 - y0), [-1, 1][y0 < y1]
+        # The minor coordinate of step k is offset by (2 * a * k + b) // (2 * b),
+        # a and b being the minor and major deltas, computed via map and range
+        # without running any bytecode per pixel.
+        if dx >= dy:
+            k0, k1 = _step_range(x0, sx, bx0, bx1, y0, sy, by0, by1, dy, dx)
+            if k0 > k1:
+                continue
+            xs = range(x0 + sx * k0, x0 + sx * (k1 + 1), sx)
+            if not dy:
+                # Also covers single points, without a major delta to divide by.
+                yield xs, repeat(y0, len(xs))
+                continue
+            js = range(2 * dy * k0 + dx, 2 * dy * (k1 + 1) + dx, 2 * dy)
+            offsets = map(floordiv, js, repeat(2 * dx))
+            if sy > 0:
+                yield xs, map(add, offsets, repeat(y0))
+            else:
+                yield xs, map(sub, repeat(y0), offsets)
+        else:
+            k0, k1 = _step_range(y0, sy, by0, by1, x0, sx, bx0, bx1, dx, dy)
+            if k0 > k1:
+                continue
+            ys = range(y0 + sy * k0, y0 + sy * (k1 + 1), sy)
+            if not dx:
+                yield repeat(x0, len(ys)), ys
+                continue
+            js = range(2 * dx * k0 + dy, 2 * dx * (k1 + 1) + dy, 2 * dx)
+            offsets = map(floordiv, js, repeat(2 * dy))
+            if sx > 0:
+                yield map(add, offsets, repeat(x0)), ys
+            else:
+                yield map(sub, repeat(x0), offsets), ys
+
+
+def _inside(box: Box, p: Point) -> bool:
+    x, y = p
+    return box[0] <= x <= box[2] and box[1] <= y <= box[3]
+
+
+def _overlap(x0: int, y0: int, x1: int, y1: int, box: Optional[Box]) -> Optional[bool]:
+    """Check how the bounds x0..x1, y0..y1 of a shape overlap a clipping box.
+
+    :return: None if they are disjoint, whether the shape needs clipping otherwise
+    """
+    if box is None:
+        return False
+    bx0, by0, bx1, by1 = box
+    if x1 < bx0 or x0 > bx1 or y1 < by0 or y0 > by1:
+        return None
+    return not (bx0 <= x0 and x1 <= bx1 and by0 <= y0 and y1 <= by1)
+
+
+def _first(lo: int, hi: int, pred: Callable[[int], bool]) -> int:
+    """Find the first integer in [lo, hi) satisfying a monotone predicate."""
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if pred(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _circle_y(r: int, x: int) -> int:
+    """Determine the y coordinate of the first octant of a circle at x.
+
+    This is the largest y with y * (y - 1) < r * r - x * x, matching the path
+    of :func:`bresenham_circle` everywhere except possibly its very last step.
+    """
+    k = r * r - x * x
+    y = int((1 + sqrt(max(4 * k + 1, 0))) / 2)
+    while y > 0 and y * (y - 1) >= k:
+        y -= 1
+    while (y + 1) * y < k:
+        y += 1
+    return y
+
+
+def bresenham_circle(c: Point, r: int, box: Optional[Box] = None) -> Iterable[Point]:
     """Bresenham's circle drawing algorithm.
 
+    If a clipping box is given, only the pixels of the circle within it are
+    generated. Octants outside of the box are skipped entirely and the others
+    are only traced along the part that may be visible.
+
     :param c: coordinates of the circle's center
     :type c: Point
     :param r: radius of the circle
     :type r: int
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
     :yield: points on the circle
     :rtype: Point
     """
+    clip = _overlap(c[0] - r, c[1] - r, c[0] + r, c[1] + r, box)
+    if clip is None:
+        return
+    elif clip:
+        yield from _clipped_circle(c, r, cast(Box, box))
+        return
+
     x0, y0 = c
     f, ddFx, ddFy = 1 - r, 0, -2 * r
     x, y = 0, r
@@ -90,18 +481,152 @@ def bresenham_circle(c: Point, r: int) -> Iterable[Point]:
         )
 
 
-def bresenham_ellipse(c: Point, r1: int, r2: int) -> Iterable[Point]:
+@lru_cache(maxsize=64)
+def circle_offsets(r: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Get the pixels of a circle around the origin, for drawing it anywhere.
+
+    :param r: radius of the circle
+    :type r: int
+    :return: x and y coordinates of the pixels :func:`bresenham_circle`
+        generates for the circle
+    :rtype: Tuple[Tuple[int, ...], Tuple[int, ...]]
+    """
+    xs, ys = zip(*bresenham_circle((0, 0), r))
+    return xs, ys
+
+
+@lru_cache(maxsize=64)
+def circle_size(r: int) -> int:
+    """Count the pixels of a circle, see :func:`bresenham_circle`, without clipping.
+
+    :param r: radius of the circle
+    :type r: int
+    :return: amount of pixels, including the ones generated twice
+    :rtype: int
+    """
+    f, ddFx, ddFy = 1 - r, 0, -2 * r
+    x, y = 0, r
+    while x < y:
+        if f >= 0:
+            y -= 1
+            ddFy += 2
+            f += ddFy
+        x += 1
+        ddFx += 2
+        f += ddFx + 1
+    return 4 + 8 * x
+
+
+def _clipped_circle(c: Point, r: int, box: Box) -> Iterable[Point]:
+    x0, y0 = c
+    bx0, by0, bx1, by1 = box
+
+    yield from (
+        p
+        for p in ((x0, y0 + r), (x0, y0 - r), (x0 + r, y0), (x0 - r, y0))
+        if _inside(box, p)
+    )
+
+    # Determine the steps each octant might be visible in. The point of an
+    # octant is offset from the center by (sx * x, sy * y), or (sx * y, sy * x)
+    # if swapped, with x growing linearly and y shrinking monotonically.
+    ranges: List[Tuple[int, int]] = []
+    for sx, sy, swap in (
+        (1, 1, False),
+        (-1, 1, False),
+        (1, -1, False),
+        (-1, -1, False),
+        (1, 1, True),
+        (-1, 1, True),
+        (1, -1, True),
+        (-1, -1, True),
+    ):
+        (lo, hi, o, s), (ylo, yhi, q, t) = (
+            ((by0, by1, y0, sy), (bx0, bx1, x0, sx))
+            if swap
+            else ((bx0, bx1, x0, sx), (by0, by1, y0, sy))
+        )
+        k0, k1 = (lo - o, hi - o) if s > 0 else (o - hi, o - lo)
+        j0, j1 = (ylo - q, yhi - q) if t > 0 else (q - yhi, q - ylo)
+        k0 = max(k0, _first(1, r + 1, lambda x: _circle_y(r, x) <= j1))
+        k1 = min(k1, _first(1, r + 1, lambda x: _circle_y(r, x) < j0) - 1)
+        if k0 <= k1:
+            # Be lenient, the exact points are checked anyway.
+            ranges.append((k0 - 1, k1 + 1))
+
+    start, stop = r + 1, -1
+    for lo, hi in sorted(ranges):
+        if lo > stop:
+            yield from _circle_steps(c, r, box, start, stop)
+            start = lo
+        stop = max(stop, hi)
+    yield from _circle_steps(c, r, box, start, stop)
+
+
+def _circle_steps(c: Point, r: int, box: Box, start: int, stop: int) -> Iterable[Point]:
+    x0, y0 = c
+    # Jump right in front of the first step, see _circle_y for why.
+    x = max(start - 1, 0)
+    y = _circle_y(r, x)
+    f, ddFx, ddFy = (x + 1) ** 2 + y * y - y - r * r, 2 * x, -2 * y
+
+    while x < y and x < stop:
+        if f >= 0:
+            y -= 1
+            ddFy += 2
+            f += ddFy
+        x += 1
+        ddFx += 2
+        f += ddFx + 1
+
+        if x >= start:
+            yield from (
+                p
+                for p in (
+                    (x0 + x, y0 + y),
+                    (x0 - x, y0 + y),
+                    (x0 + x, y0 - y),
+                    (x0 - x, y0 - y),
+                    (x0 + y, y0 + x),
+                    (x0 - y, y0 + x),
+                    (x0 + y, y0 - x),
+                    (x0 - y, y0 - x),
+                )
+                if _inside(box, p)
+            )
+
+
+def bresenham_ellipse(
+    c: Point, r1: int, r2: int, box: Optional[Box] = None
+) -> Iterable[Point]:
     """Bresenham's ellipse drawing algorithm.
 
+    If a clipping box is given, only the pixels of the ellipse within it are
+    generated. Quadrants outside of the box are skipped entirely and tracing
+    stops once the others moved past it.
+
     :param c: x coordinate of the ellipse's center
     :type c: Point
     :param r1: horizontal radius of the ellipse
     :type r1: int
     :param r2: vertical radius of the ellipse
     :type r2: int
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
     :yield: points on the ellipse
     :rtype: Point
     """
+    clip = _overlap(c[0] - r1, c[1] - r2, c[0] + r1, c[1] + r2, box)
+    if clip is None:
+        return
+    elif r1 == r2 == 0:
+        # The error term would never change for a single point.
+        yield c
+        return
+    elif clip:
+        yield from _clipped_ellipse(c, r1, r2, cast(Box, box))
+        return
+
     x0, y0 = c
     dx, dy = 0, r2
     r12, r22 = r1 * r1, r2 * r2
@@ -129,3 +654,434 @@ def bresenham_ellipse(c: Point, r1: int, r2: int) -> Iterable[Point]:
     while dx < r1:
         dx += 1
         yield from ((x0 + dx, y0), (x0 - dx, y0))
+
+
+@lru_cache(maxsize=64)
+def ellipse_size(r1: int, r2: int) -> int:
+    """Count the pixels of an ellipse, see :func:`bresenham_ellipse`, without clipping.
+
+    :param r1: horizontal radius of the ellipse
+    :type r1: int
+    :param r2: vertical radius of the ellipse
+    :type r2: int
+    :return: amount of pixels, including the ones generated twice
+    :rtype: int
+    """
+    if r1 == r2 == 0:
+        return 1
+    dx, dy, size = 0, r2, 0
+    r12, r22 = r1 * r1, r2 * r2
+    err = r22 - (2 * r2 - 1) * r12
+    while dy >= 0:
+        size += 4
+        e2 = 2 * err
+        if e2 < (2 * dx + 1) * r22:
+            dx += 1
+            err += (2 * dx + 1) * r22
+        if e2 > -(2 * dy + 1) * r12:
+            dy -= 1
+            err -= (2 * dy - 1) * r12
+    return size + 2 * max(0, r1 - dx)
+
+
+def _clipped_ellipse(c: Point, r1: int, r2: int, box: Box) -> Iterable[Point]:
+    x0, y0 = c
+    by0, by1 = box[1], box[3]
+    # Signs of the quadrants that are at least partially visible.
+    quadrants = [
+        (sx, sy)
+        for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1))
+        if _overlap(
+            min(x0, x0 + sx * r1),
+            min(y0, y0 + sy * r2),
+            max(x0, x0 + sx * r1),
+            max(y0, y0 + sy * r2),
+            box,
+        )
+        is not None
+    ]
+    dx, dy = 0, r2
+    r12, r22 = r1 * r1, r2 * r2
+    err = r22 - (2 * r2 - 1) * r12
+
+    while 1:
+        for sx, sy in quadrants:
+            p = (x0 + sx * dx, y0 + sy * dy)
+            if _inside(box, p):
+                yield p
+        # The rows only move towards the center, stop once all of them passed
+        # the box.
+        if all(y0 + dy < by0 if sy > 0 else y0 - dy > by1 for _, sy in quadrants):
+            return
+
+        e2 = 2 * err
+        if e2 < (2 * dx + 1) * r22:
+            dx += 1
+            err += (2 * dx + 1) * r22
+        if e2 > -(2 * dy + 1) * r12:
+            dy -= 1
+            err -= (2 * dy - 1) * r12
+
+        if dy < 0:
+            break
+
+    while dx < r1:
+        dx += 1
+        for p in ((x0 + dx, y0), (x0 - dx, y0)):
+            if _inside(box, p):
+                yield p
+
+
+def scanline_polygon(ps: Sequence[Point], box: Optional[Box] = None) -> Iterable[Span]:
+    """Scanline polygon filling algorithm using an active edge table.
+
+    The interior is determined by the even-odd rule. Each edge covers the rows
+    from its upper end up to, but excluding, its lower end, so the outline of
+    the polygon is not necessarily covered completely.
+
+    If a clipping box is given, only the rows within it are scanned and the
+    spans are cut to it.
+
+    :param ps: in order points of the polygon
+    :type ps: Sequence[Point]
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
+    :yield: horizontal spans filling the polygon, top to bottom
+    :rtype: Span
+    """
+    # Edge table of non-horizontal edges as (y_top, y_bottom, x_top * dy, dx,
+    # dy), sorted by their upper end.
+    edges = sorted(
+        (
+            (y0, y1, x0 * (y1 - y0), x1 - x0, y1 - y0)
+            if y0 < y1
+            else (y1, y0, x1 * (y0 - y1), x0 - x1, y0 - y1)
+        )
+        for (x0, y0), (x1, y1) in zip(ps, [ps[-1], *ps[:-1]])
+        if y0 != y1
+    )
+    bx0, by0, bx1, by1 = -inf, -inf, inf, inf
+    if box is not None:
+        bx0, by0, bx1, by1 = box
+        # Start the edges crossing the top of the box right at it.
+        edges = [
+            (by0, y1, n + dx * (by0 - y0), dx, dy) if y0 < by0 else (y0, y1, n, dx, dy)
+            for y0, y1, n, dx, dy in edges
+            if y1 > by0 and y0 <= by1
+        ]
+        edges.sort()
+    # Active edges as [y_bottom, x * dy, dx, dy], which keeps x exact.
+    active: List[List[int]] = []
+    i, y = 0, 0
+    while i < len(edges) or active:
+        if not active:
+            y = edges[i][0]
+        if y > by1:
+            break
+        while i < len(edges) and edges[i][0] == y:
+            _, y1, n, dx, dy = edges[i]
+            active.append([y1, n, dx, dy])
+            i += 1
+        active = [edge for edge in active if edge[0] > y]
+        active.sort(key=lambda edge: edge[1] / edge[3])
+        for (_, n0, _, d0), (_, n1, _, d1) in zip(active[::2], active[1::2]):
+            x0, x1 = max(-(-n0 // d0), bx0), min(n1 // d1, bx1)
+            if x0 <= x1:
+                yield (y, int(x0), int(x1))
+        for edge in active:
+            edge[1] += edge[2]
+        y += 1
+
+
+def _outline_spans(ps: Iterable[Point], box: Optional[Box]) -> Iterable[Span]:
+    """Get the spans between the outermost points of every row, cut to a box."""
+    extents: Dict[int, Tuple[int, int]] = {}
+    for x, y in ps:
+        x0, x1 = extents.get(y, (x, x))
+        extents[y] = (min(x0, x), max(x1, x))
+    for y in sorted(extents):
+        x0, x1 = extents[y]
+        if box is not None:
+            x0, x1 = max(x0, box[0]), min(x1, box[2])
+        if x0 <= x1:
+            yield (y, x0, x1)
+
+
+def scanline_circle(c: Point, r: int, box: Optional[Box] = None) -> Iterable[Span]:
+    """Scanline circle filling algorithm.
+
+    The spans cover exactly the rows and extents of the circle drawn by
+    :func:`bresenham_circle`. If a clipping box is given, only the outline
+    within its rows is traced and the spans are cut to it.
+
+    :param c: coordinates of the circle's center
+    :type c: Point
+    :param r: radius of the circle
+    :type r: int
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
+    :yield: horizontal spans filling the circle, top to bottom
+    :rtype: Span
+    """
+    # The rows are traced across the whole width, so their extents are exact.
+    rows = None if box is None else (c[0] - r, box[1], c[0] + r, box[3])
+    yield from _outline_spans(bresenham_circle(c, r, rows), box)
+
+
+@lru_cache(maxsize=64)
+def circle_span_offsets(r: int) -> Tuple[Span, ...]:
+    """Get the spans filling a circle around the origin, see :func:`scanline_circle`.
+
+    :param r: radius of the circle
+    :type r: int
+    :return: horizontal spans filling the circle, top to bottom
+    :rtype: Tuple[Span, ...]
+    """
+    return tuple(scanline_circle((0, 0), r))
+
+
+def scanline_ellipse(
+    c: Point, r1: int, r2: int, box: Optional[Box] = None
+) -> Iterable[Span]:
+    """Scanline ellipse filling algorithm.
+
+    The spans cover exactly the rows and extents of the ellipse drawn by
+    :func:`bresenham_ellipse`. If a clipping box is given, only the outline
+    within its rows is traced and the spans are cut to it.
+
+    :param c: x coordinate of the ellipse's center
+    :type c: Point
+    :param r1: horizontal radius of the ellipse
+    :type r1: int
+    :param r2: vertical radius of the ellipse
+    :type r2: int
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box]
+    :yield: horizontal spans filling the ellipse, top to bottom
+    :rtype: Span
+    """
+    rows = None if box is None else (c[0] - r1, box[1], c[0] + r1, box[3])
+    yield from _outline_spans(bresenham_ellipse(c, r1, r2, rows), box)
+
+
+def threshold_dither(rows: Iterable[bytes], threshold: int = 128) -> Iterable[bytes]:
+    """Turn rows of luminance values into dots by a fixed threshold.
+
+    :param rows: rows of luminance values (0-255)
+    :type rows: Iterable[bytes]
+    :param threshold: luminance at which a pixel becomes a dot, defaults to 128
+    :type threshold: int, optional
+    :yield: rows of dots, as one byte (0 or 1) per pixel
+    :rtype: bytes
+    """
+    table = bytes(v >= threshold for v in range(256))
+    for row in rows:
+        yield row.translate(table)
+
+
+# Ordered dithering matrix, see https://en.wikipedia.org/wiki/Ordered_dithering
+BAYER_4X4 = ((0, 8, 2, 10), (12, 4, 14, 6), (3, 11, 1, 9), (15, 7, 13, 5))
+
+
+def bayer_dither(rows: Iterable[bytes]) -> Iterable[bytes]:
+    """Turn rows of luminance values into dots by ordered (Bayer) dithering.
+
+    :param rows: rows of luminance values (0-255)
+    :type rows: Iterable[bytes]
+    :yield: rows of dots, as one byte (0 or 1) per pixel
+    :rtype: bytes
+    """
+    # One translation table per threshold, applied to every fourth pixel.
+    tables = [
+        [bytes(v >= 8 + 16 * t for v in range(256)) for t in line] for line in BAYER_4X4
+    ]
+    for y, row in enumerate(rows):
+        dots = bytearray(len(row))
+        for x, table in enumerate(tables[y % 4]):
+            dots[x::4] = row[x::4].translate(table)
+        yield bytes(dots)
+
+
+def floyd_steinberg_dither(
+    rows: Iterable[bytes], threshold: int = 128
+) -> Iterable[bytes]:
+    """Turn rows of luminance values into dots by Floyd-Steinberg dithering.
+
+    Only the error of the current and the next row is kept at any time.
+
+    :param rows: rows of luminance values (0-255)
+    :type rows: Iterable[bytes]
+    :param threshold: luminance at which a pixel becomes a dot, defaults to 128
+    :type threshold: int, optional
+    :yield: rows of dots, as one byte (0 or 1) per pixel
+    :rtype: bytes
+    """
+    errors: List[int] = []
+    for row in rows:
+        w = len(row)
+        # Errors are kept in sixteenths, padded by one on each side.
+        errors, below = errors or [0] * (w + 2), [0] * (w + 2)
+        dots = bytearray(w)
+        for x, v in enumerate(row, 1):
+            v += errors[x] // 16
+            if v >= threshold:
+                dots[x - 1] = 1
+                v -= 255
+            errors[x + 1] += 7 * v
+            below[x - 1] += 3 * v
+            below[x] += 5 * v
+            below[x + 1] += v
+        errors = below
+        yield bytes(dots)
+
+
+def minmax_downsample(ys: Sequence[float], width: int) -> Iterable[Tuple[float, float]]:
+    """Reduce a series of values to the range of the values of every column.
+
+    The values are spread evenly across the columns, so there should be at
+    least as many values as columns. Each column also includes the last value
+    of the previous one, such that the ranges of neighbouring columns connect.
+    NumPy arrays are reduced in a vectorized manner.
+
+    :param ys: the values, any sequence supporting slicing
+    :type ys: Sequence[float]
+    :param width: amount of columns
+    :type width: int
+    :yield: minimum and maximum value of each column
+    :rtype: Tuple[float, float]
+    """
+    n = len(ys)
+    bounds = [c * n // width for c in range(width + 1)]
+    if hasattr(ys, "dtype"):
+        import numpy as np
+
+        starts = bounds[:-1]
+        prev = np.asarray(ys)[[max(b - 1, 0) for b in starts]]
+        yield from zip(
+            np.minimum(np.minimum.reduceat(ys, starts), prev).tolist(),
+            np.maximum(np.maximum.reduceat(ys, starts), prev).tolist(),
+        )
+        return
+    for start, stop in zip(bounds, bounds[1:]):
+        column = ys[max(start - 1, 0) : stop]
+        yield min(column), max(column)
+
+
+def iminmax_downsample(
+    ys: Iterable[float], n: int, width: int
+) -> Iterable[Tuple[float, float]]:
+    """Reduce a series of values to the range of the values of every column.
+
+    Same as :func:`minmax_downsample`, but consumes the values from an
+    iterator, keeping only the values of a single column around at a time.
+
+    :param ys: the values
+    :type ys: Iterable[float]
+    :param n: amount of values
+    :type n: int
+    :param width: amount of columns
+    :type width: int
+    :yield: minimum and maximum value of each column
+    :rtype: Tuple[float, float]
+    """
+    it, last = iter(ys), None
+    for c in range(width):
+        column = list(islice(it, (c + 1) * n // width - c * n // width))
+        if not column:
+            return
+        prev, last = last, column[-1]
+        if prev is not None:
+            column.append(prev)
+        yield min(column), max(column)
+
+
+def wu_line(
+    p0: Tuple[float, float], p1: Tuple[float, float], box: Optional[Box] = None
+) -> Iterable[Tuple[int, int, float]]:
+    """Xiaolin Wu's anti-aliased line drawing algorithm.
+
+    If a clipping box is given, only the pixels of the line within it are
+    generated, without stepping through the parts outside of it.
+
+    :param p0: start point, may lie between pixels
+    :type p0: Tuple[float, float]
+    :param p1: end point, may lie between pixels
+    :type p1: Tuple[float, float]
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box], optional
+    :yield: pixel positions and how much of them the line covers (0-1)
+    :rtype: Tuple[int, int, float]
+    """
+    (x0, y0), (x1, y1) = p0, p1
+    steep = abs(y1 - y0) > abs(x1 - x0)
+    if steep:
+        # Step along y instead, by working on the transposed line.
+        x0, y0, x1, y1 = y0, x0, y1, x1
+        box = box and (box[1], box[0], box[3], box[2])
+    if x0 > x1:
+        x0, y0, x1, y1 = x1, y1, x0, y0
+    gradient = (y1 - y0) / (x1 - x0) if x1 != x0 else 1.0
+    xa, xb = floor(x0 + 0.5), floor(x1 + 0.5)
+    ya, yb = y0 + gradient * (xa - x0), y1 + gradient * (xb - x1)
+    lo, hi = (box[0], box[2]) if box else (xa, xb)
+    # The pixels of the end points are only partially covered.
+    steps = chain(
+        ((xa, ya, 0.5 - x0 + xa), (xb, yb, 0.5 + x1 - xb)),
+        (
+            (x, ya + gradient * (x - xa), 1.0)
+            for x in range(max(xa + 1, lo), min(xb - 1, hi) + 1)
+        ),
+    )
+    for x, y, gap in steps:
+        if not lo <= x <= hi:
+            continue
+        iy = floor(y)
+        for py, coverage in ((iy, (1 - y + iy) * gap), (iy + 1, (y - iy) * gap)):
+            if coverage > 0 and (box is None or box[1] <= py <= box[3]):
+                yield (py, x, coverage) if steep else (x, py, coverage)
+
+
+def wu_circle(
+    c: Point, r: float, box: Optional[Box] = None
+) -> Iterable[Tuple[int, int, float]]:
+    """Xiaolin Wu's anti-aliased circle drawing algorithm.
+
+    If a clipping box is given, only the pixels of the circle within it are
+    generated.
+
+    :param c: center point
+    :type c: Point
+    :param r: radius, may lie between pixels
+    :type r: float
+    :param box: clipping box, defaults to None
+    :type box: Optional[Box], optional
+    :yield: pixel positions and how much of them the circle covers (0-1)
+    :rtype: Tuple[int, int, float]
+    """
+    cx, cy = c
+    reach = floor(r) + 1
+    if (
+        box is not None
+        and _overlap(cx - reach, cy - reach, cx + reach, cy + reach, box) is None
+    ):
+        return
+    # Pixels on the borders between octants are generated more than once.
+    pixels: Dict[Point, float] = {}
+    for x in range(floor(r / sqrt(2)) + 1):
+        y = sqrt(r * r - x * x)
+        iy = floor(y)
+        for dx, dy, coverage in ((x, iy, 1 - y + iy), (x, iy + 1, y - iy)):
+            for p in (
+                (cx + dx, cy + dy),
+                (cx - dx, cy + dy),
+                (cx + dx, cy - dy),
+                (cx - dx, cy - dy),
+                (cx + dy, cy + dx),
+                (cx - dy, cy + dx),
+                (cx + dy, cy - dx),
+                (cx - dy, cy - dx),
+            ):
+                if coverage > pixels.get(p, 0) and (box is None or _inside(box, p)):
+                    pixels[p] = coverage
+    for (x, y), coverage in pixels.items():
+        yield x, y, coverage
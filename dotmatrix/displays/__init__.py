@@ -1,5 +1,14 @@
 from .block import Block
 from .braille import Braille
+from .color import ColorBraille
+from .shade import Shade
 from .unit import Unit
 
-__all__ = ("Braille", "Block", "Unit")
+__all__ = ["Braille", "Block", "Unit", "Shade", "ColorBraille"]
+
+try:
+    from .ndarray import NumpyBlock, NumpyBraille
+except ImportError:  # NumPy is an optional dependency.
+    pass
+else:
+    __all__ += ["NumpyBraille", "NumpyBlock"]
@@ -0,0 +1,85 @@
+from typing import Any, Callable, Dict, Optional
+
+from .._types import Box, Display, Point
+
+__all__ = ("OPS", "blit_box", "blit_pixels", "combine")
+
+
+# Ways of combining a pixel of the destination with one of the source.
+OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    "or": lambda dst, src: dst | src,
+    "and": lambda dst, src: dst & src,
+    "xor": lambda dst, src: dst ^ src,
+    "copy": lambda dst, src: src,
+}
+
+
+def blit_box(dst: Display, src: Display, at: Point, op: str) -> Optional[Box]:
+    """Find the pixels of the destination covered by the source.
+
+    :param dst: the display to draw onto
+    :type dst: Display
+    :param src: the display to draw
+    :type src: Display
+    :param at: position of the source's top left corner in the destination
+    :type at: Point
+    :param op: one of the keys of :data:`OPS`
+    :type op: str
+    :raises ValueError: unknown operation
+    :return: the covered pixels, or None if there are none
+    :rtype: Optional[Box]
+    """
+    if op not in OPS:
+        raise ValueError(f"Unknown blit operation: {op!r}")
+    ox, oy = at
+    x0, y0 = max(ox, 0), max(oy, 0)
+    x1, y1 = min(ox + src.width, dst.width) - 1, min(oy + src.height, dst.height) - 1
+    if x0 > x1 or y0 > y1:
+        return None
+    return x0, y0, x1, y1
+
+
+def blit_pixels(dst: Display, src: Display, at: Point, op: str):
+    """Combine the pixels of one display into another, one by one.
+
+    :param dst: the display to draw onto
+    :type dst: Display
+    :param src: the display to draw
+    :type src: Display
+    :param at: position of the source's top left corner in the destination
+    :type at: Point
+    :param op: one of the keys of :data:`OPS`
+    :type op: str
+    :raises ValueError: unknown operation
+    """
+    box = blit_box(dst, src, at, op)
+    if box is None:
+        return
+    (ox, oy), (x0, y0, x1, y1), combine_pixel = at, box, OPS[op]
+    for y in range(y0, y1 + 1):
+        for x in range(x0, x1 + 1):
+            dst[x, y] = combine_pixel(dst[x, y], src[x - ox, y - oy])
+
+
+def combine(dst: int, src: int, mask: int, op: str) -> int:
+    """Combine two bitsets within a mask.
+
+    :param dst: bits of the destination
+    :type dst: int
+    :param src: bits of the source
+    :type src: int
+    :param mask: bits to combine, the rest of the destination is kept as is
+    :type mask: int
+    :param op: one of the keys of :data:`OPS`
+    :type op: str
+    :return: the combined bits
+    :rtype: int
+    """
+    src &= mask
+    if op == "or":
+        return dst | src
+    if op == "and":
+        return dst & (src | ~mask)
+    if op == "xor":
+        return dst ^ src
+    return dst & ~mask | src
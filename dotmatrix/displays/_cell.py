@@ -0,0 +1,550 @@
+from array import array
+from collections import deque
+from io import TextIOBase
+from itertools import repeat
+from math import ceil
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .._types import USE_DEFAULT, Display, Point, Union, UseDefault
+from ._blit import blit_box, blit_pixels, combine
+
+__all__ = ("CellDisplay", "PlainCellDisplay")
+
+
+C = TypeVar("C", bound="CellDisplay")
+
+
+class CellDisplay:
+    """A matrix packing a small grid of pixels into every character.
+
+    Subclasses describe the layout of a single character cell via
+    :attr:`cell_width`, :attr:`cell_height` and :attr:`bit_pos`, and the
+    character of every possible cell value via :attr:`char_table`.
+    """
+
+    __slots__ = (
+        "width",
+        "_char_width",
+        "height",
+        "_char_height",
+        "default_brush",
+        "data",
+        "_shown",
+    )
+
+    # Size of a single character cell in pixels.
+    cell_width: ClassVar[int] = 2
+    cell_height: ClassVar[int] = 1
+    # Position of each bit in a character, in logical (row-major) order.
+    bit_pos: ClassVar[Sequence[int]] = (0, 1)
+    # Character(s) representing each possible cell value.
+    char_table: ClassVar[Sequence[str]] = ()
+    # Amount of terminal columns taken up by a single character cell.
+    cell_columns: ClassVar[int] = 1
+    # Bitmasks covering the rows dy0..dy1 and columns dx0..dx1 of a cell,
+    # indexed as _masks[dy0][dy1][dx0][dx1].
+    _masks: ClassVar[List[List[List[List[int]]]]]
+    # Bit of each pixel within a cell, indexed by dx | dy << _x_shift, as
+    # the cell sizes are powers of two.
+    _bits: ClassVar[List[int]]
+    _x_shift: ClassVar[int]
+    _y_shift: ClassVar[int]
+
+    def __init_subclass__(cls) -> None:
+        """Precompute the cell bitmasks of a concrete display."""
+        super().__init_subclass__()
+        cw, ch = cls.cell_width, cls.cell_height
+        cls._x_shift, cls._y_shift = cw.bit_length() - 1, ch.bit_length() - 1
+        cls._bits = [1 << cls.bit_pos[i] for i in range(cw * ch)]
+        cls._masks = [
+            [
+                [
+                    [
+                        sum(
+                            1 << cls.bit_pos[dx + dy * cw]
+                            for dy in range(dy0, dy1 + 1)
+                            for dx in range(dx0, dx1 + 1)
+                        )
+                        for dx1 in range(cw)
+                    ]
+                    for dx0 in range(cw)
+                ]
+                for dy1 in range(ch)
+            ]
+            for dy0 in range(ch)
+        ]
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+    ) -> None:
+        """Initialize a matrix object.
+
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        """
+        self.default_brush = USE_DEFAULT.resolve(default_brush, True)
+        self.width = width
+        self.height = height
+        self._char_width = ceil(width / self.cell_width)
+        self._char_height = ceil(height / self.cell_height)
+        # Use array of unsigned chars for easy data integrity.
+        self.data = array("B", bytes(self._char_height * self._char_width))
+        # Copy of the data as of the last diff render.
+        self._shown: Optional[bytes] = None
+
+    def render(self) -> str:
+        """Render the current matrix state.
+
+        :return: render result
+        :rtype: str
+        """
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        data, stride, char = self.data, self._char_width, self.char_table.__getitem__
+        for cy in range(self._char_height):
+            yield "".join(map(char, data[cy * stride : (cy + 1) * stride]))
+
+    def _encoded_lines(self) -> Iterator[Union[bytes, bytearray]]:
+        for line in self._lines():
+            yield line.encode()
+
+    def write_to(self, fp: IO[Any]):
+        """Write the current matrix state to a stream, one line at a time.
+
+        Writes the same as :meth:`render` returns, without materializing all
+        of it at once. Text streams (:class:`io.TextIOBase`) receive strings,
+        any other stream receives UTF-8 encoded bytes.
+
+        :param fp: the stream to write to
+        :type fp: IO[Any]
+        """
+        lines, newline = (
+            (self._lines(), "\n")
+            if isinstance(fp, TextIOBase)
+            else (self._encoded_lines(), b"\n")
+        )
+        for i, line in enumerate(lines):
+            if i:
+                fp.write(newline)
+            fp.write(line)
+
+    def render_diff(self, at: Point = (0, 0), *, full: bool = False) -> str:
+        """Render the changes since the last diff render.
+
+        Only the runs of characters that changed are rendered, each prefixed
+        with an ANSI escape sequence moving the cursor to its position.
+
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :param full: render everything, regardless of changes, defaults to False
+        :type full: bool, optional
+        :return: render result
+        :rtype: str
+        """
+        ox, oy = at
+        data, shown = memoryview(self.data), None if full else self._shown
+        stride, columns = self._char_width, self.cell_columns
+        out: List[str] = []
+        for cy in range(self._char_height):
+            row = cy * stride
+            if (
+                shown is not None
+                and data[row : row + stride] == shown[row : row + stride]
+            ):
+                continue
+            c, end = row, row + stride
+            while c < end:
+                if shown is not None and data[c] == shown[c]:
+                    c += 1
+                    continue
+                start = c
+                while c < end and (shown is None or data[c] != shown[c]):
+                    c += 1
+                out.append(
+                    f"\x1b[{oy + cy + 1};{ox + (start - row) * columns + 1}H"
+                    + "".join(map(self.char_table.__getitem__, data[start:c]))
+                )
+        self._shown = data.tobytes()
+        return "".join(out)
+
+    def copy(self: C) -> C:
+        """Create an independent copy of the display.
+
+        :return: the copy
+        :rtype: CellDisplay
+        """
+        new = type(self)(self.width, self.height, default_brush=self.default_brush)
+        # Even empty slice assignments fail on exported buffers.
+        if self.data:
+            new.data[:] = array("B", bytes(self.data))
+        return new
+
+    def blit(self, src: Display, at: Point = (0, 0), op: str = "or"):
+        """Combine the pixels of another display into this one.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped! If the
+        source has the same cell layout and is placed on a cell boundary, its
+        cells are combined a whole row at a time instead of pixel by pixel.
+
+        :param src: the display to draw
+        :type src: Display
+        :param at: position of the source's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: one of "or", "and", "xor" and "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+        box = blit_box(self, src, at, op)
+        if box is None:
+            return
+        cw, ch = self.cell_width, self.cell_height
+        (ox, oy), (x0, y0, x1, y1) = at, box
+        if (
+            not isinstance(src, CellDisplay)
+            or (src.cell_width, src.cell_height, src._bits) != (cw, ch, self._bits)
+            or ox % cw
+            or oy % ch
+        ):
+            blit_pixels(self, src, at, op)
+            return
+        data, stride, masks = self.data, self._char_width, self._masks
+        sdata, sstride = src.data, src._char_width
+        (cx0, cy0), (cx1, cy1) = (x0 // cw, y0 // ch), (x1 // cw, y1 // ch)
+        n = cx1 - cx0 + 1
+        # Only the covered pixels of the last cell row and column take part.
+        row_masks = [
+            int.from_bytes(
+                bytes([masks[0][dy1][0][cw - 1]]) * (n - 1)
+                + bytes([masks[0][dy1][0][x1 % cw]]),
+                "little",
+            )
+            for dy1 in (ch - 1, y1 % ch)
+        ]
+        for cy in range(cy0, cy1 + 1):
+            d = cy * stride + cx0
+            s = (cy - oy // ch) * sstride + cx0 - ox // cw
+            bits = combine(
+                int.from_bytes(bytes(data[d : d + n]), "little"),
+                int.from_bytes(bytes(sdata[s : s + n]), "little"),
+                row_masks[cy == cy1],
+                op,
+            )
+            data[d : d + n] = array("B", bits.to_bytes(n, "little"))
+
+    def scroll(self, dx: int, dy: int):
+        """Move all pixels by some offset, clearing the pixels left behind.
+
+        Pixels moved out of bounds are dropped. The whole data is moved at
+        once as an integer, one pixel position within a cell at a time.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+        if not self.data:
+            return
+        cw, ch, stride = self.cell_width, self.cell_height, self._char_width
+        rows, bits = self._char_height, self._bits
+        data = int.from_bytes(bytes(self.data), "little")
+        moved = 0
+        if not (-self.width < dx < self.width and -self.height < dy < self.height):
+            # Everything is moved out of bounds.
+            data = 0
+        for y in range(ch):
+            ky, ty = divmod(y + dy, ch)
+            for x in range(cw):
+                kx, tx = divmod(x + dx, cw)
+                # Only cells staying within their row take part.
+                start, stop = max(0, -kx), min(stride, stride - kx)
+                if start >= stop:
+                    continue
+                bit = bits[x | y << self._x_shift]
+                row = (
+                    bytes(start) + bytes([bit]) * (stop - start) + bytes(stride - stop)
+                )
+                plane = data & int.from_bytes(row * rows, "little")
+                shift = (
+                    bits[tx | ty << self._x_shift].bit_length() - bit.bit_length()
+                ) + 8 * (kx + ky * stride)
+                moved |= plane << shift if shift >= 0 else plane >> -shift
+        self.data[:] = array(
+            "B", (moved & self._pixel_mask()).to_bytes(len(self.data), "little")
+        )
+
+    def _pixel_mask(self) -> int:
+        """Get a bitmask of all the pixels within bounds, as an integer."""
+        if not (self.width and self.height):
+            return 0
+        cw, ch, stride = self.cell_width, self.cell_height, self._char_width
+        masks = self._masks
+        dx1, dy1 = (self.width - 1) % cw, (self.height - 1) % ch
+        row, last = (
+            bytes([masks[0][dy][0][cw - 1]]) * (stride - 1)
+            + bytes([masks[0][dy][0][dx1]])
+            for dy in (ch - 1, dy1)
+        )
+        return int.from_bytes(row * (self._char_height - 1) + last, "little")
+
+    def _pos_to_idx(self, x: int, y: int) -> Tuple[int, int]:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Out of bounds: {(x,y)}")
+        (cx, dx), (cy, dy) = divmod(x, self.cell_width), divmod(y, self.cell_height)
+        return cx + cy * self._char_width, self.bit_pos[dx + dy * self.cell_width]
+
+    def __getitem__(self, pos: Point) -> bool:
+        """Get the value of a pixel.
+
+        :param pos: position of pixel to get
+        :type pos: Point
+        :raises IndexError: requested pixel is out of the bounds of the matrix
+        :return: state of the pixel
+        :rtype: bool
+        """
+        c, i = self._pos_to_idx(*pos)
+        return bool(1 & self.data[c] >> i)
+
+    def __setitem__(self, pos: Point, val: bool):
+        """Set the value of a pixel.
+
+        :param pos: position of the pixel to set
+        :type pos: Point
+        :param val: the value to set the pixel to
+        :type val: bool
+        :raises IndexError: requested pixel is out of the bounds of the matrix
+        """
+        c, i = self._pos_to_idx(*pos)
+        self.data[c] ^= (-val ^ self.data[c]) & (1 << i)
+
+    def set_many(self, ps: Iterable[Point], val: bool):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param ps: positions of the pixels to set
+        :type ps: Iterable[Point]
+        :param val: the value to set the pixels to
+        :type val: bool
+        """
+        data, w, h, stride = self.data, self.width, self.height, self._char_width
+        xs, ys = self._x_shift, self._y_shift
+        xm, ym = self.cell_width - 1, self.cell_height - 1
+        if val:
+            bits = self._bits
+            for x, y in ps:
+                if 0 <= x < w and 0 <= y < h:
+                    data[(x >> xs) + (y >> ys) * stride] |= bits[
+                        x & xm | (y & ym) << xs
+                    ]
+        else:
+            bits = [0xFF ^ bit for bit in self._bits]
+            for x, y in ps:
+                if 0 <= x < w and 0 <= y < h:
+                    data[(x >> xs) + (y >> ys) * stride] &= bits[
+                        x & xm | (y & ym) << xs
+                    ]
+
+    def set_row(self, y: int, row: bytes):
+        """Set the values of a whole row of pixels at once.
+
+        The cells are updated from translated copies of the row, merged as
+        integers, without going through the pixels one by one.
+
+        :param y: y coordinate of the row
+        :type y: int
+        :param row: one byte per pixel, nonzero meaning set
+        :type row: bytes
+        :raises IndexError: the row is out of bounds or of the wrong length
+        """
+        if not (0 <= y < self.height and len(row) == self.width):
+            raise IndexError(f"Out of bounds: row {y} of length {len(row)}")
+        cw, stride = self.cell_width, self._char_width
+        cy, dy = divmod(y, self.cell_height)
+        start = cy * stride
+        # Pixels of the row within each cell, merged across columns.
+        bits = 0
+        for dx in range(cw):
+            bit = self._bits[dx | dy << self._x_shift]
+            column = row[dx::cw].translate(bytes([0]) + bytes([bit]) * 255)
+            bits |= int.from_bytes(column.ljust(stride, b"\0"), "little")
+        mask = self._masks[dy][dy][0][cw - 1]
+        cells = int.from_bytes(bytes(self.data[start : start + stride]), "little")
+        cells &= ~int.from_bytes(bytes([mask]) * stride, "little")
+        self.data[start : start + stride] = array(
+            "B", (cells | bits).to_bytes(stride, "little")
+        )
+
+    def fill_span(self, y: int, x0: int, x1: int, val: bool):
+        """Set the value of a horizontal run of pixels.
+
+        :param y: y coordinate of the run
+        :type y: int
+        :param x0: x coordinate of the first pixel of the run
+        :type x0: int
+        :param x1: x coordinate of the last pixel of the run (inclusive)
+        :type x1: int
+        :param val: the value to set the pixels to
+        :type val: bool
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        self.fill_rect(x0, y, x1, y, val)
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, val: bool):
+        """Set the value of an axis aligned rectangle of pixels.
+
+        Whole character cells are updated with a single bitmask each, instead
+        of going through every pixel individually.
+
+        :param x0: x coordinate of the top left corner
+        :type x0: int
+        :param y0: y coordinate of the top left corner
+        :type y0: int
+        :param x1: x coordinate of the bottom right corner (inclusive)
+        :type x1: int
+        :param y1: y coordinate of the bottom right corner (inclusive)
+        :type y1: int
+        :param val: the value to set the pixels to
+        :type val: bool
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        if not (0 <= x0 <= x1 < self.width and 0 <= y0 <= y1 < self.height):
+            raise IndexError(f"Out of bounds: {(x0, y0)}, {(x1, y1)}")
+        cw, ch = self.cell_width, self.cell_height
+        (cx0, dx0), (cx1, dx1) = divmod(x0, cw), divmod(x1, cw)
+        (cy0, dy0), (cy1, dy1) = divmod(y0, ch), divmod(y1, ch)
+        data, stride, masks = self.data, self._char_width, self._masks
+        full = masks[0][ch - 1][0][cw - 1]
+        for cy in range(cy0, cy1 + 1):
+            rows = masks[dy0 if cy == cy0 else 0][dy1 if cy == cy1 else ch - 1]
+            row = cy * stride
+            if cx0 == cx1:
+                runs = [(row + cx0, row + cx0 + 1, rows[dx0][dx1])]
+            else:
+                runs = [
+                    (row + cx0, row + cx0 + 1, rows[dx0][cw - 1]),
+                    (row + cx0 + 1, row + cx1, rows[0][cw - 1]),
+                    (row + cx1, row + cx1 + 1, rows[0][dx1]),
+                ]
+            for start, stop, mask in runs:
+                if start == stop:
+                    # Even empty slice assignments fail on exported buffers.
+                    continue
+                if mask == full:
+                    # Whole cells are simply overwritten.
+                    data[start:stop] = array("B", [mask if val else 0]) * (stop - start)
+                elif val:
+                    for c in range(start, stop):
+                        data[c] |= mask
+                else:
+                    mask ^= 0xFF
+                    for c in range(start, stop):
+                        data[c] &= mask
+
+
+P = TypeVar("P", bound="PlainCellDisplay")
+
+
+class PlainCellDisplay(CellDisplay):
+    """A cell display whose state is nothing but its cells, a byte each.
+
+    Such displays can be put on top of existing buffers, e.g. to load them
+    from a file, and set pixels given by their indices in bulk.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_buffer(
+        cls: Type[P],
+        buf: Any,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+    ) -> P:
+        """Create a display on top of an existing buffer, without copying it.
+
+        :param buf: bytes like object holding the cells in row-major order,
+            one byte each, read-only buffers giving read-only displays
+        :type buf: Any
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :raises ValueError: the size of the buffer doesn't match the dimensions
+        :return: the display
+        :rtype: PlainCellDisplay
+        """
+        new = cls(0, 0, default_brush=default_brush)
+        new.width, new.height = width, height
+        new._char_width = ceil(width / cls.cell_width)
+        new._char_height = ceil(height / cls.cell_height)
+        data = memoryview(buf).cast("B")
+        if len(data) != new._char_width * new._char_height:
+            raise ValueError(
+                f"Expected {new._char_width * new._char_height} bytes for a "
+                f"{width}x{height} {cls.__name__} display, got {len(data)}."
+            )
+        new.data = data  # type: ignore
+        return new
+
+    def set_flat(self, indices: Iterable[int], val: bool):
+        """Set the value of many pixels at once, given by their indices.
+
+        The pixels are first scattered into a byte per pixel layer, without
+        running any bytecode per pixel, which is then merged into the cells a
+        row of cells at a time, like :meth:`set_row` does.
+
+        :param indices: row-major indices of the pixels to set, i.e.
+            x + y * width, which must all be within bounds
+        :type indices: Iterable[int]
+        :param val: the value to set the pixels to
+        :type val: bool
+        """
+        w, cw, ch, stride = (
+            self.width,
+            self.cell_width,
+            self.cell_height,
+            self._char_width,
+        )
+        layer = bytearray(w * self.height)
+        deque(map(layer.__setitem__, indices, repeat(1)), maxlen=0)
+        for cy in range(self._char_height):
+            rows = layer[cy * ch * w : (cy + 1) * ch * w]
+            if 1 not in rows:
+                continue
+            bits = 0
+            for i in range(0, len(rows), w):
+                dy = i // w
+                for dx in range(cw):
+                    bit = self._bits[dx | dy << self._x_shift]
+                    column = rows[i + dx : i + w : cw].translate(
+                        b"\0" + bytes([bit]) * 255
+                    )
+                    bits |= int.from_bytes(column, "little")
+            start = cy * stride
+            cells = int.from_bytes(bytes(self.data[start : start + stride]), "little")
+            cells = cells | bits if val else cells & ~bits
+            self.data[start : start + stride] = array(
+                "B", cells.to_bytes(stride, "little")
+            )
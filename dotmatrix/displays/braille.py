@@ -1,91 +1,41 @@
-from array import array
-from math import ceil
-from typing import List
+from typing import Iterator, Union
 
-from .._types import USE_DEFAULT, Point, Union, UseDefault
+from ._cell import CellDisplay, PlainCellDisplay
 
 __all__ = ("Braille",)
 
 
 # Position of each bit in braille character, in logical order...
 BIT_POS = [0, 3, 1, 4, 2, 5, 6, 7]
+# Braille character for each possible cell value.
+CHARS = tuple(chr(0x2800 | byte) for byte in range(256))
+# Translation tables for the second and third byte of the UTF-8 encoding of a
+# braille character, the first one is always 0xE2.
+UTF8_HI = bytes(0xA0 | byte >> 6 for byte in range(256))
+UTF8_LO = bytes(0x80 | byte & 0x3F for byte in range(256))
 
 
-class Braille:
-    """A matrix made up of braile dots."""
-
-    __slots__ = (
-        "width",
-        "_char_width",
-        "height",
-        "_char_height",
-        "default_brush",
-        "data",
-    )
-
-    def __init__(
-        self,
-        width: int,
-        height: int,
-        *,
-        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
-    ) -> None:
-        """Initialize a matrix object.
+class BrailleCells(CellDisplay):
+    """The layout and rendering of braille character cells."""
 
-        :param width: width of the matrix
-        :type width: int
-        :param height: height of the matrix
-        :type height: int
-        """
-        self.default_brush = USE_DEFAULT.resolve(default_brush, True)
-        self.width = width
-        self.height = height
-        self._char_width = ceil(width / 2)
-        self._char_height = ceil(height / 4)
-        # Use array of unsigned chars for easy data integrity.
-        self.data = array("B", [0 for _ in range(self._char_height * self._char_width)])
+    __slots__ = ()
 
-    def render(self) -> str:
-        """Render the current matrix state.
+    cell_width = 2
+    cell_height = 4
+    bit_pos = BIT_POS
+    char_table = CHARS
 
-        :return: render result
-        :rtype: str
-        """
-        chars = (chr(0x2800 | byte) for byte in self.data)
-        lines: List[str] = []
-        for _ in range(self._char_height):
-            line = ""
-            for _ in range(self._char_width):
-                line += next(chars)
-            lines.append(line)
-        return "\n".join(lines)
+    def _encoded_lines(self) -> Iterator[Union[bytes, bytearray]]:
+        data, stride = self.data, self._char_width
+        # One buffer reused for every line, only the varying bytes are updated.
+        buf = bytearray(b"\xe2\xa0\x80" * stride)
+        for cy in range(self._char_height):
+            row = bytes(data[cy * stride : (cy + 1) * stride])
+            buf[1::3], buf[2::3] = row.translate(UTF8_HI), row.translate(UTF8_LO)
+            yield buf
 
-    def _pos_to_idx(self, x: int, y: int) -> tuple[int, int]:
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            raise IndexError(f"Out of bounds: {(x,y)}")
-        (cx, dx), (cy, dy) = divmod(x, 2), divmod(y, 4)
-        return cx + cy * self._char_width, BIT_POS[dx + dy * 2]
 
-    def __getitem__(self, pos: Point) -> bool:
-        """Get the value of a pixel.
-
-        :param pos: position of pixel to get
-        :type pos: Point
-        :raises IndexError: requested pixel is out of the bounds of the matrix
-        :return: state of the pixel
-        :rtype: bool
-        """
-        c, i = self._pos_to_idx(*pos)
-        return bool(1 & self.data[c] >> i)
-
-    def __setitem__(self, pos: Point, val: bool):
-        """Set the value of a pixel.
+class Braille(BrailleCells, PlainCellDisplay):
+    """A matrix made up of braile dots."""
 
-        :param pos: position of the pixel to set
-        :type pos: Point
-        :param val: the value to set the pixel to
-        :type val: bool
-        :raises IndexError: requested pixel is out of the bounds of the matrix
-        """
-        c, i = self._pos_to_idx(*pos)
-        self.data[c] ^= (-val ^ self.data[c]) & (1 << i)
+    __slots__ = ()
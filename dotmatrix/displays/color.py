@@ -0,0 +1,390 @@
+from array import array
+from typing import (
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .._types import USE_DEFAULT, Display, Point, UseDefault
+from ._blit import blit_box
+from ._cell import CellDisplay
+from .braille import BIT_POS, CHARS, Braille, BrailleCells
+
+__all__ = ("ColorBraille",)
+
+
+# Either the terminal's default color, one of the 256 ANSI colors (the first
+# 16 being the standard ones) or a RGB triple.
+Color = Union[None, int, Tuple[int, int, int]]
+
+# The 16 standard ANSI colors.
+ANSI_16: Tuple[Color, ...] = tuple(range(16))
+# Escape sequence selecting the terminal's default foreground color.
+DEFAULT = "\x1b[39m"
+# Logical position of the first dot of every braille character.
+FIRST = [
+    next(((i % 2, i // 2) for i, bit in enumerate(BIT_POS) if byte >> bit & 1), (0, 0))
+    for byte in range(256)
+]
+
+
+def _sgr(color: Color) -> str:
+    """Get the escape sequence selecting a foreground color."""
+    if color is None:
+        return DEFAULT
+    if isinstance(color, tuple):
+        return "\x1b[38;2;{};{};{}m".format(*color)
+    if color < 8:
+        return f"\x1b[{30 + color}m"
+    if color < 16:
+        return f"\x1b[{82 + color}m"
+    return f"\x1b[38;5;{color}m"
+
+
+C = TypeVar("C", bound="ColorBraille")
+
+
+class ColorBraille(BrailleCells):
+    """A matrix made up of colored braille dots.
+
+    Every character cell has a single foreground color, an index into the
+    palette, stored alongside its dots. Setting a pixel to a palette index
+    sets it in that color, True uses the current :attr:`color` instead and
+    False clears it. When rendering, escape sequences are only emitted where
+    the color actually changes, cells without dots never causing a change.
+    """
+
+    __slots__ = ("colors", "palette", "color", "_codes")
+
+    # Display holding just the dots of this one, e.g. for blitting sprites.
+    _dots_kind: ClassVar[Type[Braille]] = Braille
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+        palette: Sequence[Color] = ANSI_16,
+        color: Optional[int] = None,
+    ) -> None:
+        """Initialize a matrix object.
+
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :param palette: the colors to use, defaults to the 16 standard ANSI
+            colors
+        :type palette: Sequence[Color], optional
+        :param color: palette index used for pixels set to True, defaults to
+            None, i.e. the terminal's default color
+        :type color: Optional[int], optional
+        :raises ValueError: more than 255 colors in the palette
+        """
+        if len(palette) > 255:
+            raise ValueError("Palettes are limited to 255 colors.")
+        super().__init__(width, height, default_brush=default_brush)
+        self.palette = palette
+        self.color = color
+        # Escape sequence of each color code, code 0 being the default color
+        # and code i + 1 the i-th color of the palette.
+        self._codes = [DEFAULT, *map(_sgr, palette)]
+        self.colors = array("B", bytes(len(self.data)))
+
+    def _paint(self, val: Union[bool, int]) -> Optional[int]:
+        """Get the color code of a value, None meaning the pixel is cleared."""
+        if isinstance(val, bool):
+            if not val:
+                return None
+            return 0 if self.color is None else self.color + 1
+        if not 0 <= val < 255:
+            raise ValueError(f"Palette index out of range: {val}")
+        return val + 1
+
+    def _colored(self, start: int, stop: int, current: int) -> Tuple[str, int]:
+        """Render the cells start..stop, switching colors where needed.
+
+        :return: render result and the color code selected afterwards
+        """
+        cells, colors = self.data[start:stop], self.colors[start:stop]
+        text = "".join(map(CHARS.__getitem__, cells))
+        if colors.count(current) == stop - start:
+            return text, current
+        parts: List[str] = []
+        last = 0
+        for i, (cell, color) in enumerate(zip(cells, colors)):
+            if cell and color != current:
+                parts += text[last:i], self._codes[color]
+                last, current = i, color
+        parts.append(text[last:])
+        return "".join(parts), current
+
+    def _lines(self) -> Iterator[str]:
+        stride, rows, current = self._char_width, self._char_height, 0
+        for cy in range(rows):
+            line, current = self._colored(cy * stride, (cy + 1) * stride, current)
+            yield line + DEFAULT if current and cy == rows - 1 else line
+
+    def _encoded_lines(self) -> Iterator[Union[bytes, bytearray]]:
+        for line in self._lines():
+            yield line.encode()
+
+    def render_diff(self, at: Point = (0, 0), *, full: bool = False) -> str:
+        """Render the changes since the last diff render.
+
+        Only the runs of characters that changed, in dots or color, are
+        rendered, each prefixed with an ANSI escape sequence moving the cursor
+        to its position.
+
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :param full: render everything, regardless of changes, defaults to False
+        :type full: bool, optional
+        :return: render result
+        :rtype: str
+        """
+        ox, oy = at
+        n, stride = len(self.data), self._char_width
+        # The snapshot holds the dots followed by the colors.
+        now = memoryview(bytes(self.data) + bytes(self.colors))
+        shown = None if full or self._shown is None else memoryview(self._shown)
+        out: List[str] = []
+        current = 0
+
+        def same(c: int) -> bool:
+            return (
+                shown is not None and now[c] == shown[c] and now[n + c] == shown[n + c]
+            )
+
+        for cy in range(self._char_height):
+            row, end = cy * stride, (cy + 1) * stride
+            if (
+                shown is not None
+                and now[row:end] == shown[row:end]
+                and now[n + row : n + end] == shown[n + row : n + end]
+            ):
+                continue
+            c = row
+            while c < end:
+                if same(c):
+                    c += 1
+                    continue
+                start = c
+                while c < end and not same(c):
+                    c += 1
+                text, current = self._colored(start, c, current)
+                out.append(f"\x1b[{oy + cy + 1};{ox + start - row + 1}H{text}")
+        if current:
+            out.append(DEFAULT)
+        self._shown = now.tobytes()
+        return "".join(out)
+
+    def copy(self: C) -> C:
+        """Create an independent copy of the display.
+
+        :return: the copy
+        :rtype: ColorBraille
+        """
+        new = super().copy()
+        new.palette, new.color, new._codes = self.palette, self.color, self._codes
+        new.colors[:] = array("B", bytes(self.colors))
+        return new
+
+    def _recolor(
+        self,
+        cells: Iterable[int],
+        old: Sequence[int],
+        source: Callable[[int, int], int],
+    ):
+        """Color cells by the source of the first of their newly set dots."""
+        data, colors, stride = self.data, self.colors, self._char_width
+        for c in cells:
+            gained = data[c] & ~old[c]
+            if gained:
+                (dx, dy), (cy, cx) = FIRST[gained], divmod(c, stride)
+                colors[c] = source(
+                    cx * self.cell_width + dx, cy * self.cell_height + dy
+                )
+
+    def blit(self, src: Display, at: Point = (0, 0), op: str = "or"):
+        """Combine the pixels of another display into this one.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped! Cells
+        the source draws dots into take its color, or the current color for
+        sources without colors, which keep the colors when combined via "and".
+        Copying takes the color of the source for every covered cell.
+
+        :param src: the display to draw
+        :type src: Display
+        :param at: position of the source's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: one of "or", "and", "xor" and "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+        box = blit_box(self, src, at, op)
+        if box is None:
+            return
+        super().blit(src, at, op)
+        colored = src if isinstance(src, ColorBraille) else None
+        if op == "and" and colored is None:
+            return
+        (ox, oy), (x0, y0, x1, y1) = at, box
+        cw, ch, stride = self.cell_width, self.cell_height, self._char_width
+        (cx0, cy0), (cx1, cy1) = (x0 // cw, y0 // ch), (x1 // cw, y1 // ch)
+        data, colors, code = self.data, self.colors, cast(int, self._paint(True))
+        if (
+            isinstance(src, CellDisplay)
+            and (src.cell_width, src.cell_height, src._bits) == (cw, ch, self._bits)
+            and not ox % cw
+            and not oy % ch
+        ):
+            # Source cells line up with ours, see CellDisplay.blit.
+            n, sstride, masks = cx1 - cx0 + 1, src._char_width, self._masks
+            for cy in range(cy0, cy1 + 1):
+                d = cy * stride + cx0
+                s = (cy - oy // ch) * sstride + cx0 - ox // cw
+                if op == "copy":
+                    colors[d : d + n] = (
+                        colored.colors[s : s + n] if colored else array("B", [code]) * n
+                    )
+                    continue
+                dy1 = y1 % ch if cy == cy1 else ch - 1
+                for i in range(n):
+                    dx1 = x1 % cw if i == n - 1 else cw - 1
+                    if data[d + i] and src.data[s + i] & masks[0][dy1][0][dx1]:
+                        colors[d + i] = colored.colors[s + i] if colored else code
+            return
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                c = cx + cy * stride
+                if op != "copy" and not data[c]:
+                    continue
+                # Covered pixels of the cell, in source coordinates.
+                covered = [
+                    (x - ox, y - oy)
+                    for y in range(max(cy * ch, y0), min(cy * ch + ch - 1, y1) + 1)
+                    for x in range(max(cx * cw, x0), min(cx * cw + cw - 1, x1) + 1)
+                ]
+                pos = next((p for p in covered if src[p]), None)
+                if pos is None:
+                    if op != "copy":
+                        continue
+                    pos = covered[0]
+                colors[c] = (
+                    colored.colors[colored._pos_to_idx(*pos)[0]] if colored else code
+                )
+
+    def scroll(self, dx: int, dy: int):
+        """Move all pixels by some offset, clearing the pixels left behind.
+
+        Pixels moved out of bounds are dropped. Every cell takes the color of
+        the cell its first dot came from.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+        old = array("B", bytes(self.colors))
+        super().scroll(dx, dy)
+        self._recolor(
+            range(len(self.data)),
+            bytes(len(self.data)),
+            lambda x, y: old[self._pos_to_idx(x - dx, y - dy)[0]],
+        )
+
+    def __setitem__(self, pos: Point, val: Union[bool, int]):
+        """Set the value of a pixel.
+
+        :param pos: position of the pixel to set
+        :type pos: Point
+        :param val: palette index of the color to set the pixel to, True for
+            the current color and False to clear it
+        :type val: Union[bool, int]
+        :raises IndexError: requested pixel is out of the bounds of the matrix
+        :raises ValueError: palette index out of range
+        """
+        code = self._paint(val)
+        super().__setitem__(pos, code is not None)
+        if code is not None:
+            self.colors[self._pos_to_idx(*pos)[0]] = code
+
+    def set_many(self, ps: Iterable[Point], val: Union[bool, int]):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param ps: positions of the pixels to set
+        :type ps: Iterable[Point]
+        :param val: palette index of the color to set the pixels to, True for
+            the current color and False to clear them
+        :type val: Union[bool, int]
+        :raises ValueError: palette index out of range
+        """
+        code = self._paint(val)
+        if code is None:
+            super().set_many(ps, False)
+            return
+        ps = list(ps)
+        super().set_many(ps, True)
+        colors, w, h, stride = self.colors, self.width, self.height, self._char_width
+        xs, ys = self._x_shift, self._y_shift
+        for x, y in ps:
+            if 0 <= x < w and 0 <= y < h:
+                colors[(x >> xs) + (y >> ys) * stride] = code
+
+    def set_row(self, y: int, row: bytes):
+        """Set the values of a whole row of pixels at once.
+
+        Cells gaining dots take the current color.
+
+        :param y: y coordinate of the row
+        :type y: int
+        :param row: one byte per pixel, nonzero meaning set
+        :type row: bytes
+        :raises IndexError: the row is out of bounds or of the wrong length
+        """
+        super().set_row(y, row)
+        code, cw = cast(int, self._paint(True)), self.cell_width
+        start = y // self.cell_height * self._char_width
+        for c in range(self._char_width):
+            if any(row[c * cw : (c + 1) * cw]):
+                self.colors[start + c] = code
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, val: Union[bool, int]):
+        """Set the value of an axis aligned rectangle of pixels.
+
+        :param x0: x coordinate of the top left corner
+        :type x0: int
+        :param y0: y coordinate of the top left corner
+        :type y0: int
+        :param x1: x coordinate of the bottom right corner (inclusive)
+        :type x1: int
+        :param y1: y coordinate of the bottom right corner (inclusive)
+        :type y1: int
+        :param val: palette index of the color to set the pixels to, True for
+            the current color and False to clear them
+        :type val: Union[bool, int]
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        :raises ValueError: palette index out of range
+        """
+        code = self._paint(val)
+        super().fill_rect(x0, y0, x1, y1, code is not None)
+        if code is not None:
+            cw, ch, stride = self.cell_width, self.cell_height, self._char_width
+            n = x1 // cw - x0 // cw + 1
+            for cy in range(y0 // ch, y1 // ch + 1):
+                start = x0 // cw + cy * stride
+                self.colors[start : start + n] = array("B", [code]) * n
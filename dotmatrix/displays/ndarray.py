@@ -0,0 +1,128 @@
+from typing import Any, ClassVar, Type, TypeVar
+
+import numpy as np
+
+from .._types import USE_DEFAULT, Union, UseDefault
+from ._cell import PlainCellDisplay
+from .block import BLOCKS, Block
+from .braille import Braille
+
+__all__ = ("NumpyBraille", "NumpyBlock")
+
+
+N = TypeVar("N", bound="_Vectorized")
+
+
+class _Vectorized(PlainCellDisplay):
+    """Mixin backing a cell display by a NumPy array for bulk operations."""
+
+    __slots__ = ("cells",)
+
+    # Code points of the character(s) of each possible cell value.
+    _lut: ClassVar[np.ndarray]
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+    ) -> None:
+        """Initialize a matrix object.
+
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        """
+        super().__init__(width, height, default_brush=default_brush)
+        # View sharing its memory with self.data, so the per-pixel methods
+        # and the vectorized ones can be mixed freely.
+        self.cells = np.frombuffer(self.data, dtype=np.uint8).reshape(
+            self._char_height, self._char_width
+        )
+
+    @classmethod
+    def from_buffer(
+        cls: Type[N],
+        buf: Any,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+    ) -> N:
+        """Create a display on top of an existing buffer, without copying it.
+
+        :param buf: bytes like object holding the cells in row-major order,
+            one byte each, read-only buffers giving read-only displays
+        :type buf: Any
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :raises ValueError: the size of the buffer doesn't match the dimensions
+        :return: the display
+        :rtype: _Vectorized
+        """
+        new = super().from_buffer(buf, width, height, default_brush=default_brush)
+        new.cells = np.frombuffer(new.data, dtype=np.uint8).reshape(
+            new._char_height, new._char_width
+        )
+        return new
+
+    def render(self) -> str:
+        """Render the current matrix state.
+
+        :return: render result
+        :rtype: str
+        """
+        rows, cols = self.cells.shape
+        chars = self._lut.shape[1] * cols
+        out = np.empty((rows, chars + 1), dtype=np.uint32)
+        out[:, :chars] = self._lut[self.cells].reshape(rows, chars)
+        out[:, chars] = ord("\n")
+        buf = out.reshape(-1)[:-1]
+        # Reinterpret the code points as one UTF-32 string.
+        return str(buf.view(np.dtype((np.str_, buf.size)))[0]) if buf.size else ""
+
+    def scatter_array(self, xs: np.ndarray, ys: np.ndarray, val: bool = True):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply dropped!
+
+        :param xs: x coordinates of the pixels
+        :type xs: np.ndarray
+        :param ys: y coordinates of the pixels
+        :type ys: np.ndarray
+        :param val: the value to set the pixels to, defaults to True
+        :type val: bool, optional
+        """
+        xs, ys = np.ravel(xs).astype(np.intp), np.ravel(ys).astype(np.intp)
+        inside = (0 <= xs) & (xs < self.width) & (0 <= ys) & (ys < self.height)
+        cx, dx = np.divmod(xs[inside], self.cell_width)
+        cy, dy = np.divmod(ys[inside], self.cell_height)
+        idx, pos = cx + cy * self._char_width, dx + dy * self.cell_width
+        flat = self.cells.reshape(-1)
+        # Handle one bit at a time, so duplicate indices all write the same.
+        for p, bit in enumerate(self.bit_pos):
+            sel = idx[pos == p]
+            if val:
+                flat[sel] |= 1 << bit
+            else:
+                flat[sel] &= 0xFF ^ 1 << bit
+
+
+class NumpyBraille(_Vectorized, Braille):
+    """A matrix made up of braille dots, backed by a NumPy array."""
+
+    __slots__ = ()
+
+    _lut = (0x2800 | np.arange(256, dtype=np.uint32)).reshape(256, 1)
+
+
+class NumpyBlock(_Vectorized, Block):
+    """A matrix made up of unicode block characters, backed by a NumPy array."""
+
+    __slots__ = ()
+
+    _lut = np.array([[ord(c) for c in block] for block in BLOCKS], dtype=np.uint32)
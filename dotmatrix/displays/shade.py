@@ -0,0 +1,346 @@
+from array import array
+from collections import deque
+from io import TextIOBase
+from itertools import repeat
+from typing import IO, Any, ClassVar, Iterable, Iterator, Sequence, Tuple, TypeVar
+
+from .._types import USE_DEFAULT, Display, Point, Union, UseDefault
+from ._blit import blit_box, combine
+
+__all__ = ("Shade",)
+
+
+SHADES = (" ", "░", "▒", "▓", "█")
+BLENDS = ("set", "add", "max")
+
+S = TypeVar("S", bound="Shade")
+
+
+def _level(val: int) -> int:
+    """Clamp a value to an intensity, True being the full intensity."""
+    return 255 if val is True else max(0, min(255, int(val)))
+
+
+class Shade:
+    """A matrix of intensities (0-255), made up of unicode shade characters.
+
+    Values are combined with the current intensity of a pixel according to
+    the blend mode: "set" replaces it, "add" adds to it (saturating at 255)
+    and "max" keeps the larger one.
+    """
+
+    __slots__ = (
+        "width",
+        "height",
+        "default_brush",
+        "data",
+        "blend",
+        "palette",
+        "_table",
+        "_utf16",
+    )
+
+    # Keyword arguments of from_buffer saved along with the intensities.
+    buffer_options: ClassVar[Tuple[str, ...]] = ("blend", "palette")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[int, UseDefault] = USE_DEFAULT,
+        blend: str = "set",
+        palette: Sequence[str] = SHADES,
+    ) -> None:
+        """Initialize a matrix object.
+
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :param blend: one of "set", "add" and "max", defaults to "set"
+        :type blend: str, optional
+        :param palette: characters for increasing intensities, defaults to SHADES
+        :type palette: Sequence[str], optional
+        :raises ValueError: unknown blend mode
+        """
+        if blend not in BLENDS:
+            raise ValueError(f"Unknown blend mode: {blend!r}")
+        self.default_brush = USE_DEFAULT.resolve(default_brush, 255)
+        self.width = width
+        self.height = height
+        self.blend = blend
+        self.palette = palette
+        # Character of every intensity, as a str.translate table.
+        self._table = [palette[v * len(palette) // 256] for v in range(256)]
+        # The same as bytes.translate tables for the low and high byte of the
+        # UTF-16 encoding, if every character fits into a single code unit.
+        self._utf16 = (
+            tuple(
+                bytes(ord(c) >> shift & 0xFF for c in self._table) for shift in (0, 8)
+            )
+            if all(len(c) == 1 and ord(c) < 0xD800 for c in palette)
+            else None
+        )
+        self.data = array("B", bytes(width * height))
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buf: Any,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[int, UseDefault] = USE_DEFAULT,
+        blend: str = "set",
+        palette: Sequence[str] = SHADES,
+    ) -> "Shade":
+        """Create a display on top of an existing buffer, without copying it.
+
+        :param buf: bytes like object holding the intensities in row-major
+            order, read-only buffers giving read-only displays
+        :type buf: Any
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :param blend: one of "set", "add" and "max", defaults to "set"
+        :type blend: str, optional
+        :param palette: characters for increasing intensities, defaults to SHADES
+        :type palette: Sequence[str], optional
+        :raises ValueError: the size of the buffer doesn't match the dimensions
+            or unknown blend mode
+        :return: the display
+        :rtype: Shade
+        """
+        data = memoryview(buf).cast("B")
+        if len(data) != width * height:
+            raise ValueError(
+                f"Expected {width * height} bytes for a {width}x{height} "
+                f"{cls.__name__} display, got {len(data)}."
+            )
+        new = cls(0, 0, default_brush=default_brush, blend=blend, palette=palette)
+        new.width, new.height, new.data = width, height, data  # type: ignore
+        return new
+
+    def render(self) -> str:
+        """Render the current matrix state.
+
+        :return: render result
+        :rtype: str
+        """
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        data, w = self.data, self.width
+        if self._utf16 is None:
+            for y in range(self.height):
+                # Intensities are code points below 256, i.e. latin-1.
+                row = data[y * w : (y + 1) * w].tobytes().decode("latin-1")
+                yield row.translate(self._table)
+            return
+        lo, hi = self._utf16
+        buf = bytearray(2 * w)
+        for y in range(self.height):
+            levels = data[y * w : (y + 1) * w].tobytes()
+            buf[0::2], buf[1::2] = levels.translate(lo), levels.translate(hi)
+            yield buf.decode("utf-16-le")
+
+    def write_to(self, fp: IO[Any]):
+        """Write the current matrix state to a stream, one line at a time.
+
+        Writes the same as :meth:`render` returns, without materializing all
+        of it at once. Text streams (:class:`io.TextIOBase`) receive strings,
+        any other stream receives UTF-8 encoded bytes.
+
+        :param fp: the stream to write to
+        :type fp: IO[Any]
+        """
+        text = isinstance(fp, TextIOBase)
+        for y, line in enumerate(self._lines()):
+            if y:
+                fp.write("\n" if text else b"\n")
+            fp.write(line if text else line.encode())
+
+    def copy(self: S) -> S:
+        """Create an independent copy of the display.
+
+        :return: the copy
+        :rtype: Shade
+        """
+        new = type(self)(
+            self.width,
+            self.height,
+            default_brush=self.default_brush,
+            blend=self.blend,
+            palette=self.palette,
+        )
+        new.data[:] = array("B", bytes(self.data))
+        return new
+
+    def blit(self, src: Display, at: Point = (0, 0), op: str = "or"):
+        """Combine the intensities of another display into this one.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped! The
+        intensities are combined bitwise, without blending, a whole row at
+        a time. Boolean pixels of other displays count as 0 or 255.
+
+        :param src: the display to draw
+        :type src: Display
+        :param at: position of the source's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: one of "or", "and", "xor" and "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+        box = blit_box(self, src, at, op)
+        if box is None:
+            return
+        (ox, oy), (x0, y0, x1, y1) = at, box
+        data, w, n = self.data, self.width, x1 - x0 + 1
+        for y in range(y0, y1 + 1):
+            if isinstance(src, Shade):
+                start = x0 - ox + (y - oy) * src.width
+                row = src.data[start : start + n].tobytes()
+            else:
+                row = bytes(_level(src[x - ox, y - oy]) for x in range(x0, x1 + 1))
+            start = x0 + y * w
+            bits = combine(
+                int.from_bytes(data[start : start + n].tobytes(), "little"),
+                int.from_bytes(row, "little"),
+                (1 << 8 * n) - 1,
+                op,
+            )
+            data[start : start + n] = array("B", bits.to_bytes(n, "little"))
+
+    def scroll(self, dx: int, dy: int):
+        """Move all pixels by some offset, clearing the pixels left behind.
+
+        Pixels moved out of bounds are dropped.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+        w, h = self.width, self.height
+        old, new = self.data.tobytes(), bytearray(w * h)
+        start, stop = max(0, -dx), min(w, w - dx)
+        if start < stop:
+            for y in range(max(0, -dy), min(h, h - dy)):
+                row = (y + dy) * w + dx
+                new[row + start : row + stop] = old[y * w + start : y * w + stop]
+        self.data[:] = array("B", new)
+
+    def _blended(self, val: int) -> bytes:
+        """Get the blended intensities for a value, as a bytes.translate table."""
+        val = _level(val)
+        if self.blend == "add":
+            return bytes(min(v + val, 255) for v in range(256))
+        if self.blend == "max":
+            return bytes(max(v, val) for v in range(256))
+        return bytes([val]) * 256
+
+    def __getitem__(self, pos: Point) -> int:
+        """Get the value of a pixel.
+
+        :param pos: position of pixel to get
+        :type pos: Point
+        :raises IndexError: requested pixel is out of the bounds of the matrix
+        :return: intensity of the pixel
+        :rtype: int
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Out of bounds: {pos}")
+        return self.data[x + y * self.width]
+
+    def __setitem__(self, pos: Point, val: int):
+        """Set the value of a pixel, blending it with the current one.
+
+        :param pos: position of the pixel to set
+        :type pos: Point
+        :param val: the intensity to set the pixel to
+        :type val: int
+        :raises IndexError: requested pixel is out of the bounds of the matrix
+        """
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Out of bounds: {pos}")
+        i, val = x + y * self.width, _level(val)
+        if self.blend == "add":
+            val = min(self.data[i] + val, 255)
+        elif self.blend == "max":
+            val = max(self.data[i], val)
+        self.data[i] = val
+
+    def set_many(self, ps: Iterable[Point], val: int):
+        """Set the value of many pixels at once, blending them.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param ps: positions of the pixels to set
+        :type ps: Iterable[Point]
+        :param val: the intensity to set the pixels to
+        :type val: int
+        """
+        data, w, h, table = self.data, self.width, self.height, self._blended(val)
+        for x, y in ps:
+            if 0 <= x < w and 0 <= y < h:
+                data[x + y * w] = table[data[x + y * w]]
+
+    def set_flat(self, indices: Iterable[int], val: int):
+        """Set the value of many pixels, given by their indices, blending them.
+
+        :param indices: row-major indices of the pixels to set, i.e.
+            x + y * width, which must all be within bounds
+        :type indices: Iterable[int]
+        :param val: the intensity to set the pixels to
+        :type val: int
+        """
+        data = self.data
+        if self.blend == "set":
+            deque(map(data.__setitem__, indices, repeat(_level(val))), maxlen=0)
+            return
+        table = self._blended(val)
+        for i in indices:
+            data[i] = table[data[i]]
+
+    def fill_span(self, y: int, x0: int, x1: int, val: int):
+        """Set the value of a horizontal run of pixels, blending them.
+
+        :param y: y coordinate of the run
+        :type y: int
+        :param x0: x coordinate of the first pixel of the run
+        :type x0: int
+        :param x1: x coordinate of the last pixel of the run (inclusive)
+        :type x1: int
+        :param val: the intensity to set the pixels to
+        :type val: int
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        self.fill_rect(x0, y, x1, y, val)
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, val: int):
+        """Set the value of an axis aligned rectangle of pixels, blending them.
+
+        Every row of the rectangle is blended at once, via a translation table.
+
+        :param x0: x coordinate of the top left corner
+        :type x0: int
+        :param y0: y coordinate of the top left corner
+        :type y0: int
+        :param x1: x coordinate of the bottom right corner (inclusive)
+        :type x1: int
+        :param y1: y coordinate of the bottom right corner (inclusive)
+        :type y1: int
+        :param val: the intensity to set the pixels to
+        :type val: int
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        if not (0 <= x0 <= x1 < self.width and 0 <= y0 <= y1 < self.height):
+            raise IndexError(f"Out of bounds: {(x0, y0)}, {(x1, y1)}")
+        data, w, table = self.data, self.width, self._blended(val)
+        for y in range(y0, y1 + 1):
+            start, stop = x0 + y * w, x1 + 1 + y * w
+            data[start:stop] = array("B", data[start:stop].tobytes().translate(table))
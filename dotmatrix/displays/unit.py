@@ -1,12 +1,34 @@
-from typing import List
+from array import array
+from collections import deque
+from io import TextIOBase
+from itertools import repeat
+from typing import (
+    IO,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
-from .._types import USE_DEFAULT, Point, Union, UseDefault
+from .._types import USE_DEFAULT, Display, Point, Union, UseDefault
+from ._blit import blit_box, combine
 
 __all__ = ("Unit",)
 
 
+U = TypeVar("U", bound="Unit")
+
+
 class Unit:
-    """A matrix made up of a pair of characters."""
+    """A matrix made up of a pair of characters.
+
+    Pixels are stored one byte each, 0 or 1, in row-major order.
+    """
 
     __slots__ = (
         "width",
@@ -14,8 +36,12 @@ class Unit:
         "default_brush",
         "data",
         "chars",
+        "_shown",
     )
 
+    # Keyword arguments of from_buffer saved along with the pixels.
+    buffer_options: ClassVar[Tuple[str, ...]] = ("chars",)
+
     def __init__(
         self,
         width: int,
@@ -34,8 +60,46 @@ class Unit:
         self.default_brush = USE_DEFAULT.resolve(default_brush, True)
         self.width = width
         self.height = height
-        self.data = 0
+        self.data = array("B", bytes(width * height))
         self.chars = chars
+        # Copy of the data as of the last diff render.
+        self._shown: Optional[bytes] = None
+
+    @classmethod
+    def from_buffer(
+        cls,
+        buf: Any,
+        width: int,
+        height: int,
+        *,
+        default_brush: Union[bool, UseDefault] = USE_DEFAULT,
+        chars: tuple[str, str] = ("  ", "██"),
+    ) -> "Unit":
+        """Create a display on top of an existing buffer, without copying it.
+
+        :param buf: bytes like object holding the pixels in row-major order,
+            one byte each, read-only buffers giving read-only displays
+        :type buf: Any
+        :param width: width of the matrix
+        :type width: int
+        :param height: height of the matrix
+        :type height: int
+        :param chars: characters of cleared and set pixels, defaults to
+            ("  ", "██")
+        :type chars: tuple[str, str], optional
+        :raises ValueError: the size of the buffer doesn't match the dimensions
+        :return: the display
+        :rtype: Unit
+        """
+        data = memoryview(buf).cast("B")
+        if len(data) != width * height:
+            raise ValueError(
+                f"Expected {width * height} bytes for a {width}x{height} "
+                f"{cls.__name__} display, got {len(data)}."
+            )
+        new = cls(0, 0, default_brush=default_brush, chars=chars)
+        new.width, new.height, new.data = width, height, data  # type: ignore
+        return new
 
     def render(self) -> str:
         """Render the current matrix state.
@@ -43,15 +107,159 @@ class Unit:
         :return: render result
         :rtype: str
         """
-        data = self.data
-        lines: List[str] = []
-        for _ in range(self.height):
-            line = ""
-            for _ in range(self.width):
-                line += self.chars[1 & data]
-                data >>= 1
-            lines.append(line)
-        return "\n".join(lines)
+        return "\n".join(self._lines())
+
+    def _lines(self) -> Iterator[str]:
+        data, w, off, on = self.data, self.width, *self.chars
+        k = len(off)
+        if len(on) != k or any(ord(c) >= 0xD800 for c in off + on):
+            chars = self._table()
+            for y in range(self.height):
+                yield self._row(data[y * w : (y + 1) * w].tobytes(), chars)
+            return
+        # Every code unit of the UTF-16 encoding of a pixel's characters gets
+        # its own bytes.translate table for the low and the high byte.
+        tables = [
+            (
+                2 * i + j,
+                bytes([ord(a) >> 8 * j & 0xFF, ord(b) >> 8 * j & 0xFF, *[0] * 254]),
+            )
+            for i, (a, b) in enumerate(zip(off, on))
+            for j in (0, 1)
+        ]
+        buf = bytearray(2 * k * w)
+        for y in range(self.height):
+            pixels = data[y * w : (y + 1) * w].tobytes()
+            for i, table in tables:
+                buf[i :: 2 * k] = pixels.translate(table)
+            yield buf.decode("utf-16-le")
+
+    @staticmethod
+    def _row(pixels: bytes, table: Dict[int, str]) -> str:
+        # Pixel values are the code points 0 and 1, i.e. latin-1.
+        return pixels.decode("latin-1").translate(table)
+
+    def write_to(self, fp: IO[Any]):
+        """Write the current matrix state to a stream, one line at a time.
+
+        Writes the same as :meth:`render` returns, without materializing all
+        of it at once. Text streams (:class:`io.TextIOBase`) receive strings,
+        any other stream receives UTF-8 encoded bytes.
+
+        :param fp: the stream to write to
+        :type fp: IO[Any]
+        """
+        text = isinstance(fp, TextIOBase)
+        for y, line in enumerate(self._lines()):
+            if y:
+                fp.write("\n" if text else b"\n")
+            fp.write(line if text else line.encode())
+
+    def _table(self) -> Dict[int, str]:
+        return {0: self.chars[0], 1: self.chars[1]}
+
+    def render_diff(self, at: Point = (0, 0), *, full: bool = False) -> str:
+        """Render the changes since the last diff render.
+
+        Only the runs of characters that changed are rendered, each prefixed
+        with an ANSI escape sequence moving the cursor to its position.
+
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :param full: render everything, regardless of changes, defaults to False
+        :type full: bool, optional
+        :return: render result
+        :rtype: str
+        """
+        ox, oy = at
+        w, columns = self.width, len(self.chars[0])
+        data, shown = self.data.tobytes(), None if full else self._shown
+        out: List[str] = []
+        table = self._table()
+        for y in range(self.height):
+            start, end = y * w, (y + 1) * w
+            if shown is not None and data[start:end] == shown[start:end]:
+                continue
+            x = start
+            while x < end:
+                if shown is not None and data[x] == shown[x]:
+                    x += 1
+                    continue
+                run = x
+                while x < end and (shown is None or data[x] != shown[x]):
+                    x += 1
+                out.append(
+                    f"\x1b[{oy + y + 1};{ox + (run - start) * columns + 1}H"
+                    + self._row(data[run:x], table)
+                )
+        self._shown = data
+        return "".join(out)
+
+    def copy(self: U) -> U:
+        """Create an independent copy of the display.
+
+        :return: the copy
+        :rtype: Unit
+        """
+        new = type(self)(
+            self.width, self.height, default_brush=self.default_brush, chars=self.chars
+        )
+        new.data[:] = array("B", bytes(self.data))
+        return new
+
+    def blit(self, src: Display, at: Point = (0, 0), op: str = "or"):
+        """Combine the pixels of another display into this one.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped! The
+        pixels are combined a whole row at a time.
+
+        :param src: the display to draw
+        :type src: Display
+        :param at: position of the source's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: one of "or", "and", "xor" and "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+        box = blit_box(self, src, at, op)
+        if box is None:
+            return
+        (ox, oy), (x0, y0, x1, y1) = at, box
+        data, w, n = self.data, self.width, x1 - x0 + 1
+        for y in range(y0, y1 + 1):
+            if isinstance(src, Unit):
+                start = x0 - ox + (y - oy) * src.width
+                row = src.data[start : start + n].tobytes()
+            else:
+                row = bytes(bool(src[x - ox, y - oy]) for x in range(x0, x1 + 1))
+            start = x0 + y * w
+            bits = combine(
+                int.from_bytes(data[start : start + n].tobytes(), "little"),
+                int.from_bytes(row, "little"),
+                (1 << 8 * n) - 1,
+                op,
+            )
+            data[start : start + n] = array("B", bits.to_bytes(n, "little"))
+
+    def scroll(self, dx: int, dy: int):
+        """Move all pixels by some offset, clearing the pixels left behind.
+
+        Pixels moved out of bounds are dropped.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+        w, h = self.width, self.height
+        old, new = self.data.tobytes(), bytearray(w * h)
+        start, stop = max(0, -dx), min(w, w - dx)
+        if start < stop:
+            for y in range(max(0, -dy), min(h, h - dy)):
+                row = (y + dy) * w + dx
+                new[row + start : row + stop] = old[y * w + start : y * w + stop]
+        self.data[:] = array("B", new)
 
     def __getitem__(self, pos: Point) -> bool:
         """Get the value of a pixel.
@@ -65,7 +273,7 @@ class Unit:
         x, y = pos
         if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Out of bounds: {(x,y)}")
-        return bool(1 & self.data >> x + y * self.width)
+        return bool(self.data[x + y * self.width])
 
     def __setitem__(self, pos: Point, val: bool):
         """Set the value of a pixel.
@@ -79,4 +287,83 @@ class Unit:
         x, y = pos
         if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Out of bounds: {(x,y)}")
-        self.data ^= (-val ^ self.data) & (1 << x + y * self.width)
+        self.data[x + y * self.width] = 1 if val else 0
+
+    def set_many(self, ps: Iterable[Point], val: bool):
+        """Set the value of many pixels at once.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param ps: positions of the pixels to set
+        :type ps: Iterable[Point]
+        :param val: the value to set the pixels to
+        :type val: bool
+        """
+        data, w, h, bit = self.data, self.width, self.height, 1 if val else 0
+        for x, y in ps:
+            if 0 <= x < w and 0 <= y < h:
+                data[x + y * w] = bit
+
+    def set_flat(self, indices: Iterable[int], val: bool):
+        """Set the value of many pixels at once, given by their indices.
+
+        :param indices: row-major indices of the pixels to set, i.e.
+            x + y * width, which must all be within bounds
+        :type indices: Iterable[int]
+        :param val: the value to set the pixels to
+        :type val: bool
+        """
+        deque(map(self.data.__setitem__, indices, repeat(1 if val else 0)), maxlen=0)
+
+    def set_row(self, y: int, row: bytes):
+        """Set the values of a whole row of pixels at once.
+
+        :param y: y coordinate of the row
+        :type y: int
+        :param row: one byte per pixel, nonzero meaning set
+        :type row: bytes
+        :raises IndexError: the row is out of bounds or of the wrong length
+        """
+        w = self.width
+        if not (0 <= y < self.height and len(row) == w):
+            raise IndexError(f"Out of bounds: row {y} of length {len(row)}")
+        if w:
+            self.data[y * w : (y + 1) * w] = array(
+                "B", bytes(row).translate(b"\0" + b"\1" * 255)
+            )
+
+    def fill_span(self, y: int, x0: int, x1: int, val: bool):
+        """Set the value of a horizontal run of pixels.
+
+        :param y: y coordinate of the run
+        :type y: int
+        :param x0: x coordinate of the first pixel of the run
+        :type x0: int
+        :param x1: x coordinate of the last pixel of the run (inclusive)
+        :type x1: int
+        :param val: the value to set the pixels to
+        :type val: bool
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        self.fill_rect(x0, y, x1, y, val)
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, val: bool):
+        """Set the value of an axis aligned rectangle of pixels.
+
+        :param x0: x coordinate of the top left corner
+        :type x0: int
+        :param y0: y coordinate of the top left corner
+        :type y0: int
+        :param x1: x coordinate of the bottom right corner (inclusive)
+        :type x1: int
+        :param y1: y coordinate of the bottom right corner (inclusive)
+        :type y1: int
+        :param val: the value to set the pixels to
+        :type val: bool
+        :raises IndexError: one of the pixels is out of the bounds of the matrix
+        """
+        if not (0 <= x0 <= x1 < self.width and 0 <= y0 <= y1 < self.height):
+            raise IndexError(f"Out of bounds: {(x0, y0)}, {(x1, y1)}")
+        w, run = self.width, array("B", [1 if val else 0]) * (x1 - x0 + 1)
+        for y in range(y0, y1 + 1):
+            self.data[x0 + y * w : x1 + 1 + y * w] = run
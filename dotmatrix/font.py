@@ -0,0 +1,267 @@
+from typing import Dict, Iterable, Tuple
+
+from ._types import Point
+from .sprite import Sprite
+
+__all__ = ("Font", "FONT_3X5", "FONT_5X7")
+
+
+class Font:
+    """A bitmap font with glyphs of a fixed size.
+
+    Every glyph is packed into a single int, one bit per pixel in row-major
+    order, the top left pixel being the most significant one. Glyphs are
+    turned into sprites the first time they are drawn, so drawing text boils
+    down to stamping cached sprites.
+    """
+
+    __slots__ = ("width", "height", "glyphs", "fallback", "_sprites")
+
+    def __init__(
+        self, width: int, height: int, glyphs: Dict[str, int], *, fallback: str = "?"
+    ) -> None:
+        """Initialize a font object.
+
+        :param width: width of every glyph
+        :type width: int
+        :param height: height of every glyph
+        :type height: int
+        :param glyphs: the packed glyph of every character
+        :type glyphs: Dict[str, int]
+        :param fallback: character drawn instead of those without a glyph,
+            after trying their uppercase version, defaults to "?"
+        :type fallback: str, optional
+        """
+        self.width = width
+        self.height = height
+        self.glyphs = glyphs
+        self.fallback = fallback
+        self._sprites: Dict[str, Sprite] = {}
+
+    def sprite(self, char: str) -> Sprite:
+        """Get the sprite of a character, its top left corner at the origin.
+
+        :param char: the character
+        :type char: str
+        :return: the sprite
+        :rtype: Sprite
+        """
+        sprite = self._sprites.get(char)
+        if sprite is None:
+            glyphs, n = self.glyphs, self.width * self.height
+            bits = glyphs.get(char, glyphs.get(char.upper(), glyphs.get(self.fallback)))
+            sprite = self._sprites[char] = Sprite(
+                (i % self.width, i // self.width)
+                for i in range(n)
+                if (bits or 0) >> n - 1 - i & 1
+            )
+        return sprite
+
+    def layout(self, text: str, spacing: int = 1) -> Iterable[Tuple[Point, Sprite]]:
+        """Position the glyphs of some text, lines being separated by newlines.
+
+        :param text: the text
+        :type text: str
+        :param spacing: pixels between characters and lines, defaults to 1
+        :type spacing: int, optional
+        :yield: position and sprite of every character
+        :rtype: Tuple[Point, Sprite]
+        """
+        dx, dy = self.width + spacing, self.height + spacing
+        for row, line in enumerate(text.split("\n")):
+            for col, char in enumerate(line):
+                yield (col * dx, row * dy), self.sprite(char)
+
+    def measure(self, text: str, spacing: int = 1) -> Tuple[int, int]:
+        """Get the size of some text.
+
+        :param text: the text
+        :type text: str
+        :param spacing: pixels between characters and lines, defaults to 1
+        :type spacing: int, optional
+        :return: width and height in pixels
+        :rtype: Tuple[int, int]
+        """
+        lines = text.split("\n")
+        longest = max(map(len, lines))
+        return (
+            max(0, longest * (self.width + spacing) - spacing),
+            len(lines) * (self.height + spacing) - spacing,
+        )
+
+
+# Glyphs of the 3x5 font, only uppercase letters though.
+GLYPHS_3X5: Dict[str, int] = {
+    " ": 0x0000,
+    "!": 0x2482,
+    '"': 0x5A00,
+    "#": 0x5F7D,
+    "$": 0x3C9E,
+    "%": 0x52A5,
+    "&": 0x2AAB,
+    "'": 0x2400,
+    "(": 0x1491,
+    ")": 0x4494,
+    "*": 0x0AA8,
+    "+": 0x05D0,
+    ",": 0x0014,
+    "-": 0x01C0,
+    ".": 0x0002,
+    "/": 0x12A4,
+    "0": 0x7B6F,
+    "1": 0x2C97,
+    "2": 0x73E7,
+    "3": 0x72CF,
+    "4": 0x5BC9,
+    "5": 0x79CF,
+    "6": 0x79EF,
+    "7": 0x7252,
+    "8": 0x7BEF,
+    "9": 0x7BCF,
+    ":": 0x0410,
+    ";": 0x0414,
+    "<": 0x1511,
+    "=": 0x0E38,
+    ">": 0x4454,
+    "?": 0x72C2,
+    "@": 0x2BE3,
+    "A": 0x2BED,
+    "B": 0x6BAE,
+    "C": 0x3923,
+    "D": 0x6B6E,
+    "E": 0x79A7,
+    "F": 0x79A4,
+    "G": 0x396B,
+    "H": 0x5BED,
+    "I": 0x7497,
+    "J": 0x126A,
+    "K": 0x5BAD,
+    "L": 0x4927,
+    "M": 0x5FED,
+    "N": 0x6B6D,
+    "O": 0x2B6A,
+    "P": 0x6BA4,
+    "Q": 0x2B73,
+    "R": 0x6BAD,
+    "S": 0x388E,
+    "T": 0x7492,
+    "U": 0x5B6F,
+    "V": 0x5B6A,
+    "W": 0x5BFD,
+    "X": 0x5AAD,
+    "Y": 0x5A92,
+    "Z": 0x72A7,
+    "[": 0x6926,
+    "\\": 0x4889,
+    "]": 0x324B,
+    "^": 0x2A00,
+    "_": 0x0007,
+    "`": 0x4400,
+    "{": 0x3513,
+    "|": 0x2492,
+    "}": 0x6456,
+    "~": 0x03E0,
+}
+
+# Glyphs of the 5x7 font, modelled after the classic LCD character set.
+GLYPHS_5X7: Dict[str, int] = {
+    " ": 0x000000000,
+    "!": 0x108420004,
+    '"': 0x294A00000,
+    "#": 0x295F57D4A,
+    "$": 0x11F4717C4,
+    "%": 0x632222263,
+    "&": 0x32544564D,
+    "'": 0x308800000,
+    "(": 0x088842082,
+    ")": 0x208210888,
+    "*": 0x009575480,
+    "+": 0x0084F9080,
+    ",": 0x000003088,
+    "-": 0x0000F8000,
+    ".": 0x00000018C,
+    "/": 0x002222200,
+    "0": 0x3A33AE62E,
+    "1": 0x11842108E,
+    "2": 0x3A211111F,
+    "3": 0x7C441062E,
+    "4": 0x08CA97C42,
+    "5": 0x7E1E0862E,
+    "6": 0x1910F462E,
+    "7": 0x7C2222108,
+    "8": 0x3A317462E,
+    "9": 0x3A317844C,
+    ":": 0x018C03180,
+    ";": 0x018C03088,
+    "<": 0x088882082,
+    "=": 0x001F07C00,
+    ">": 0x208208888,
+    "?": 0x3A2111004,
+    "@": 0x3A216D6AE,
+    "A": 0x3A318FE31,
+    "B": 0x7A31F463E,
+    "C": 0x3A308422E,
+    "D": 0x72518C65C,
+    "E": 0x7E10F421F,
+    "F": 0x7E10F4210,
+    "G": 0x3A30BC62F,
+    "H": 0x4631FC631,
+    "I": 0x38842108E,
+    "J": 0x1C4210A4C,
+    "K": 0x4654C5251,
+    "L": 0x42108421F,
+    "M": 0x4775AC631,
+    "N": 0x4639ACE31,
+    "O": 0x3A318C62E,
+    "P": 0x7A31F4210,
+    "Q": 0x3A318D64D,
+    "R": 0x7A31F5251,
+    "S": 0x3E107043E,
+    "T": 0x7C8421084,
+    "U": 0x46318C62E,
+    "V": 0x46318C544,
+    "W": 0x4631AD6AA,
+    "X": 0x462A22A31,
+    "Y": 0x463151084,
+    "Z": 0x7C222221F,
+    "[": 0x39084210E,
+    "\\": 0x020820820,
+    "]": 0x38421084E,
+    "^": 0x115100000,
+    "_": 0x00000001F,
+    "`": 0x208200000,
+    "a": 0x000E0BE2F,
+    "b": 0x4216CC63E,
+    "c": 0x000E8422E,
+    "d": 0x042D9C62F,
+    "e": 0x000E8FE0E,
+    "f": 0x1928E2108,
+    "g": 0x01F18BC2E,
+    "h": 0x4216CC631,
+    "i": 0x100C2108E,
+    "j": 0x080610A4C,
+    "k": 0x4212A6292,
+    "l": 0x30842108E,
+    "m": 0x001AAD631,
+    "n": 0x0016CC631,
+    "o": 0x000E8C62E,
+    "p": 0x001E8FA10,
+    "q": 0x000D9BC21,
+    "r": 0x0016CC210,
+    "s": 0x000E8383E,
+    "t": 0x211C42126,
+    "u": 0x00118C66D,
+    "v": 0x00118C544,
+    "w": 0x00118D6AA,
+    "x": 0x001151151,
+    "y": 0x00118BC2E,
+    "z": 0x001F1111F,
+    "{": 0x088441082,
+    "|": 0x108421084,
+    "}": 0x208411088,
+    "~": 0x0008A8800,
+}
+
+
+FONT_3X5 = Font(3, 5, GLYPHS_3X5)
+FONT_5X7 = Font(5, 7, GLYPHS_5X7)
@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .algorithms import (
+    bezier_steps,
+    bspline_bezier,
+    catmull_rom_bezier,
+    circle_size,
+    circle_span_offsets,
+    ellipse_size,
+    forward_differences,
+    line_size,
+    path_size,
+    scanline_ellipse,
+    scanline_polygon,
+    wu_circle,
+    wu_line,
+)
+
+if TYPE_CHECKING:
+    from .matrix import Matrix
+
+__all__ = ("Stats", "PrimitiveStats", "RenderStats")
+
+
+# Drawing methods timed per call. Calls made from within another one, like
+# text showing its glyphs, count towards the outermost one.
+PRIMITIVES = (
+    "set",
+    "scatter",
+    "iscatter",
+    "points",
+    "show",
+    "text",
+    "blit",
+    "scroll",
+    "line",
+    "lines",
+    "circle",
+    "circles",
+    "ellipse",
+    "chain",
+    "polygon",
+    "rectangle",
+    "plot",
+    "plotf",
+    "plot_series",
+    "iplot_series",
+    "curve",
+    "spline",
+)
+RENDERS = ("render", "render_to", "render_diff")
+
+# A counter takes the matrix and the arguments of a call, and returns the
+# arguments to make the call with (iterators being consumed for counting),
+# the amount of pixels within the bounds and the amount of pixels outside.
+Counter = Callable[["Matrix[Any, Any]", tuple, dict], Tuple[tuple, int, int]]
+
+
+class PrimitiveStats:
+    """Statistics of a drawing method."""
+
+    __slots__ = ("calls", "pixels", "clipped", "time")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.pixels = 0
+        self.clipped = 0
+        self.time = 0.0
+
+
+class RenderStats:
+    """Statistics of a render method of a display type."""
+
+    __slots__ = ("calls", "size", "time")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.size = 0
+        self.time = 0.0
+
+
+class Stats:
+    """Statistics recorded by an instrumented matrix.
+
+    :attr:`primitives` maps the names of the drawing methods to their
+    statistics: the amount of calls, the pixels they set, the pixels they
+    tried to set outside of the matrix and their wall time in seconds.
+    :attr:`renders` maps the render methods, as "Display.method", to the
+    amount of calls, the size of their output and their wall time. The size
+    is in characters, or in bytes for :meth:`Matrix.render_to`, which only
+    counts it for seekable streams.
+
+    Pixels are counted where the matrix hands them to its display. Shapes
+    clipped by their algorithms, like lines, circles, ellipses, polygons and
+    curves, never hand over the pixels outside of the matrix, their clipped
+    pixels are the difference to the size of the whole shape instead.
+    """
+
+    __slots__ = ("primitives", "renders", "_stack", "_counting")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.primitives: Dict[str, PrimitiveStats] = {}
+        self.renders: Dict[str, RenderStats] = {}
+        # Names of the drawing methods currently running, outermost first.
+        self._stack: List[str] = []
+        self._counting = False
+
+    def reset(self):
+        """Clear all statistics."""
+        self.primitives.clear()
+        self.renders.clear()
+
+    def report(self) -> str:
+        """Format the statistics as a table, slowest methods first.
+
+        :return: the table
+        :rtype: str
+        """
+        lines = [
+            f"{'primitive':<16}{'calls':>10}{'pixels':>12}{'clipped':>12}"
+            f"{'time (ms)':>12}"
+        ]
+        for name, p in sorted(self.primitives.items(), key=lambda i: -i[1].time):
+            lines.append(
+                f"{name:<16}{p.calls:>10}{p.pixels:>12}{p.clipped:>12}"
+                f"{p.time * 1e3:>12.3f}"
+            )
+        lines.append(f"{'render':<28}{'calls':>10}{'size':>12}{'time (ms)':>12}")
+        for name, r in sorted(self.renders.items(), key=lambda i: -i[1].time):
+            lines.append(f"{name:<28}{r.calls:>10}{r.size:>12}{r.time * 1e3:>12.3f}")
+        return "\n".join(lines)
+
+    def _primitive(self, name: str) -> PrimitiveStats:
+        stats = self.primitives.get(name)
+        if stats is None:
+            stats = self.primitives[name] = PrimitiveStats()
+        return stats
+
+    def _render(self, name: str) -> RenderStats:
+        stats = self.renders.get(name)
+        if stats is None:
+            stats = self.renders[name] = RenderStats()
+        return stats
+
+
+def _inside(matrix: Matrix[Any, Any], x: int, y: int) -> bool:
+    return 0 <= x < matrix.display.width and 0 <= y < matrix.display.height
+
+
+def _overlap(matrix: Matrix[Any, Any], x0: int, y0: int, x1: int, y1: int) -> int:
+    """Get the amount of pixels of a box within the bounds of the matrix."""
+    w, h = matrix.display.width, matrix.display.height
+    return max(0, min(x1, w - 1) - max(x0, 0) + 1) * max(
+        0, min(y1, h - 1) - max(y0, 0) + 1
+    )
+
+
+def _count_set(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    inside = _inside(matrix, args[0], args[1])
+    return args, int(inside), int(not inside)
+
+
+def _count_points(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    # Points, optionally followed by further values, like coverages.
+    ps = list(args[0])
+    inside = sum(_inside(matrix, p[0], p[1]) for p in ps)
+    return (ps, *args[1:]), inside, len(ps) - inside
+
+
+def _count_arrays(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    inside = sum(_inside(matrix, x, y) for x, y in zip(args[0], args[1]))
+    return args, inside, len(args[0]) - inside
+
+
+def _count_indices(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    indices = list(args[0])
+    return (indices, *args[1:]), len(indices), 0
+
+
+def _count_spans(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    spans, inside, total = list(args[0]), 0, 0
+    for y, x0, x1 in spans:
+        total += max(0, x1 - x0 + 1)
+        inside += _overlap(matrix, x0, y, x1, y)
+    return (spans, *args[1:]), inside, total - inside
+
+
+def _count_rect(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    x0, y0, x1, y1 = args[:4]
+    total = max(0, x1 - x0 + 1) * max(0, y1 - y0 + 1)
+    inside = _overlap(matrix, x0, y0, x1, y1)
+    return args, inside, total - inside
+
+
+def _count_show(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    x0, y0 = args[1] if len(args) > 1 else kwargs.get("at", (0, 0))
+    dots = list(args[0].__dots__())
+    inside = sum(_inside(matrix, x0 + x, y0 + y) for x, y in dots)
+    return args, inside, len(dots) - inside
+
+
+def _count_blit(matrix: Matrix[Any, Any], args: tuple, kwargs: dict):
+    x0, y0 = args[1] if len(args) > 1 else kwargs.get("at", (0, 0))
+    w, h = args[0].display.width, args[0].display.height
+    inside = _overlap(matrix, x0, y0, x0 + w - 1, y0 + h - 1)
+    return args, inside, w * h - inside
+
+
+# The methods handing pixels to the display and how to count them.
+COUNTERS: Dict[str, Counter] = {
+    "set": _count_set,
+    "iscatter": _count_points,
+    "_icoverage": _count_points,
+    "_iflat": _count_indices,
+    "_iarrays": _count_arrays,
+    "_ispans": _count_spans,
+    "_fill_rect": _count_rect,
+    "show": _count_show,
+    "blit": _count_blit,
+}
+
+
+def _segments(ps: tuple) -> int:
+    return sum(line_size(p0, p1) for p0, p1 in zip(ps, ps[1:]))
+
+
+def _size_line(args: tuple, kwargs: dict) -> int:
+    if kwargs.get("antialias"):
+        return sum(1 for _ in wu_line(args[0], args[1]))
+    return line_size(args[0], args[1])
+
+
+def _size_lines(args: tuple, kwargs: dict) -> int:
+    c = args[0]
+    return sum(map(line_size, zip(c[0::4], c[1::4]), zip(c[2::4], c[3::4])))
+
+
+def _size_circle(args: tuple, kwargs: dict) -> int:
+    c, r = args[:2]
+    size = 0
+    if kwargs.get("fill"):
+        size += sum(x1 - x0 + 1 for _, x0, x1 in circle_span_offsets(r))
+    if kwargs.get("antialias"):
+        size += sum(1 for _ in wu_circle(c, r))
+    elif not kwargs.get("fill"):
+        size += circle_size(r)
+    return size
+
+
+def _size_circles(args: tuple, kwargs: dict) -> int:
+    centers, r = args[:2]
+    if kwargs.get("fill"):
+        size = sum(x1 - x0 + 1 for _, x0, x1 in circle_span_offsets(r))
+    else:
+        size = circle_size(r)
+    return len(centers) // 2 * size
+
+
+def _size_ellipse(args: tuple, kwargs: dict) -> int:
+    if kwargs.get("fill"):
+        return sum(x1 - x0 + 1 for _, x0, x1 in scanline_ellipse(*args[:3]))
+    return ellipse_size(*args[1:3])
+
+
+def _size_polygon(args: tuple, kwargs: dict) -> int:
+    size = _segments((*args, *args[:1]))
+    if kwargs.get("fill"):
+        size += sum(x1 - x0 + 1 for _, x0, x1 in scanline_polygon(args))
+    return size
+
+
+def _size_curve(args: tuple, kwargs: dict) -> int:
+    if len(args) < 2:
+        return 0
+    steps = kwargs.get("steps", 0)
+    if steps <= 0:
+        steps = bezier_steps(args, kwargs.get("tolerance", 0.5))
+    return path_size(forward_differences(args, steps))
+
+
+def _size_spline(args: tuple, kwargs: dict) -> int:
+    kind, closed = kwargs.get("kind", "catmull-rom"), kwargs.get("closed", False)
+    if len(args) < 2 or kind not in ("catmull-rom", "b-spline"):
+        return 0
+    curves = (catmull_rom_bezier if kind == "catmull-rom" else bspline_bezier)(
+        args, closed
+    )
+    tolerance = kwargs.get("tolerance", 0.5)
+    return path_size(
+        p for cs in curves for p in forward_differences(cs, bezier_steps(cs, tolerance))
+    )
+
+
+# Sizes of the shapes clipped by their algorithms, given the arguments of a
+# call, as the amount of pixels they would set without clipping.
+SIZES: Dict[str, Callable[[tuple, dict], int]] = {
+    "line": _size_line,
+    "lines": _size_lines,
+    "circle": _size_circle,
+    "circles": _size_circles,
+    "ellipse": _size_ellipse,
+    "chain": lambda args, kwargs: _segments(args),
+    "polygon": _size_polygon,
+    "curve": _size_curve,
+    "spline": _size_spline,
+}
+
+
+def _counted(
+    matrix: Matrix[Any, Any], stats: Stats, count: Counter, method: Callable
+) -> Callable:
+    def counted(*args, **kwargs):
+        # Pixels handed on to another counted method are only counted once.
+        if stats._counting:
+            return method(*args, **kwargs)
+        stats._counting = True
+        try:
+            args, inside, outside = count(matrix, args, kwargs)
+            entry = stats._primitive(stats._stack[0] if stats._stack else "?")
+            entry.pixels += inside
+            entry.clipped += outside
+            return method(*args, **kwargs)
+        finally:
+            stats._counting = False
+
+    return counted
+
+
+def _timed(stats: Stats, name: str, method: Callable) -> Callable:
+    size = SIZES.get(name)
+
+    def timed(*args, **kwargs):
+        if stats._stack:
+            return method(*args, **kwargs)
+        # Sized before timing, the shape may be far larger than its visible part.
+        total: Optional[int] = None if size is None else size(args, kwargs)
+        entry = stats._primitive(name)
+        pixels, clipped = entry.pixels, entry.clipped
+        stats._stack.append(name)
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            entry.calls += 1
+            entry.time += perf_counter() - start
+            stats._stack.pop()
+            if total is not None:
+                entry.clipped = clipped + max(0, total - (entry.pixels - pixels))
+
+    return timed
+
+
+def _tell(stream: Any) -> int:
+    try:
+        return stream.tell()
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def _rendered(
+    matrix: Matrix[Any, Any], stats: Stats, name: str, method: Callable
+) -> Callable:
+    def rendered(*args, **kwargs):
+        stream = args[0] if name == "render_to" else None
+        start, offset = perf_counter(), _tell(stream)
+        out = method(*args, **kwargs)
+        entry = stats._render(f"{type(matrix.display).__name__}.{name}")
+        entry.calls += 1
+        entry.time += perf_counter() - start
+        if stream is None:
+            entry.size += len(out)
+        else:
+            entry.size += max(0, _tell(stream) - offset)
+        return out
+
+    return rendered
+
+
+def attach(matrix: Matrix[Any, Any], stats: Stats) -> Stats:
+    """Instrument a matrix, shadowing its methods with recording ones.
+
+    :param matrix: the matrix to instrument
+    :type matrix: Matrix[Any, Any]
+    :param stats: the statistics to record into
+    :type stats: Stats
+    :return: the statistics
+    :rtype: Stats
+    """
+    detach(matrix)
+    cls = type(matrix)
+    for name, count in COUNTERS.items():
+        method = getattr(cls, name).__get__(matrix)
+        setattr(matrix, name, _counted(matrix, stats, count, method))
+    for name in PRIMITIVES:
+        setattr(matrix, name, _timed(stats, name, getattr(matrix, name)))
+    for name in RENDERS:
+        method = getattr(cls, name).__get__(matrix)
+        setattr(matrix, name, _rendered(matrix, stats, name, method))
+    return stats
+
+
+def detach(matrix: Matrix[Any, Any]):
+    """Remove the instrumentation of a matrix, if any.
+
+    :param matrix: the matrix to stop instrumenting
+    :type matrix: Matrix[Any, Any]
+    """
+    for name in (*COUNTERS, *PRIMITIVES, *RENDERS):
+        vars(matrix).pop(name, None)
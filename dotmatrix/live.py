@@ -0,0 +1,196 @@
+import asyncio
+import sys
+from typing import IO, Any, List, Optional, Protocol
+
+from ._types import Point
+from .matrix import Matrix
+
+__all__ = ("Live", "FrameStats", "Writer")
+
+
+class FrameStats:
+    """Statistics of the frames shown by a :class:`Live` renderer.
+
+    Frame times span from taking the snapshot of the matrix until its output
+    is flushed to the stream.
+    """
+
+    __slots__ = ("frames", "dropped", "total_time", "max_time", "last_time")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.frames = 0
+        self.dropped = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_time = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """Get the average frame time in seconds.
+
+        :return: average frame time, 0 before the first frame
+        :rtype: float
+        """
+        return self.total_time / self.frames if self.frames else 0.0
+
+    def _add(self, time: float):
+        self.frames += 1
+        self.total_time += time
+        self.max_time = max(self.max_time, time)
+        self.last_time = time
+
+    def __repr__(self) -> str:
+        """Get a summary of the statistics."""
+        return (
+            f"FrameStats(frames={self.frames}, dropped={self.dropped}, "
+            f"mean_time={self.mean_time:.6f}, max_time={self.max_time:.6f})"
+        )
+
+
+class Writer(Protocol):
+    """A stream frames can be written to, like :class:`asyncio.StreamWriter`."""
+
+    def write(self, data: bytes):
+        """Buffer data to be written to the stream."""
+
+    async def drain(self):
+        """Wait until the buffered data is written."""
+
+
+class _FileWriter:
+    """Write to a file in a worker thread, keeping the event loop responsive.
+
+    The file is left in blocking mode, so printing to it after the loop is
+    fine, and is only written to from one thread at a time.
+    """
+
+    __slots__ = ("fp", "_pending")
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self.fp = fp
+        self._pending: List[bytes] = []
+
+    def write(self, data: bytes):
+        self._pending.append(data)
+
+    def _flush(self, data: bytes):
+        self.fp.write(data)
+        self.fp.flush()
+
+    async def drain(self):
+        data = b"".join(self._pending)
+        self._pending.clear()
+        await asyncio.get_running_loop().run_in_executor(None, self._flush, data)
+
+
+class Live:
+    """Show a matrix in a terminal at a steady frame rate.
+
+    The matrix is double buffered: producers draw onto :attr:`matrix` at any
+    time, while every frame takes a snapshot of it into a second matrix of its
+    own, which is diff rendered in a worker thread and written to the stream
+    without blocking the event loop. Frames falling behind, because rendering
+    or a slow terminal take longer than the frame period, are dropped, i.e.
+    the next frame shows the latest state right away and intermediate states
+    are never rendered.
+
+    Use the renderer as an async context manager, which runs the frame loop
+    in a task and shows a last frame on exit, or await :meth:`run` directly.
+    """
+
+    __slots__ = ("matrix", "fps", "at", "stats", "_front", "_writer", "_task")
+
+    def __init__(
+        self,
+        matrix: Matrix[Any, Any],
+        writer: Optional[Writer] = None,
+        *,
+        fps: float = 30.0,
+        at: Point = (0, 0),
+    ) -> None:
+        """Initialize a renderer object.
+
+        :param matrix: the matrix to show, which producers draw onto
+        :type matrix: Matrix[Any, Any]
+        :param writer: the stream to write the frames to, e.g. an
+            :class:`asyncio.StreamWriter`, defaults to stdout, written to in a
+            worker thread
+        :type writer: Optional[Writer], optional
+        :param fps: target frames per second, defaults to 30
+        :type fps: float, optional
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :raises ValueError: the frame rate isn't positive
+        """
+        if fps <= 0:
+            raise ValueError(f"Frame rate must be positive, got {fps}.")
+        self.matrix = matrix
+        self.fps = fps
+        self.at = at
+        self.stats = FrameStats()
+        self._front = matrix.copy()
+        self._writer = writer
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def __aenter__(self) -> "Live":
+        """Start the frame loop in a task, returning the renderer itself."""
+        self._task = asyncio.ensure_future(self.run())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Stop the frame loop, showing the latest state once more."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.frame()
+
+    def _render(self, full: bool) -> bytes:
+        return self._front.render_diff(self.at, full=full).encode()
+
+    async def frame(self, *, full: bool = False):
+        """Show the current state of the matrix right away.
+
+        :param full: redraw everything, regardless of changes, defaults to
+            False
+        :type full: bool, optional
+        """
+        if self._writer is None:
+            self._writer = _FileWriter(sys.stdout.buffer)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._front.blit(self.matrix, op="copy")
+        out = await loop.run_in_executor(None, self._render, full)
+        if out:
+            self._writer.write(out)
+            await self._writer.drain()
+        self.stats._add(loop.time() - start)
+
+    async def run(self, frames: Optional[int] = None):
+        """Run the frame loop, the first frame redrawing everything.
+
+        :param frames: amount of frames to show, shown and dropped ones
+            alike, defaults to running until cancelled
+        :type frames: Optional[int], optional
+        """
+        loop = asyncio.get_running_loop()
+        period, tick, ticks = 1 / self.fps, loop.time(), 0
+        while frames is None or ticks < frames:
+            await self.frame(full=not ticks)
+            ticks += 1
+            tick += period
+            now = loop.time()
+            if now > tick:
+                # Skip the ticks missed while showing the frame.
+                missed = int((now - tick) / period) + 1
+                if frames is not None:
+                    missed = min(missed, frames - ticks)
+                self.stats.dropped += missed
+                ticks += missed
+                tick += missed * period
+            await asyncio.sleep(max(0.0, tick - now))
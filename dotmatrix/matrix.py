@@ -1,19 +1,87 @@
 from __future__ import annotations
 
-from typing import Callable, Generic, Iterable, Sequence, Type, TypeVar, Union, cast
+import json
+import mmap
+import struct
+from functools import partial
+from io import TextIOBase
+from itertools import chain, islice, repeat
+from operator import add, mul
+from os import PathLike
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from ._types import USE_DEFAULT, Display, Dotted, Point, UseDefault
+from . import displays
+from ._types import (
+    USE_DEFAULT,
+    ArrayDisplay,
+    Box,
+    Display,
+    Dotted,
+    FlatDisplay,
+    Point,
+    Span,
+    UseDefault,
+)
 from .algorithms import (
+    bayer_dither,
+    bezier_steps,
     bresenham_circle,
     bresenham_ellipse,
     bresenham_line,
-    de_casteljau,
+    bresenham_lines,
+    bresenham_path,
+    bspline_bezier,
+    catmull_rom_bezier,
+    circle_offsets,
+    circle_span_offsets,
+    floyd_steinberg_dither,
+    forward_differences,
+    iminmax_downsample,
+    minmax_downsample,
+    scanline_circle,
+    scanline_ellipse,
+    scanline_polygon,
+    threshold_dither,
+    wu_circle,
+    wu_line,
 )
 from .displays import Braille
+from .displays._blit import blit_pixels
+from .font import FONT_5X7, Font
+from .instrument import Stats, attach, detach
+from .retained import DisplayList
+from .sprite import Sprite
 
 __all__ = ("Matrix",)
 
 
+# Saved matrices start with a header holding the magic bytes, the format
+# version, the name of the display type (padded with null bytes), the width,
+# the height and the default brush. Since version 2, it's followed by the
+# size of the display's options, the options as a JSON object and then the
+# data of the display, which directly follows the header in version 1.
+HEADER = struct.Struct("<4sB16sIIh")
+OPTIONS = struct.Struct("<I")
+MAGIC = b"DMTX"
+VERSION = 2
+# Access of the memory mapping for each mode of Matrix.open.
+MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
 T = TypeVar("T")
 S = TypeVar("S")
 V = TypeVar("V")
@@ -64,6 +132,177 @@ class Matrix(Generic[V, O]):
         """
         return cls(display.width, display.height, display=display)
 
+    @classmethod
+    def from_image(
+        cls,
+        pixels: Any,
+        width: int,
+        height: int,
+        *,
+        method: str = "floyd-steinberg",
+        threshold: int = 128,
+        display: Union[Display[V, O], Type[Display[V, O]]] = Braille,  # type: ignore
+    ) -> Matrix[V, O]:
+        """Create a matrix from a grayscale image by dithering it.
+
+        The image is converted one row at a time, so memory use only grows
+        with its width. A dot is set wherever the image is bright.
+
+        :param pixels: luminance values in row-major order, either as a bytes
+            like object (0-255) or as a NumPy array of bytes or floats (0-1),
+            which may be a strided view, like a crop of a larger image
+        :type pixels: Any
+        :param width: width of the image
+        :type width: int
+        :param height: height of the image
+        :type height: int
+        :param method: one of "threshold", "bayer" and "floyd-steinberg",
+            defaults to "floyd-steinberg"
+        :type method: str, optional
+        :param threshold: luminance at which a pixel becomes a dot, ignored
+            by the "bayer" method, defaults to 128
+        :type threshold: int, optional
+        :param display: the display (type) to use, defaults to Braille
+        :type display: Union[Display[V, O], Type[Display[V, O]]], optional
+        :raises ValueError: unknown method or too few pixels for the image
+        :return: a matrix showing the dithered image
+        :rtype: Matrix[V, O]
+        """
+        dither: Callable[[Iterable[bytes]], Iterable[bytes]]
+        if method == "threshold":
+            dither = partial(threshold_dither, threshold=threshold)
+        elif method == "bayer":
+            dither = bayer_dither
+        elif method == "floyd-steinberg":
+            dither = partial(floyd_steinberg_dither, threshold=threshold)
+        else:
+            raise ValueError(f"Unknown dithering method: {method!r}")
+        dtype = getattr(pixels, "dtype", None)
+        if dtype is not None and dtype.kind == "f":
+            pixels = (pixels.clip(0, 1) * 255).round().astype("uint8")
+        buf = memoryview(pixels)
+        if not buf.c_contiguous:
+            # E.g. strided slices of NumPy arrays, only copied in that case.
+            buf = memoryview(buf.tobytes())
+        buf = buf.cast("B")
+        if len(buf) < width * height:
+            raise ValueError(
+                f"Expected {width * height} pixels for a {width}x{height} image, "
+                f"got {len(buf)}."
+            )
+        matrix = cls(width, height, display=display)
+        rows = dither(bytes(buf[y * width : (y + 1) * width]) for y in range(height))
+        set_row = getattr(matrix.display, "set_row", None)
+        for y, row in enumerate(rows):
+            if set_row is not None:
+                set_row(y, row)
+            else:
+                matrix.iscatter((x, y) for x, dot in enumerate(row) if dot)
+        return matrix
+
+    def copy(self) -> Matrix[V, O]:
+        """Create an independent copy of the matrix.
+
+        :return: the copy
+        :rtype: Matrix[V, O]
+        """
+        copy = getattr(self.display, "copy", None)
+        if copy is not None:
+            return type(self).from_display(copy())
+        new = type(self)(
+            self.display.width,
+            self.display.height,
+            default_brush=self.display.default_brush,
+            display=type(self.display),
+        )
+        new.blit(self, op="copy")
+        return new
+
+    def save(self, path: Union[str, PathLike]):
+        """Save the matrix to a file, to be opened again via :meth:`open`.
+
+        The file consists of a small header, holding the dimensions, the
+        display type, the default brush and the display's options, like the
+        characters of a :class:`~dotmatrix.displays.Unit`, followed by the raw
+        data of the display.
+
+        :param path: the file to save the matrix to
+        :type path: Union[str, PathLike]
+        :raises TypeError: the display can't be saved, only those implementing
+            :class:`~dotmatrix._types.BufferDisplay` out of
+            :mod:`dotmatrix.displays` can
+        """
+        display, name = self.display, type(self.display).__name__
+        if getattr(display, "from_buffer", None) is None or getattr(
+            displays, name, None
+        ) is not type(display):
+            raise TypeError(f"Can't save a {name} display.")
+        options = json.dumps(
+            {
+                key: getattr(display, key)
+                for key in getattr(display, "buffer_options", ())
+            }
+        ).encode()
+        with open(path, "wb") as fp:
+            fp.write(
+                HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    name.encode(),
+                    display.width,
+                    display.height,
+                    int(display.default_brush),  # type: ignore
+                )
+            )
+            fp.write(OPTIONS.pack(len(options)) + options)
+            fp.write(display.data)  # type: ignore
+
+    @classmethod
+    def open(cls, path: Union[str, PathLike], mode: str = "r") -> Matrix[Any, Any]:
+        """Open a matrix saved via :meth:`save`, without loading it.
+
+        The file is memory mapped and the display works directly on the
+        mapping, so even huge matrices open instantly and only the parts
+        actually accessed are ever read. With mode "r+", changes are written
+        back to the file and are visible to all processes mapping it.
+
+        :param path: the file to open
+        :type path: Union[str, PathLike]
+        :param mode: "r" for read-only, "r+" for read-write and "c" for
+            copy-on-write access, i.e. changes aren't written back, defaults
+            to "r"
+        :type mode: str, optional
+        :raises ValueError: unknown mode or the file isn't a saved matrix
+        :return: the saved matrix
+        :rtype: Matrix[Any, Any]
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode!r}")
+        with open(path, "r+b" if mode == "r+" else "rb") as fp:
+            # The mapping stays valid after closing the file.
+            buf = memoryview(mmap.mmap(fp.fileno(), 0, access=MODES[mode]))
+        if len(buf) < HEADER.size or bytes(buf[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"Not a saved matrix: {path}")
+        _, version, name, width, height, brush = HEADER.unpack_from(buf)
+        if version not in (1, VERSION):
+            raise ValueError(f"Unsupported format version: {version}")
+        name = name.rstrip(b"\0").decode()
+        from_buffer = getattr(getattr(displays, name, None), "from_buffer", None)
+        if name not in displays.__all__ or from_buffer is None:
+            raise ValueError(f"Unknown display: {name!r}")
+        start, options = HEADER.size, {}
+        if version > 1:
+            (size,) = OPTIONS.unpack_from(buf, start)
+            start += OPTIONS.size + size
+            options = {
+                # JSON has no tuples, the options are given as such though.
+                key: tuple(value) if isinstance(value, list) else value
+                for key, value in json.loads(bytes(buf[start - size : start])).items()
+            }
+        display = from_buffer(buf[start:], width, height, **options)
+        display.default_brush = type(display.default_brush)(brush)
+        return cls.from_display(display)
+
     def render(self) -> O:
         """Render the current matrix state.
 
@@ -72,6 +311,84 @@ class Matrix(Generic[V, O]):
         """
         return self.display.render()
 
+    def render_to(self, stream: IO[Any]):
+        """Render the current matrix state directly into a stream.
+
+        Displays supporting it write their result line by line, so even huge
+        matrices can be written with little memory. Text streams
+        (:class:`io.TextIOBase`) receive strings, any other stream receives
+        UTF-8 encoded bytes.
+
+        :param stream: the stream to write to
+        :type stream: IO[Any]
+        """
+        write_to = getattr(self.display, "write_to", None)
+        if write_to is not None:
+            write_to(stream)
+        elif isinstance(stream, TextIOBase):
+            stream.write(str(self.render()))
+        else:
+            stream.write(str(self.render()).encode())
+
+    def render_diff(self, at: Point = (0, 0), *, full: bool = False) -> str:
+        """Render the changes since the last diff render for a terminal.
+
+        The result consists of ANSI escape sequences moving the cursor and the
+        characters that changed, so writing it to a terminal showing the
+        previous frame brings it up to date. Displays without support for diff
+        rendering are redrawn completely.
+
+        :param at: terminal position (column, row) of the matrix' top left
+            corner, zero based, defaults to (0, 0)
+        :type at: Point, optional
+        :param full: render everything, regardless of changes, defaults to False
+        :type full: bool, optional
+        :return: render result
+        :rtype: str
+        """
+        render_diff = getattr(self.display, "render_diff", None)
+        if render_diff is not None:
+            return render_diff(at, full=full)
+        x0, y0 = at
+        return "".join(
+            f"\x1b[{y0 + y + 1};{x0 + 1}H{line}"
+            for y, line in enumerate(str(self.render()).split("\n"))
+        )
+
+    def instrument(self, stats: Optional[Stats] = None) -> Stats:
+        """Start recording statistics about drawing onto and rendering the matrix.
+
+        Records the calls, the pixels set, the pixels clipped for being out of
+        bounds and the wall time of every drawing method, as well as the
+        calls, output size and wall time of the render methods. The methods
+        are shadowed by recording ones on this matrix only, so matrices that
+        aren't instrumented don't pay anything.
+
+        :param stats: statistics to record into, e.g. to share them between
+            matrices, defaults to new ones
+        :type stats: Optional[Stats], optional
+        :return: the statistics, updated as the matrix is used
+        :rtype: Stats
+        """
+        return attach(self, Stats() if stats is None else stats)
+
+    def uninstrument(self):
+        """Stop recording statistics, see :meth:`instrument`."""
+        detach(self)
+
+    def record(self) -> DisplayList:
+        """Start recording drawing commands instead of drawing right away.
+
+        The commands are rasterized lazily, when the matrix is rendered or
+        read, skipping repeated commands and reusing what was drawn before if
+        the commands are unchanged, see :class:`~dotmatrix.retained.DisplayList`.
+
+        :return: the display list, to be stopped or used as a context manager
+            when done
+        :rtype: DisplayList
+        """
+        return DisplayList(self)
+
     def __getitem__(self, pos: Point) -> V:
         """Get the value of a pixel.
 
@@ -132,6 +449,67 @@ class Matrix(Generic[V, O]):
         except IndexError:
             return default  # type: ignore
 
+    @property
+    def _box(self) -> Box:
+        """Bounds of the matrix, as clipping box."""
+        return (0, 0, self.display.width - 1, self.display.height - 1)
+
+    def _fill_rect(
+        self, x0: int, y0: int, x1: int, y1: int, brush: Union[V, UseDefault]
+    ):
+        """Set the value of an axis aligned rectangle of pixels.
+
+        Doesn't fail on out of bounds! Uses the display's bulk fill if it has
+        one and falls back to setting the pixels one by one otherwise.
+        """
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.display.width - 1), min(y1, self.display.height - 1)
+        if x0 > x1 or y0 > y1:
+            return
+        val = self.display.default_brush if brush is USE_DEFAULT else cast(V, brush)
+        fill_rect = getattr(self.display, "fill_rect", None)
+        if fill_rect is not None:
+            fill_rect(x0, y0, x1, y1, val)
+        else:
+            for y in range(y0, y1 + 1):
+                for x in range(x0, x1 + 1):
+                    self.display[x, y] = val
+
+    def _ispans(self, spans: Iterable[Span], brush: Union[V, UseDefault]):
+        """Set the value of horizontal runs of pixels from an iterator.
+
+        Doesn't fail on out of bounds! Uses the display's bulk fill if it has
+        one and falls back to setting the pixels one by one otherwise.
+        """
+        width, height = self.display.width, self.display.height
+        val = self.display.default_brush if brush is USE_DEFAULT else cast(V, brush)
+        fill_span = getattr(self.display, "fill_span", None)
+        for y, x0, x1 in spans:
+            x0, x1 = max(x0, 0), min(x1, width - 1)
+            if not (0 <= y < height and x0 <= x1):
+                continue
+            if fill_span is not None:
+                fill_span(y, x0, x1, val)
+            else:
+                for x in range(x0, x1 + 1):
+                    self.display[x, y] = val
+
+    def _iflat(self, indices: Iterable[int], brush: Union[V, UseDefault]):
+        """Set the value of pixels given by their row-major indices.
+
+        The indices must be within bounds and the display must support them.
+        """
+        val = self.display.default_brush if brush is USE_DEFAULT else cast(V, brush)
+        cast(FlatDisplay, self.display).set_flat(indices, val)
+
+    def _iarrays(self, xs: Any, ys: Any, brush: Union[V, UseDefault]):
+        """Set the value of pixels given by arrays of their coordinates.
+
+        The display must support them.
+        """
+        val = self.display.default_brush if brush is USE_DEFAULT else cast(V, brush)
+        cast(ArrayDisplay, self.display).scatter_array(xs, ys, val)
+
     def scatter(self, *ps: Point, brush: Union[V, UseDefault] = USE_DEFAULT):
         """Scatter points.
 
@@ -150,8 +528,42 @@ class Matrix(Generic[V, O]):
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
-        for x, y in ps:
-            self.set(x, y, brush)
+        val = self.display.default_brush if brush is USE_DEFAULT else cast(V, brush)
+        set_many = getattr(self.display, "set_many", None)
+        if set_many is not None:
+            set_many(ps, val)
+        else:
+            for x, y in ps:
+                self.set(x, y, val)
+
+    def points(
+        self,
+        xs: Sequence[int],
+        ys: Sequence[int],
+        *,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Scatter points given as separate buffers of coordinates.
+
+        The points are handed to the display in one go, without creating a
+        tuple per point upfront, or even as whole arrays for displays that
+        support it, like :class:`~dotmatrix.displays.NumpyBraille`.
+
+        :param xs: x coordinates of the points, e.g. an :class:`array.array`
+            or a memoryview
+        :type xs: Sequence[int]
+        :param ys: y coordinates of the points, of the same length
+        :type ys: Sequence[int]
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        :raises ValueError: the coordinates differ in length
+        """
+        if len(xs) != len(ys):
+            raise ValueError(f"Got {len(xs)} x but {len(ys)} y coordinates.")
+        if getattr(self.display, "scatter_array", None) is not None:
+            self._iarrays(xs, ys, brush)
+        else:
+            self.iscatter(zip(xs, ys), brush=brush)
 
     def show(
         self,
@@ -162,6 +574,9 @@ class Matrix(Generic[V, O]):
     ):
         """Draw an object implementing the Dotted protocol.
 
+        Sprites are drawn a whole character cell at a time, for displays that
+        support it.
+
         :param obj: the object to draw
         :type obj: Dotted
         :param at: the position to draw the object at, defaults to (0, 0)
@@ -169,37 +584,338 @@ class Matrix(Generic[V, O]):
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
+        if isinstance(obj, Sprite):
+            val = self.display.default_brush if brush is USE_DEFAULT else brush
+            obj.stamp(self.display, at, val)
+            return
         x0, y0 = at
         self.iscatter(((x0 + x, y0 + y) for x, y in obj.__dots__()), brush=brush)
 
-    def line(self, p0: Point, p1: Point, *, brush: Union[V, UseDefault] = USE_DEFAULT):
+    def text(
+        self,
+        text: str,
+        at: Point = (0, 0),
+        *,
+        font: Font = FONT_5X7,
+        spacing: int = 1,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Draw some text.
+
+        Every character is drawn as a cached sprite of its glyph, see
+        :meth:`show`. Newlines start a new line below the previous one.
+
+        :param text: the text to draw
+        :type text: str
+        :param at: position of the text's top left corner, defaults to (0, 0)
+        :type at: Point, optional
+        :param font: the font to use, defaults to FONT_5X7
+        :type font: Font, optional
+        :param spacing: pixels between characters and lines, defaults to 1
+        :type spacing: int, optional
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        """
+        x0, y0 = at
+        for (x, y), sprite in font.layout(text, spacing):
+            self.show(sprite, (x0 + x, y0 + y), brush=brush)
+
+    def blit(self, other: Matrix[V, Any], at: Point = (0, 0), *, op: str = "or"):
+        """Draw another matrix onto this one.
+
+        Uses the display's compositing if it has one, which combines whole
+        character cells at once for matching displays aligned on a cell
+        boundary, and falls back to combining the pixels one by one otherwise.
+
+        :param other: the matrix to draw
+        :type other: Matrix[V, Any]
+        :param at: the position to draw the matrix at, defaults to (0, 0)
+        :type at: Point, optional
+        :param op: how to combine the pixels, one of "or", "and", "xor" and
+            "copy", defaults to "or"
+        :type op: str, optional
+        :raises ValueError: unknown operation
+        """
+        blit = getattr(self.display, "blit", None)
+        if blit is not None:
+            blit(other.display, at, op)
+        else:
+            blit_pixels(self.display, other.display, at, op)
+
+    def scroll(self, dx: int, dy: int):
+        """Move the contents of the matrix by some offset.
+
+        Pixels moved out of bounds are dropped, those left behind are cleared.
+        Uses the display's scrolling if it has one, which moves all pixels at
+        once, and falls back to moving the pixels one by one otherwise. E.g.
+        for a live chart, scroll by one column and only draw the newest value.
+
+        :param dx: horizontal offset
+        :type dx: int
+        :param dy: vertical offset
+        :type dy: int
+        """
+        scroll = getattr(self.display, "scroll", None)
+        if scroll is not None:
+            scroll(dx, dy)
+            return
+        w, h = self.display.width, self.display.height
+        blank = cast(V, False)
+        pixels = [[self.display[x, y] for x in range(w)] for y in range(h)]
+        for y in range(h):
+            for x in range(w):
+                inside = 0 <= x - dx < w and 0 <= y - dy < h
+                self.display[x, y] = pixels[y - dy][x - dx] if inside else blank
+
+    def _composite(self, other: Any, op: str) -> Matrix[V, O]:
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        if (other.display.width, other.display.height) != (
+            self.display.width,
+            self.display.height,
+        ):
+            raise ValueError("Dimensions of the matrices don't match.")
+        new = self.copy()
+        new.blit(other, op=op)
+        return new
+
+    def __or__(self, other: Matrix[V, Any]) -> Matrix[V, O]:
+        """Combine two matrices, setting the pixels set in either.
+
+        :param other: the matrix to combine with
+        :type other: Matrix[V, Any]
+        :raises ValueError: the dimensions of the matrices don't match
+        :return: the combined matrix
+        :rtype: Matrix[V, O]
+        """
+        return self._composite(other, "or")
+
+    def __and__(self, other: Matrix[V, Any]) -> Matrix[V, O]:
+        """Combine two matrices, setting the pixels set in both.
+
+        :param other: the matrix to combine with
+        :type other: Matrix[V, Any]
+        :raises ValueError: the dimensions of the matrices don't match
+        :return: the combined matrix
+        :rtype: Matrix[V, O]
+        """
+        return self._composite(other, "and")
+
+    def __xor__(self, other: Matrix[V, Any]) -> Matrix[V, O]:
+        """Combine two matrices, setting the pixels set in exactly one.
+
+        :param other: the matrix to combine with
+        :type other: Matrix[V, Any]
+        :raises ValueError: the dimensions of the matrices don't match
+        :return: the combined matrix
+        :rtype: Matrix[V, O]
+        """
+        return self._composite(other, "xor")
+
+    def __invert__(self) -> Matrix[V, O]:
+        """Invert a matrix.
+
+        :return: the inverted matrix
+        :rtype: Matrix[V, O]
+        """
+        new = self.copy()
+        new._fill_rect(
+            0, 0, self.display.width - 1, self.display.height - 1, cast(V, True)
+        )
+        new.blit(self, op="xor")
+        return new
+
+    def _icoverage(
+        self, ps: Iterable[Tuple[int, int, float]], brush: Union[V, UseDefault]
+    ):
+        """Set pixels to the brush scaled by how much of them is covered.
+
+        Doesn't fail on out of bounds! Boolean brushes, True as well as False,
+        only set the pixels covered at least halfway.
+        """
+        display, val = self.display, self.display.default_brush
+        val = val if brush is USE_DEFAULT else cast(V, brush)
+        width, height = display.width, display.height
+        if isinstance(val, bool):
+            for x, y, coverage in ps:
+                if coverage >= 0.5 and 0 <= x < width and 0 <= y < height:
+                    display[x, y] = val
+            return
+        for x, y, coverage in ps:
+            level = round(cast(Any, val) * coverage)
+            if level and 0 <= x < width and 0 <= y < height:
+                display[x, y] = level
+
+    def line(
+        self,
+        p0: Point,
+        p1: Point,
+        *,
+        antialias: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
         """Draw a line.
 
         :param p0: coordinates of the first point
         :type p0: Point
         :param p1: coordinates of the second point
         :type p1: Point
+        :param antialias: scale the brush by how much of each pixel the line
+            covers (Xiaolin Wu), meant for intensity displays like Shade,
+            defaults to False
+        :type antialias: bool, optional
         :param brush: value to set the pixels to
         :type brush: V, optional
         :raises IndexError: one of requested pixels is out of the bounds of the matrix
         """
-        self.iscatter(bresenham_line(p0, p1), brush=brush)
+        (x0, y0), (x1, y1) = p0, p1
+        if antialias:
+            self._icoverage(wu_line(p0, p1, self._box), brush)
+        elif x0 == x1 or y0 == y1:
+            self._fill_rect(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1), brush)
+        else:
+            self.iscatter(bresenham_line(p0, p1, self._box), brush=brush)
+
+    def lines(
+        self, coords: Sequence[int], *, brush: Union[V, UseDefault] = USE_DEFAULT
+    ):
+        """Draw many lines at once.
+
+        All lines are rasterized in a single pass, see
+        :func:`~dotmatrix.algorithms.bresenham_lines`, and handed to the
+        display in one go, as flat indices for displays supporting them. Parts
+        out of bounds are skipped.
 
-    def circle(self, c: Point, r: int, *, brush: Union[V, UseDefault] = USE_DEFAULT):
+        :param coords: end points of the lines as flat x0, y0, x1, y1
+            quadruples, e.g. an :class:`array.array` or a memoryview
+        :type coords: Sequence[int]
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        :raises ValueError: the amount of coordinates isn't a multiple of 4
+        """
+        if len(coords) % 4:
+            raise ValueError(
+                f"Expected x0, y0, x1, y1 quadruples, got {len(coords)} values."
+            )
+        lines = bresenham_lines(coords, self._box)
+        if getattr(self.display, "set_flat", None) is None:
+            self.iscatter(
+                chain.from_iterable(zip(xs, ys) for xs, ys in lines), brush=brush
+            )
+            return
+        w = self.display.width
+        self._iflat(
+            chain.from_iterable(
+                map(add, xs, map(mul, ys, repeat(w))) for xs, ys in lines
+            ),
+            brush,
+        )
+
+    def circle(
+        self,
+        c: Point,
+        r: int,
+        *,
+        fill: bool = False,
+        antialias: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
         """Draw a circlee.
 
         :param c: coordinates of the circle's center
         :type c: Point
         :param r: radius of the circle
         :type r: int
+        :param fill: fill the circle, defaults to False
+        :type fill: bool, optional
+        :param antialias: scale the brush by how much of each pixel the outline
+            covers (Xiaolin Wu), meant for intensity displays like Shade,
+            defaults to False
+        :type antialias: bool, optional
         :param brush: value to set the pixels to
         :type brush: V, optional
         :raises IndexError: one of the requested pixels is out of the bounds of the matrix
         """
-        self.iscatter(bresenham_circle(c, r), brush=brush)
+        if fill:
+            self._ispans(scanline_circle(c, r, self._box), brush)
+        if antialias:
+            self._icoverage(wu_circle(c, r, self._box), brush)
+        elif not fill:
+            self.iscatter(bresenham_circle(c, r, self._box), brush=brush)
+
+    def circles(
+        self,
+        centers: Sequence[int],
+        r: int,
+        *,
+        fill: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Draw many circles of the same radius at once.
+
+        The pixels (or spans, if filled) of a circle with the radius are
+        computed once, and cached, then offset to every center. Circles
+        entirely within bounds are handed to the display as flat indices, for
+        displays supporting them, those entirely out of bounds are skipped.
+
+        :param centers: centers of the circles as flat x, y pairs, e.g. an
+            :class:`array.array` or a memoryview
+        :type centers: Sequence[int]
+        :param r: radius of the circles
+        :type r: int
+        :param fill: fill the circles, defaults to False
+        :type fill: bool, optional
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        :raises ValueError: the amount of coordinates isn't even
+        """
+        if len(centers) % 2:
+            raise ValueError(f"Expected x, y pairs, got {len(centers)} values.")
+        w, h = self.display.width, self.display.height
+        inner: List[Point] = []
+        outer: List[Point] = []
+        for x, y in zip(centers[0::2], centers[1::2]):
+            if r <= x < w - r and r <= y < h - r:
+                inner.append((x, y))
+            elif -r <= x < w + r and -r <= y < h + r:
+                outer.append((x, y))
+        if fill:
+            spans = circle_span_offsets(r)
+            self._ispans(
+                (
+                    (y + sy, x + x0, x + x1)
+                    for x, y in chain(inner, outer)
+                    for sy, x0, x1 in spans
+                ),
+                brush,
+            )
+            return
+        xs, ys = circle_offsets(r)
+        if getattr(self.display, "set_flat", None) is None:
+            outer += inner
+        elif inner:
+            offsets = [x + y * w for x, y in zip(xs, ys)]
+            self._iflat(
+                chain.from_iterable(
+                    map((x + y * w).__add__, offsets) for x, y in inner
+                ),
+                brush,
+            )
+        self.iscatter(
+            chain.from_iterable(
+                zip(map(x.__add__, xs), map(y.__add__, ys)) for x, y in outer
+            ),
+            brush=brush,
+        )
 
     def ellipse(
-        self, c: Point, r1: int, r2: int, *, brush: Union[V, UseDefault] = USE_DEFAULT
+        self,
+        c: Point,
+        r1: int,
+        r2: int,
+        *,
+        fill: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
     ):
         """Draw an ellipse.
 
@@ -209,11 +925,16 @@ class Matrix(Generic[V, O]):
         :type r1: int
         :param r2: vertical radius of the ellipse
         :type r2: int
+        :param fill: fill the ellipse, defaults to False
+        :type fill: bool, optional
         :param brush: value to set the pixels to
         :type brush: V, optional
         :raises IndexError: one of requested pixels is out of the bounds of the matrix
         """
-        self.iscatter(bresenham_ellipse(c, r1, r2), brush=brush)
+        if fill:
+            self._ispans(scanline_ellipse(c, r1, r2, self._box), brush)
+        else:
+            self.iscatter(bresenham_ellipse(c, r1, r2, self._box), brush=brush)
 
     def chain(self, *ps: Point, brush: Union[V, UseDefault] = USE_DEFAULT):
         """Draw a chain of segments.
@@ -223,22 +944,43 @@ class Matrix(Generic[V, O]):
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
-        for seg in zip(ps[:-1], ps[1:]):
-            self.line(*seg, brush=brush)
+        self._ichain(ps, brush)
+
+    def _ichain(self, ps: Iterable[Point], brush: Union[V, UseDefault]):
+        """Draw a chain of segments from an iterator."""
+        it = iter(ps)
+        prev = next(it, None)
+        for p in it:
+            self.line(cast(Point, prev), p, brush=brush)
+            prev = p
 
-    def polygon(self, *ps: Point, brush: Union[V, UseDefault] = USE_DEFAULT):
+    def polygon(
+        self,
+        *ps: Point,
+        fill: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
         """Draw a polygon.
 
         :param *ps: in order points of the polygon
         :type ps: Point
+        :param fill: fill the polygon (even-odd rule), defaults to False
+        :type fill: bool, optional
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
+        if fill:
+            self._ispans(scanline_polygon(ps, self._box), brush)
         for ps in zip(ps, [ps[-1], *ps[:-1]]):
             self.line(*ps, brush=brush)
 
     def rectangle(
-        self, c0: Point, c1: Point, *, brush: Union[V, UseDefault] = USE_DEFAULT
+        self,
+        c0: Point,
+        c1: Point,
+        *,
+        fill: bool = False,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
     ):
         """Draw a rectangle.
 
@@ -248,11 +990,16 @@ class Matrix(Generic[V, O]):
         :type c0: Point
         :param c1: coordinates of the second corner.
         :type c1: Point
+        :param fill: fill the rectangle, defaults to False
+        :type fill: bool, optional
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
         (x0, y0), (x1, y1) = c0, c1
-        self.polygon(c0, (x1, y0), c1, (x0, y1), brush=brush)
+        if fill:
+            self._fill_rect(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1), brush)
+        else:
+            self.polygon(c0, (x1, y0), c1, (x0, y1), brush=brush)
 
     def plot(
         self,
@@ -270,7 +1017,7 @@ class Matrix(Generic[V, O]):
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
-        self.chain(*zip(xs, ys), brush=brush)
+        self._ichain(zip(xs, ys), brush)
 
     def plotf(
         self,
@@ -301,37 +1048,184 @@ class Matrix(Generic[V, O]):
         :type brush: V, optional
         """
         x0, y0 = origin
-        coords = [x0 + to_x(x) for x in xs], [y0 + to_y(f(x)) for x in xs]
-        self.plot(*coords[:: 1 - 2 * transpose], brush=brush)
+        ps = ((x0 + to_x(x), y0 + to_y(f(x))) for x in xs)
+        self._ichain(((y, x) for x, y in ps) if transpose else ps, brush)
+
+    def plot_series(
+        self,
+        ys: Sequence[float],
+        *,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Plot a series of values, spread evenly across the whole matrix.
+
+        Meant for long (time) series, e.g. :class:`array.array`, memoryview or
+        NumPy arrays. Series longer than the matrix is wide are reduced to the
+        range of their values in every column, so spikes aren't lost, which is
+        then drawn as one vertical run of pixels per column.
+
+        :param ys: values to plot
+        :type ys: Sequence[float]
+        :param lo: value at the bottom of the matrix, defaults to the minimum
+        :type lo: float, optional
+        :param hi: value at the top of the matrix, defaults to the maximum
+        :type hi: float, optional
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        """
+        if len(ys) <= self.display.width:
+            self._plot_values(list(ys), lo, hi, brush)
+            return
+        columns = list(minmax_downsample(ys, self.display.width))
+        lo = min(c[0] for c in columns) if lo is None else lo
+        hi = max(c[1] for c in columns) if hi is None else hi
+        self._plot_columns(columns, lo, hi, brush)
+
+    def iplot_series(
+        self,
+        ys: Iterable[float],
+        n: int,
+        lo: float,
+        hi: float,
+        *,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Plot a series of values from an iterator.
+
+        Same as :meth:`plot_series`, but consumes the values only once, while
+        they are drawn. Thus their amount and range have to be known upfront.
+
+        :param ys: values to plot
+        :type ys: Iterable[float]
+        :param n: amount of values
+        :type n: int
+        :param lo: value at the bottom of the matrix
+        :type lo: float
+        :param hi: value at the top of the matrix
+        :type hi: float
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        """
+        if n <= self.display.width:
+            self._plot_values(list(islice(ys, n)), lo, hi, brush)
+        else:
+            self._plot_columns(
+                iminmax_downsample(ys, n, self.display.width), lo, hi, brush
+            )
+
+    def _to_row(self, lo: float, hi: float) -> Callable[[float], int]:
+        """Map values within lo..hi to the rows of the matrix, bottom to top."""
+        bottom = self.display.height - 1
+        scale = bottom / (hi - lo) if hi > lo else 0
+        return lambda y: bottom - round((y - lo) * scale)
+
+    def _plot_values(
+        self,
+        ys: Sequence[float],
+        lo: Optional[float],
+        hi: Optional[float],
+        brush: Union[V, UseDefault],
+    ):
+        """Plot a few values, spread across the matrix and connected by lines."""
+        if not ys:
+            return
+        to_row = self._to_row(
+            min(ys) if lo is None else lo, max(ys) if hi is None else hi
+        )
+        step = (self.display.width - 1) / max(len(ys) - 1, 1)
+        points = [(round(x * step), to_row(y)) for x, y in enumerate(ys)]
+        if len(points) == 1:
+            self.iscatter(points, brush=brush)
+        self._ichain(points, brush)
+
+    def _plot_columns(
+        self,
+        columns: Iterable[Tuple[float, float]],
+        lo: float,
+        hi: float,
+        brush: Union[V, UseDefault],
+    ):
+        """Plot the value range of every column as a vertical run of pixels."""
+        to_row = self._to_row(lo, hi)
+        for x, (y0, y1) in enumerate(columns):
+            self._fill_rect(x, to_row(y1), x, to_row(y0), brush)
 
     def curve(
         self,
         *ps: Point,
         steps: int = 0,
+        tolerance: float = 0.5,
         brush: Union[V, UseDefault] = USE_DEFAULT,
     ):
         """Draw a Bezier curve.
 
+        The curve is approximated by a chain of segments, just as many as
+        needed to stay within the tolerance, which are drawn in one go.
+
         :param *ps: control points of the curve
         :type ps: Point
-        :param steps: amount steps to take, defaults to a sensible amount
+        :param steps: amount of segments, defaults to just enough for the
+            tolerance
         :type steps: int, optional
+        :param tolerance: maximum distance between the curve and the segments,
+            in pixels, defaults to 0.5
+        :type tolerance: float, optional
         :raises ValueError: raised if to few points are given to define a curve
         :param brush: value to set the pixels to
         :type brush: V, optional
         """
         if len(ps) < 2:
             raise ValueError("Need at least two points to define a curve.")
+        if steps <= 0:
+            steps = bezier_steps(ps, tolerance)
+        self._ipath(forward_differences(ps, steps), brush)
+
+    def spline(
+        self,
+        *ps: Point,
+        kind: str = "catmull-rom",
+        closed: bool = False,
+        tolerance: float = 0.5,
+        brush: Union[V, UseDefault] = USE_DEFAULT,
+    ):
+        """Draw a smooth curve through or along some points.
+
+        A "catmull-rom" spline passes through all of the points, a "b-spline"
+        is merely pulled towards them. Either is drawn as a chain of cubic
+        Bezier curves, see :meth:`curve`.
+
+        :param *ps: points defining the spline
+        :type ps: Point
+        :param kind: one of "catmull-rom" and "b-spline", defaults to
+            "catmull-rom"
+        :type kind: str, optional
+        :param closed: connect the last point back to the first one, defaults
+            to False
+        :type closed: bool, optional
+        :param tolerance: maximum distance between the curve and the segments,
+            in pixels, defaults to 0.5
+        :type tolerance: float, optional
+        :param brush: value to set the pixels to
+        :type brush: V, optional
+        :raises ValueError: unknown kind of spline or too few points
+        """
+        if kind == "catmull-rom":
+            curves = catmull_rom_bezier(ps, closed)
+        elif kind == "b-spline":
+            curves = bspline_bezier(ps, closed)
         else:
-            if steps <= 0:
-                max_segments_lengths = (
-                    max(abs(x0 - x1), abs(y0 - y1))
-                    for (x0, y0), (x1, y1) in zip(ps, [ps[-1], *ps[:-1]])
-                )
-                steps = sum(max_segments_lengths) // 4
-            intermediates = (
-                (round(x), round(y))
-                for i in range(steps)
-                for x, y in [de_casteljau(i / steps, ps)]
-            )
-            self.chain(ps[0], *intermediates, ps[-1], brush=brush)
+            raise ValueError(f"Unknown kind of spline: {kind!r}")
+        if len(ps) < 2:
+            raise ValueError("Need at least two points to define a spline.")
+        self._ipath(
+            chain.from_iterable(
+                forward_differences(cs, bezier_steps(cs, tolerance)) for cs in curves
+            ),
+            brush,
+        )
+
+    def _ipath(self, ps: Iterable[Tuple[float, float]], brush: Union[V, UseDefault]):
+        """Draw the chain of segments through points rounded to pixels in one go."""
+        self.iscatter(bresenham_path(ps, self._box), brush=brush)
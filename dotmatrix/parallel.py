@@ -0,0 +1,198 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import ceil
+from multiprocessing import Lock
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Lock as LockType
+from typing import IO, Iterable, Iterator, Optional, Sequence, Tuple, Type, cast
+
+from ._types import Display
+from .displays._cell import CellDisplay
+from .matrix import Matrix
+
+__all__ = ("TiledRenderer",)
+
+
+# Amount of bands every worker gets to render, on average. More bands than
+# workers even out differences in their render times.
+BANDS_PER_WORKER = 4
+# Amount of stripes the data is split into while merging pixels into it, each
+# guarded by a lock of its own, so workers rarely wait on each other.
+STRIPES = 16
+
+# The shared data and the locks of its stripes, as seen by a worker process.
+_shared: Optional[SharedMemory] = None
+_locks: Sequence[LockType] = ()
+
+
+def _attach(name: str, locks: Sequence[LockType]):
+    """Attach a worker process to the shared data."""
+    global _shared, _locks
+    _shared, _locks = SharedMemory(name), locks
+
+
+def _band(kind: Type[CellDisplay], width: int, rows: Tuple[int, int]) -> bytes:
+    """Render the character rows start..stop of the shared display."""
+    start, stop = rows
+    band = kind(width, (stop - start) * kind.cell_height)
+    stride = band._char_width
+    view = cast(memoryview, cast(SharedMemory, _shared).buf)
+    band.data = view[start * stride : stop * stride]  # type: ignore
+    try:
+        # Some displays reuse a single buffer for every line.
+        return b"\n".join(bytes(line) for line in band._encoded_lines())
+    finally:
+        band.data.release()  # type: ignore
+
+
+def _rasterize(kind: Type[CellDisplay], width: int, height: int, coords: Sequence[int]):
+    """Set a batch of pixels, given as flat x, y pairs, on the shared display.
+
+    The pixels are set on a display of the worker's own first, which is then
+    merged into the shared one a stripe at a time.
+    """
+    layer = kind(width, height)
+    layer.set_many(zip(coords[0::2], coords[1::2]), True)
+    data, view = layer.data.tobytes(), cast(memoryview, cast(SharedMemory, _shared).buf)
+    size = max(1, ceil(len(data) / STRIPES))
+    for i, start in enumerate(range(0, len(data), size)):
+        stripe, stop = data[start : start + size], start + size
+        if not stripe.strip(b"\0"):
+            continue
+        with _locks[i]:
+            bits = int.from_bytes(view[start:stop], "little")
+            bits |= int.from_bytes(stripe, "little")
+            view[start:stop] = bits.to_bytes(len(stripe), "little")
+
+
+def _plain(display: Display) -> bool:
+    """Check whether a display is a cell display without any further state."""
+    if not isinstance(display, CellDisplay):
+        return False
+    mro = type(display).__mro__
+    return not any(
+        cls.__dict__.get("__slots__") for cls in mro[: mro.index(CellDisplay)]
+    )
+
+
+class TiledRenderer:
+    """Render a poster sized matrix on a pool of processes.
+
+    The matrix' data is moved into shared memory, where it stays until the
+    renderer is closed, so the worker processes can access it without any
+    copying. Rendering splits the matrix into bands of character rows, which
+    are rendered in parallel and concatenated in order. Drawing onto the
+    matrix as usual in between renders is fine.
+
+    Only plain cell displays, like :class:`~dotmatrix.displays.Braille` and
+    :class:`~dotmatrix.displays.Block`, can be shared. Use the renderer as a
+    context manager or :meth:`close` it when done.
+    """
+
+    __slots__ = ("matrix", "workers", "_data", "_shm", "_view", "_pool")
+
+    def __init__(self, matrix: Matrix, *, workers: Optional[int] = None) -> None:
+        """Initialize a renderer object.
+
+        :param matrix: the matrix to render
+        :type matrix: Matrix
+        :param workers: amount of worker processes, defaults to the amount of
+            CPUs
+        :type workers: Optional[int], optional
+        :raises TypeError: the matrix' display keeps state besides its cells
+        """
+        if not _plain(matrix.display):
+            name = type(matrix.display).__name__
+            raise TypeError(f"Can't share a {name} display.")
+        self.matrix = matrix
+        self.workers = workers or os.cpu_count() or 1
+        self._data = self._display.data
+        n = len(self._data)
+        # Shared memory blocks can't be empty.
+        self._shm: Optional[SharedMemory] = SharedMemory(create=True, size=max(n, 1))
+        self._view = cast(memoryview, self._shm.buf)[:n]
+        self._view[:] = self._data
+        self._display.data = self._view  # type: ignore
+        self._pool = ProcessPoolExecutor(
+            self.workers,
+            initializer=_attach,
+            initargs=(self._shm.name, [Lock() for _ in range(STRIPES)]),
+        )
+
+    def __enter__(self) -> "TiledRenderer":
+        """Enter the runtime context, returning the renderer itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exit the runtime context, closing the renderer."""
+        self.close()
+
+    @property
+    def _display(self) -> CellDisplay:
+        return cast(CellDisplay, self.matrix.display)
+
+    def _bands(self) -> Iterator[Tuple[int, int]]:
+        rows = self._display._char_height
+        size = max(1, ceil(rows / (self.workers * BANDS_PER_WORKER)))
+        for start in range(0, rows, size):
+            yield start, min(start + size, rows)
+
+    def _encoded_bands(self) -> Iterator[bytes]:
+        display = self._display
+        return self._pool.map(
+            partial(_band, type(display), display.width), self._bands()
+        )
+
+    def render(self) -> str:
+        """Render the current matrix state.
+
+        :return: render result, the same as :meth:`Matrix.render` returns
+        :rtype: str
+        """
+        return b"\n".join(self._encoded_bands()).decode()
+
+    def render_to(self, stream: IO[bytes]):
+        """Write the current matrix state to a binary stream.
+
+        The bands are written as soon as they, and all bands before them, are
+        rendered.
+
+        :param stream: the stream to write to
+        :type stream: IO[bytes]
+        """
+        for i, band in enumerate(self._encoded_bands()):
+            if i:
+                stream.write(b"\n")
+            stream.write(band)
+
+    def scatter(self, batches: Iterable[Sequence[int]]):
+        """Set many pixels, rasterizing batches of them in parallel.
+
+        Every batch holds the coordinates of its pixels as flat x, y pairs,
+        preferably as an :class:`array.array` of ints, which are cheap to send
+        to the workers. Out of bounds pixels are skipped.
+
+        :param batches: the batches of pixels to set
+        :type batches: Iterable[Sequence[int]]
+        """
+        display = self._display
+        rasterize = partial(_rasterize, type(display), display.width, display.height)
+        # Wait for all batches, raising their errors, if any.
+        for _ in self._pool.map(rasterize, batches):
+            pass
+
+    def close(self):
+        """Copy the data back into the matrix and stop the workers."""
+        if self._shm is None:
+            return
+        self._pool.shutdown()
+        with memoryview(self._data) as data:
+            # Read-only data, e.g. of a matrix opened read-only, is left as is.
+            if not data.readonly:
+                data[:] = self._view
+        self._display.data = self._data
+        self._view.release()
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
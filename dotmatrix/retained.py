@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Callable, Hashable, List, Tuple
+
+from .instrument import PRIMITIVES
+
+if TYPE_CHECKING:
+    from .matrix import Matrix
+
+__all__ = ("DisplayList",)
+
+
+# A drawing method's name with the arguments of a call.
+Command = Tuple[str, tuple, Tuple[Tuple[str, Any], ...]]
+
+# Methods reading the matrix, which rasterize the pending commands first.
+READERS = ("render", "render_to", "render_diff", "get", "copy", "save")
+# Commands whose result depends on what was drawn before them, so duplicates
+# on either side of one are never coalesced.
+BARRIERS = ("blit", "scroll")
+
+
+def _freeze(value: Any) -> Any:
+    """Snapshot an argument, so later changes of it don't affect the command.
+
+    Sequences and iterators become tuples, buffers like arrays become tuples
+    of their items and matrices become copies of them.
+    """
+    if isinstance(value, (list, tuple, range, Iterator)):
+        return tuple(map(_freeze, value))
+    if hasattr(value, "tolist"):
+        return _freeze(value.tolist())
+    if hasattr(value, "display") and hasattr(value, "copy"):
+        return value.copy()
+    return value
+
+
+def _coalesce(commands: List[Command]) -> List[Command]:
+    """Drop the commands repeated later on, without a barrier in between."""
+    out: List[Command] = []
+    seen: set[Hashable] = set()
+    for command in reversed(commands):
+        if command[0] in BARRIERS:
+            seen.clear()
+        else:
+            try:
+                if command in seen:
+                    continue
+                seen.add(command)
+            except TypeError:  # Unhashable arguments.
+                pass
+        out.append(command)
+    out.reverse()
+    return out
+
+
+class DisplayList:
+    """Record the drawing commands of a matrix, rasterizing them lazily.
+
+    While recording, the drawing methods of the matrix, like
+    :meth:`~Matrix.line` or :meth:`~Matrix.text`, append a command to
+    :attr:`commands` instead of drawing. Rendering the matrix, or reading it
+    via :meth:`~Matrix.get`, :meth:`~Matrix.copy` or :meth:`~Matrix.save`,
+    rasterizes the commands first:
+
+    - repeated commands only run once, as the last occurrence overdraws the
+      others anyway (unless the display blends values by adding them up)
+    - if the commands are the same as at the last rasterization, nothing is
+      drawn at all, and if they merely got appended to, only the new ones are
+    - otherwise the matrix is reset to a snapshot taken after drawing the
+      commands the last two lists started with, or to its contents from when
+      recording started, and only the commands after that are drawn, so
+      scenes changing towards their end are cheap to redraw
+
+    A frame typically empties the list via :meth:`clear` and records its
+    whole scene again, which only costs rasterization where the scene
+    actually changed. Item access, i.e. ``matrix[x, y]``, bypasses the list,
+    and other matrices reading this one, e.g. blitting it, should
+    :meth:`flush` it first.
+    """
+
+    __slots__ = (
+        "matrix",
+        "commands",
+        "_methods",
+        "_base",
+        "_checkpoint",
+        "_saved",
+        "_drawn",
+        "_recording",
+        "_dirty",
+        "_idempotent",
+    )
+
+    def __init__(self, matrix: Matrix[Any, Any]) -> None:
+        """Start recording the drawing commands of a matrix.
+
+        :param matrix: the matrix to record
+        :type matrix: Matrix[Any, Any]
+        """
+        self.matrix = matrix
+        self.commands: List[Command] = []
+        # The commands currently drawn onto the matrix, coalesced.
+        self._drawn: List[Command] = []
+        self._base = matrix.copy()
+        # Snapshot of the matrix after drawing the first saved commands.
+        self._checkpoint, self._saved = matrix.copy(), 0
+        self._idempotent = getattr(matrix.display, "blend", None) != "add"
+        self._methods = {
+            name: getattr(matrix, name) for name in (*PRIMITIVES, *READERS)
+        }
+        self._recording, self._dirty = True, False
+        for name in PRIMITIVES:
+            setattr(matrix, name, self._recorder(name))
+        for name in READERS:
+            setattr(matrix, name, self._reader(name))
+
+    def __enter__(self) -> "DisplayList":
+        """Enter the runtime context, returning the display list itself."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Exit the runtime context, stopping the recording."""
+        self.stop()
+
+    def _recorder(self, name: str) -> Callable:
+        method = self._methods[name]
+
+        def record(*args, **kwargs):
+            # Drawing methods calling each other while rasterizing draw.
+            if not self._recording:
+                return method(*args, **kwargs)
+            self._dirty = True
+            self.commands.append(
+                (
+                    name,
+                    _freeze(args),
+                    tuple((k, _freeze(v)) for k, v in sorted(kwargs.items())),
+                )
+            )
+
+        return record
+
+    def _reader(self, name: str) -> Callable:
+        method = self._methods[name]
+
+        def read(*args, **kwargs):
+            self.flush()
+            return method(*args, **kwargs)
+
+        return read
+
+    def clear(self):
+        """Remove all recorded commands, e.g. to record the next frame."""
+        self.commands.clear()
+        self._dirty = True
+
+    def flush(self):
+        """Rasterize the recorded commands onto the matrix."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        commands = _coalesce(self.commands) if self._idempotent else list(self.commands)
+        drawn = self._drawn
+        if commands == drawn:
+            return
+        # Length of the prefix the commands share with the drawn ones.
+        n = next(
+            (i for i, (a, b) in enumerate(zip(commands, drawn)) if a != b),
+            min(len(commands), len(drawn)),
+        )
+        draw, blit = self._draw, self._methods["blit"]
+        self._recording = False
+        try:
+            if n < len(drawn):
+                if self._saved <= n:
+                    blit(self._checkpoint, op="copy")
+                    draw(commands[self._saved : n])
+                else:
+                    blit(self._base, op="copy")
+                    draw(commands[:n])
+                if n != self._saved:
+                    self._checkpoint.blit(self.matrix, op="copy")
+                    self._saved = n
+            draw(commands[n:])
+        finally:
+            self._recording = True
+        self._drawn = commands
+
+    def _draw(self, commands: List[Command]):
+        for name, args, kwargs in commands:
+            self._methods[name](*args, **dict(kwargs))
+
+    def stop(self):
+        """Rasterize the recorded commands and stop recording."""
+        self.flush()
+        for name, method in self._methods.items():
+            # Restore methods shadowed before, e.g. by instrumentation.
+            if getattr(method, "__self__", None) is self.matrix:
+                vars(self.matrix).pop(name, None)
+            else:
+                setattr(self.matrix, name, method)
@@ -0,0 +1,185 @@
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterable, Tuple, Type
+
+from ._types import Display, Dotted, Point, Span
+from .algorithms import (
+    bresenham_circle,
+    bresenham_ellipse,
+    bresenham_line,
+    scanline_circle,
+    scanline_ellipse,
+    scanline_polygon,
+)
+
+__all__ = ("Sprite",)
+
+
+# Amount of sprites kept around by each of the cached constructors.
+CACHE_SIZE = 256
+
+
+def _span_dots(spans: Iterable[Span]) -> Iterable[Point]:
+    for y, x0, x1 in spans:
+        for x in range(x0, x1 + 1):
+            yield x, y
+
+
+class Sprite:
+    """A shape rasterized once, to be drawn many times.
+
+    The pixels are stored as one bitmask per row of their bounding box. For
+    displays supporting blitting, a copy of the sprite is rendered into a
+    display of the same kind once per position within a character cell, so
+    drawing it boils down to combining whole cells.
+    """
+
+    __slots__ = ("x", "y", "width", "height", "rows", "_variants")
+
+    def __init__(self, dots: Iterable[Point]) -> None:
+        """Initialize a sprite object.
+
+        :param dots: the pixels making up the sprite
+        :type dots: Iterable[Point]
+        """
+        ps = set(dots)
+        xs, ys = [x for x, _ in ps], [y for _, y in ps]
+        self.x, self.y = min(xs, default=0), min(ys, default=0)
+        self.width = max(xs, default=self.x - 1) - self.x + 1
+        self.height = max(ys, default=self.y - 1) - self.y + 1
+        rows = [0] * self.height
+        for x, y in ps:
+            rows[y - self.y] |= 1 << x - self.x
+        self.rows = tuple(rows)
+        # Displays holding the sprite, by display type, position within a
+        # character cell and whether they are inverted.
+        self._variants: Dict[Tuple[Type[Any], int, int, bool], Display] = {}
+
+    @classmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def of(cls, obj: Dotted) -> "Sprite":
+        """Get the sprite of an object implementing the Dotted protocol.
+
+        The object has to be hashable, as the sprites are cached.
+
+        :param obj: the object to rasterize
+        :type obj: Dotted
+        :return: the sprite
+        :rtype: Sprite
+        """
+        return cls(obj.__dots__())
+
+    @classmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def circle(cls, r: int, *, fill: bool = False) -> "Sprite":
+        """Get the sprite of a circle around the origin.
+
+        :param r: radius of the circle
+        :type r: int
+        :param fill: fill the circle, defaults to False
+        :type fill: bool, optional
+        :return: the sprite
+        :rtype: Sprite
+        """
+        if fill:
+            return cls(_span_dots(scanline_circle((0, 0), r)))
+        return cls(bresenham_circle((0, 0), r))
+
+    @classmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def ellipse(cls, r1: int, r2: int, *, fill: bool = False) -> "Sprite":
+        """Get the sprite of an axis aligned ellipse around the origin.
+
+        :param r1: x-axis radius of the ellipse
+        :type r1: int
+        :param r2: y-axis radius of the ellipse
+        :type r2: int
+        :param fill: fill the ellipse, defaults to False
+        :type fill: bool, optional
+        :return: the sprite
+        :rtype: Sprite
+        """
+        if fill:
+            return cls(_span_dots(scanline_ellipse((0, 0), r1, r2)))
+        return cls(bresenham_ellipse((0, 0), r1, r2))
+
+    @classmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def polygon(cls, *ps: Point, fill: bool = False) -> "Sprite":
+        """Get the sprite of a polygon.
+
+        :param *ps: in order points of the polygon
+        :type ps: Point
+        :param fill: fill the polygon (even-odd rule), defaults to False
+        :type fill: bool, optional
+        :return: the sprite
+        :rtype: Sprite
+        """
+        outline = chain.from_iterable(
+            bresenham_line(p0, p1) for p0, p1 in zip(ps, [ps[-1], *ps[:-1]])
+        )
+        if fill:
+            return cls(chain(_span_dots(scanline_polygon(ps)), outline))
+        return cls(outline)
+
+    def __dots__(self) -> Iterable[Point]:
+        """Generate the pixel positions representing this sprite.
+
+        :return: pixels to draw
+        :rtype: Iterable[Point]
+        """
+        for dy, row in enumerate(self.rows):
+            for dx, bit in enumerate(reversed(format(row, "b"))):
+                if bit == "1":
+                    yield self.x + dx, self.y + dy
+
+    def stamp(self, display: Display, at: Point, val: Any):
+        """Draw the sprite onto a display.
+
+        Doesn't fail on out of bounds, those pixels are simply skipped!
+
+        :param display: the display to draw onto
+        :type display: Display
+        :param at: the position to draw the sprite at
+        :type at: Point
+        :param val: the value to set the pixels to
+        :type val: Any
+        """
+        blit = getattr(display, "blit", None)
+        if blit is None or not isinstance(val, bool):
+            x0, y0 = at
+            set_many = getattr(display, "set_many", None)
+            ps = ((x0 + x, y0 + y) for x, y in self.__dots__())
+            if set_many is not None:
+                set_many(ps, val)
+            else:
+                for x, y in ps:
+                    if 0 <= x < display.width and 0 <= y < display.height:
+                        display[x, y] = val
+            return
+        if not self.rows:
+            return
+        cw = getattr(display, "cell_width", 1)
+        ch = getattr(display, "cell_height", 1)
+        (cx, dx), (cy, dy) = divmod(at[0] + self.x, cw), divmod(at[1] + self.y, ch)
+        # Set pixels are or-ed onto the display, cleared ones are and-ed, in
+        # which case the variant holds all the pixels to keep. Colored displays
+        # take variants without colors, painting them in their current color.
+        kind = getattr(display, "_dots_kind", type(display))
+        blit(
+            self._variant(kind, dx, dy, val),
+            (cx * cw, cy * ch),
+            "or" if val else "and",
+        )
+
+    def _variant(self, kind: Type[Any], dx: int, dy: int, val: bool) -> Display:
+        key = (kind, dx, dy, val)
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = self._variants[key] = kind(dx + self.width, dy + self.height)
+            for y in range(variant.height):
+                row = self.rows[y - dy] << dx if y >= dy else 0
+                for x in range(variant.width):
+                    if (row >> x & 1) == val:
+                        variant[x, y] = True
+        return variant
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from dotmatrix.algorithms import scanline_circle, scanline_ellipse, scanline_polygon
+
+BOX = (0, 0, 39, 29)
+
+
+def clip(spans, box):
+    bx0, by0, bx1, by1 = box
+    return [
+        (y, max(x0, bx0), min(x1, bx1))
+        for y, x0, x1 in spans
+        if by0 <= y <= by1 and max(x0, bx0) <= min(x1, bx1)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_clipped_polygon(seed):
+    rng = random.Random(seed)
+    ps = [
+        (rng.randint(-30, 70), rng.randint(-30, 60)) for _ in range(rng.randint(3, 8))
+    ]
+    assert list(scanline_polygon(ps, BOX)) == clip(scanline_polygon(ps), BOX)
+
+
+def test_clipped_polygon_far_outside():
+    ps = [(0, 0), (40, 10**6), (80, 0)]
+    assert list(scanline_polygon(ps, BOX)) == [(0, 0, 39)] + [
+        (y, 1, 39) for y in range(1, 30)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_clipped_circle(seed):
+    rng = random.Random(seed)
+    c, r = (rng.randint(-30, 70), rng.randint(-30, 60)), rng.randint(0, 40)
+    assert list(scanline_circle(c, r, BOX)) == clip(scanline_circle(c, r), BOX)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_clipped_ellipse(seed):
+    rng = random.Random(seed)
+    c, r1, r2 = (rng.randint(-30, 70), rng.randint(-30, 60)), *rng.choices(
+        range(40), k=2
+    )
+    assert list(scanline_ellipse(c, r1, r2, BOX)) == clip(
+        scanline_ellipse(c, r1, r2), BOX
+    )
@@ -0,0 +1,118 @@
+import random
+from io import BytesIO, StringIO
+
+import pytest
+
+from dotmatrix.displays import Block, Braille
+
+# Bit of each pixel of a braille cell, by (dx, dy).
+BRAILLE_BITS = {
+    (0, 0): 0,
+    (0, 1): 1,
+    (0, 2): 2,
+    (1, 0): 3,
+    (1, 1): 4,
+    (1, 2): 5,
+    (0, 3): 6,
+    (1, 3): 7,
+}
+
+
+def random_display(kind, width, height, seed):
+    rng = random.Random(seed)
+    display = kind(width, height)
+    for y in range(height):
+        for x in range(width):
+            display[x, y] = rng.random() < 0.5
+    return display
+
+
+def braille_reference(display):
+    return "\n".join(
+        "".join(
+            chr(
+                0x2800
+                | sum(
+                    1 << bit
+                    for (dx, dy), bit in BRAILLE_BITS.items()
+                    if cx + dx < display.width
+                    and cy + dy < display.height
+                    and display[cx + dx, cy + dy]
+                )
+            )
+            for cx in range(0, display.width, 2)
+        )
+        for cy in range(0, display.height, 4)
+    )
+
+
+def block_reference(display):
+    halves = {(0, 0): " ", (1, 0): "▀", (0, 1): "▄", (1, 1): "█"}
+    return "\n".join(
+        "".join(
+            halves[
+                x < display.width and display[x, y],
+                x < display.width and y + 1 < display.height and display[x, y + 1],
+            ]
+            # Cells are two pixels wide, odd widths are padded.
+            for x in range(display.width + display.width % 2)
+        )
+        for y in range(0, display.height, 2)
+    )
+
+
+def test_render_diff_first_render_is_full():
+    display = Braille(8, 8)
+    display[0, 0] = True
+    assert display.render_diff() == "\x1b[1;1H⠁⠀⠀⠀\x1b[2;1H⠀⠀⠀⠀"
+
+
+def test_render_diff_renders_changed_runs_only():
+    display = Braille(8, 8)
+    display.render_diff()
+    assert display.render_diff() == ""
+    display[3, 5] = True
+    display[4, 5] = True
+    assert display.render_diff((2, 1)) == "\x1b[3;4H⠐⠂"
+    assert display.render_diff() == ""
+
+
+def test_render_diff_full():
+    display = Braille(4, 4)
+    display.render_diff()
+    assert display.render_diff(full=True) == "\x1b[1;1H⠀⠀"
+
+
+def test_render_diff_wide_cells():
+    display = Block(8, 4)
+    display.render_diff()
+    display[5, 1] = True
+    assert display.render_diff() == "\x1b[1;5H ▄"
+
+
+def test_render_diff_after_copy():
+    display = Block(4, 2)
+    display.render_diff()
+    copy = display.copy()
+    copy[0, 0] = True
+    assert display.render_diff() == ""
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize(
+    "kind, reference", [(Braille, braille_reference), (Block, block_reference)]
+)
+@pytest.mark.parametrize("width, height", [(8, 8), (7, 5), (1, 1)])
+def test_render_matches_pixels(kind, reference, width, height, seed):
+    display = random_display(kind, width, height, seed)
+    assert display.render() == reference(display)
+
+
+@pytest.mark.parametrize("kind", [Braille, Block])
+def test_write_to_matches_render(kind):
+    display = random_display(kind, 13, 9, 0)
+    text, binary = StringIO(), BytesIO()
+    display.write_to(text)
+    display.write_to(binary)
+    assert text.getvalue() == display.render()
+    assert binary.getvalue() == display.render().encode()
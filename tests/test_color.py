@@ -0,0 +1,127 @@
+import pytest
+
+from dotmatrix import Matrix
+from dotmatrix.displays import Braille, ColorBraille
+
+RED, GREEN = 1, 2
+
+
+def colors(display: ColorBraille):
+    return list(display.colors)
+
+
+def test_copy_takes_source_colors():
+    dst, src = ColorBraille(8, 8, color=GREEN), ColorBraille(8, 8, color=RED)
+    dst.fill_rect(0, 0, 7, 7, True)
+    src.fill_rect(0, 0, 7, 7, True)
+    dst.blit(src, op="copy")
+    assert colors(dst) == [RED + 1] * len(dst.colors)
+
+
+def test_copy_unaligned_takes_source_colors():
+    dst, src = ColorBraille(8, 8, color=GREEN), ColorBraille(4, 8, color=RED)
+    dst.fill_rect(0, 0, 7, 7, True)
+    src.fill_rect(0, 0, 3, 7, True)
+    dst.blit(src, (1, 0), op="copy")
+    assert [dst.colors[c] for c in (0, 1, 2)] == [RED + 1] * 3
+    assert dst.colors[3] == GREEN + 1
+
+
+def test_or_colors_cells_drawn_into():
+    dst, src = ColorBraille(8, 4, color=GREEN), ColorBraille(8, 4, color=RED)
+    dst.fill_rect(0, 0, 7, 3, True)
+    src[0, 0] = True
+    dst.blit(src)
+    assert colors(dst) == [RED + 1, GREEN + 1, GREEN + 1, GREEN + 1]
+
+
+def test_and_with_plain_source_keeps_colors():
+    dst, src = ColorBraille(8, 4, color=GREEN), Braille(8, 4)
+    dst.fill_rect(0, 0, 7, 3, True)
+    src.fill_rect(0, 0, 7, 3, True)
+    dst.color = RED
+    dst.blit(src, op="and")
+    assert colors(dst) == [GREEN + 1] * 4
+
+
+def test_sprites_take_current_color():
+    matrix = Matrix.from_display(ColorBraille(16, 8, color=RED))
+    matrix.text("A", (1, 0))
+    lit = [
+        color
+        for dots, color in zip(matrix.display.data, colors(matrix.display))
+        if dots
+    ]
+    assert lit and set(lit) == {RED + 1}
+    matrix.display.color = GREEN
+    matrix.text("A", (1, 0))
+    lit = [
+        color
+        for dots, color in zip(matrix.display.data, colors(matrix.display))
+        if dots
+    ]
+    assert set(lit) == {GREEN + 1}
+
+
+@pytest.mark.parametrize("val", [-1, 255, 300])
+def test_palette_index_out_of_range(val):
+    display = ColorBraille(8, 4)
+    with pytest.raises(ValueError):
+        display[0, 0] = val
+    with pytest.raises(ValueError):
+        display.set_many([(1, 1), (5, 2)], val)
+    with pytest.raises(ValueError):
+        display.fill_rect(0, 0, 7, 3, val)
+    assert not any(display.data) and not any(display.colors)
+
+
+def test_palette_index_in_range():
+    display = ColorBraille(8, 4)
+    display[0, 0] = 0
+    display[4, 0] = 254
+    assert colors(display) == [1, 0, 255, 0]
+
+
+def test_render_emits_one_escape_per_color_run():
+    display = ColorBraille(12, 8, color=RED)
+    display.fill_rect(0, 0, 3, 3, True)
+    display[8, 0] = True
+    display[10, 0] = GREEN
+    display[0, 4] = True
+    display[4, 5] = GREEN
+    # Empty cells don't switch colors, runs go on across lines and the
+    # default color is restored at the end.
+    assert display.render() == (
+        "\x1b[31m⣿⣿⠀⠀⠁\x1b[32m⠁\n\x1b[31m⠁⠀\x1b[32m⠂⠀⠀⠀\x1b[39m"
+    )
+
+
+def test_render_without_colors_has_no_escapes():
+    display = ColorBraille(4, 4)
+    display[0, 0] = True
+    assert display.render() == "⠁⠀"
+
+
+@pytest.mark.parametrize(
+    "color, escape",
+    [(3, "\x1b[33m"), (12, "\x1b[94m"), (100, "\x1b[38;5;100m")],
+)
+def test_render_palette_escapes(color, escape):
+    display = ColorBraille(2, 4, palette=range(255), color=color)
+    display[0, 0] = True
+    assert display.render() == f"{escape}⠁\x1b[39m"
+
+
+def test_render_rgb_palette():
+    display = ColorBraille(2, 4, palette=[(1, 2, 3)])
+    display[0, 0] = 0
+    assert display.render() == "\x1b[38;2;1;2;3m⠁\x1b[39m"
+
+
+def test_render_diff_recolored_cells():
+    display = ColorBraille(8, 4, color=RED)
+    display.fill_rect(0, 0, 7, 3, True)
+    display.render_diff()
+    assert display.render_diff() == ""
+    display[2, 0] = GREEN
+    assert display.render_diff() == "\x1b[1;2H\x1b[32m⣿\x1b[39m"
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from dotmatrix import Matrix
+from dotmatrix.displays import Block, Braille, ColorBraille, Unit
+
+KINDS = [Braille, Block, Unit, ColorBraille]
+
+
+def pixels(display):
+    return [
+        bool(display[x, y]) for y in range(display.height) for x in range(display.width)
+    ]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize("seed", range(5))
+def test_set_many_matches_setitem(kind, seed):
+    rng = random.Random(seed)
+    ps = [(rng.randrange(11), rng.randrange(9)) for _ in range(40)]
+    bulk, single = kind(11, 9), kind(11, 9)
+    bulk.set_many(iter(ps), True)
+    for p in ps:
+        single[p] = True
+    assert pixels(bulk) == pixels(single)
+    off = ps[::2]
+    bulk.set_many(off, False)
+    for p in off:
+        single[p] = False
+    assert pixels(bulk) == pixels(single)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_set_many_skips_out_of_bounds(kind):
+    display = kind(6, 4)
+    display.set_many([(-1, 0), (6, 0), (0, -1), (0, 4), (2, 1), (10, 10)], True)
+    assert pixels(display) == [
+        p == (2, 1) for p in ((x, y) for y in range(4) for x in range(6))
+    ]
+
+
+def random_display(kind, width, height, seed):
+    rng = random.Random(seed)
+    display = kind(width, height)
+    display.set_many(
+        [(x, y) for y in range(height) for x in range(width) if rng.random() < 0.5],
+        True,
+    )
+    return display
+
+
+def scrolled(display, dx, dy):
+    w, h = display.width, display.height
+    return [
+        0 <= x - dx < w and 0 <= y - dy < h and bool(display[x - dx, y - dy])
+        for y in range(h)
+        for x in range(w)
+    ]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+@pytest.mark.parametrize(
+    "dx, dy", [(0, 0), (1, 0), (-3, 2), (5, -7), (-1, -1), (11, 0), (0, -9), (-20, 30)]
+)
+def test_scroll_moves_pixels(kind, dx, dy):
+    display = random_display(kind, 11, 9, dx * 31 + dy)
+    expected = scrolled(display, dx, dy)
+    display.scroll(dx, dy)
+    assert pixels(display) == expected
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_scroll_drops_pixels_moved_out(kind):
+    # Odd sizes, cell displays have padding pixels past the edges.
+    display = kind(5, 3)
+    display.fill_rect(0, 0, 4, 2, True)
+    display.scroll(1, 1)
+    display.scroll(-1, -1)
+    assert pixels(display) == [x < 4 and y < 2 for y in range(3) for x in range(5)]
+
+
+def test_matrix_scroll_without_display_scrolling():
+    class Plain(Braille):
+        scroll = None
+
+    matrix = Matrix.from_display(random_display(Plain, 11, 9, 0))
+    expected = scrolled(matrix.display, 2, -3)
+    matrix.scroll(2, -3)
+    assert pixels(matrix.display) == expected
@@ -0,0 +1,19 @@
+import pytest
+
+from dotmatrix import Matrix
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("method", ["threshold", "bayer", "floyd-steinberg"])
+def test_strided_pixels(method):
+    image = np.random.default_rng(0).integers(0, 256, (40, 60), dtype=np.uint8)
+    crop = image[5:35:2, 10:50]
+    assert not crop.flags.c_contiguous
+    expected = Matrix.from_image(crop.tobytes(), 40, 15, method=method)
+    assert Matrix.from_image(crop, 40, 15, method=method).render() == expected.render()
+    transposed = Matrix.from_image(image.T, 40, 60, method=method)
+    assert (
+        transposed.render()
+        == Matrix.from_image(image.T.tobytes(), 40, 60, method=method).render()
+    )
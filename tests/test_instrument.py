@@ -0,0 +1,86 @@
+from io import BytesIO
+
+from dotmatrix import Matrix
+from dotmatrix.instrument import Stats
+
+
+def test_clipped_line():
+    m = Matrix(60, 40)
+    stats = m.instrument()
+    m.line((-50, 5), (50, 30))
+    line = stats.primitives["line"]
+    assert (line.calls, line.pixels, line.clipped) == (1, 51, 50)
+
+
+def test_clipped_circle():
+    m = Matrix(60, 40)
+    stats = m.instrument()
+    m.circle((30, 20), 10)
+    m.circle((0, 0), 10)
+    circle = stats.primitives["circle"]
+    assert (circle.calls, circle.pixels, circle.clipped) == (2, 76, 44)
+
+
+def test_clipped_ellipse():
+    m = Matrix(60, 40)
+    stats = m.instrument()
+    m.ellipse((30, 20), 10, 5)
+    assert stats.primitives["ellipse"].clipped == 0
+    m.ellipse((-10, 20), 10, 5)
+    ellipse = stats.primitives["ellipse"]
+    assert ellipse.pixels + ellipse.clipped == 96
+
+
+def test_clipped_curve():
+    m = Matrix(60, 40)
+    stats = m.instrument()
+    m.curve((1, 1), (50, 30), (5, 35))
+    curve = stats.primitives["curve"]
+    assert curve.clipped == 0
+    stats.reset()
+    m.curve((-30, 1), (90, 30), (5, 35))
+    assert stats.primitives["curve"].clipped > 0
+
+
+def test_clipped_scatter():
+    m = Matrix(10, 10)
+    stats = m.instrument()
+    m.scatter((3, 3), (-1, 3))
+    entry = stats.primitives["scatter"]
+    assert (entry.pixels, entry.clipped) == (1, 1)
+
+
+def test_nested_calls_count_once():
+    m = Matrix(20, 20)
+    stats = m.instrument()
+    m.polygon((1, 1), (10, 1), (10, 10))
+    m.rectangle((0, 0), (4, 4), fill=True)
+    assert set(stats.primitives) == {"polygon", "rectangle"}
+    assert stats.primitives["polygon"].calls == 1
+    assert stats.primitives["rectangle"].pixels == 25
+
+
+def test_render_sizes():
+    m = Matrix(8, 8)
+    stats = m.instrument()
+    m.render()
+    m.render_diff()
+    m.render_to(BytesIO())
+    assert stats.renders["Braille.render"].size == len("⠀⠀⠀⠀\n⠀⠀⠀⠀")
+    assert stats.renders["Braille.render_diff"].calls == 1
+    assert stats.renders["Braille.render_to"].size == len("⠀⠀⠀⠀\n⠀⠀⠀⠀".encode())
+
+
+def test_shared_stats_and_uninstrument():
+    a, b, stats = Matrix(8, 8), Matrix(8, 8), Stats()
+    a.instrument(stats)
+    b.instrument(stats)
+    a.line((0, 0), (7, 7))
+    b.line((0, 0), (7, 0))
+    a.uninstrument()
+    a.line((0, 0), (7, 7))
+    line = stats.primitives["line"]
+    assert (line.calls, line.pixels, line.clipped) == (2, 16, 0)
+    assert "line" in stats.report()
+    stats.reset()
+    assert not stats.primitives and not stats.renders
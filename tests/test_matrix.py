@@ -0,0 +1,39 @@
+from dotmatrix import Matrix
+from dotmatrix.displays import Braille, Shade
+
+
+def lit(matrix):
+    display = matrix.display
+    return {
+        (x, y)
+        for y in range(display.height)
+        for x in range(display.width)
+        if display[x, y]
+    }
+
+
+def test_antialiased_line_with_false_erases():
+    matrix = Matrix.from_display(Braille(20, 12))
+    matrix.display.fill_rect(0, 0, 19, 11, True)
+    matrix.line((1, 1), (18, 9), antialias=True, brush=False)
+    erased = {(x, y) for x in range(20) for y in range(12)} - lit(matrix)
+    drawn = Matrix.from_display(Braille(20, 12))
+    drawn.line((1, 1), (18, 9), antialias=True)
+    assert erased and erased == lit(drawn)
+
+
+def test_antialiased_circle_with_false_erases_shades():
+    matrix = Matrix.from_display(Shade(20, 20))
+    matrix.display.fill_rect(0, 0, 19, 19, 255)
+    matrix.circle((10, 10), 6, antialias=True, brush=False)
+    drawn = Matrix.from_display(Braille(20, 20))
+    drawn.circle((10, 10), 6, antialias=True)
+    assert lit(drawn)
+    assert all(not matrix.display[x, y] for x, y in lit(drawn))
+
+
+def test_antialiased_line_scales_int_brushes():
+    matrix = Matrix.from_display(Shade(20, 12))
+    matrix.line((1, 1), (18, 9), antialias=True, brush=200)
+    levels = {matrix.display[x, y] for x, y in lit(matrix)}
+    assert max(levels) <= 200 and len(levels) > 1
@@ -0,0 +1,30 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dotmatrix import Matrix  # noqa: E402
+from dotmatrix.displays import Braille, NumpyBlock, NumpyBraille  # noqa: E402
+
+
+@pytest.mark.parametrize("display", [NumpyBraille, NumpyBlock])
+def test_copy_empty(display):
+    for width, height in ((0, 0), (0, 5), (5, 0)):
+        copy = display(width, height).copy()
+        assert (copy.width, copy.height) == (width, height)
+
+
+def test_points_scatter_arrays():
+    rng = np.random.default_rng(0)
+    xs, ys = rng.integers(-10, 70, 500), rng.integers(-10, 50, 500)
+    plain, vectorized = Matrix(60, 40, display=Braille), Matrix(
+        60, 40, display=NumpyBraille
+    )
+    plain.points(xs.tolist(), ys.tolist())
+    vectorized.points(xs, ys)
+    assert vectorized.render() == plain.render()
+    stats = vectorized.instrument()
+    vectorized.points(xs, ys, brush=False)
+    assert vectorized.render() == Matrix(60, 40).render()
+    assert stats.primitives["points"].pixels == sum(
+        0 <= x < 60 and 0 <= y < 40 for x, y in zip(xs, ys)
+    )
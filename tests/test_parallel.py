@@ -0,0 +1,63 @@
+import random
+from array import array
+from io import BytesIO
+
+import pytest
+
+from dotmatrix import Matrix
+from dotmatrix.displays import Block, Braille, ColorBraille, Unit
+from dotmatrix.parallel import TiledRenderer
+
+
+def random_matrix(kind, width, height, seed):
+    rng = random.Random(seed)
+    matrix = Matrix.from_display(kind(width, height))
+    for _ in range(20):
+        matrix.line(
+            (rng.randrange(width), rng.randrange(height)),
+            (rng.randrange(width), rng.randrange(height)),
+        )
+    return matrix
+
+
+@pytest.mark.parametrize("kind", [Braille, Block])
+def test_render_matches_serial(kind):
+    matrix = random_matrix(kind, 61, 53, 0)
+    expected = matrix.render()
+    with TiledRenderer(matrix, workers=2) as renderer:
+        assert renderer.render() == expected
+        stream = BytesIO()
+        renderer.render_to(stream)
+        assert stream.getvalue() == expected.encode()
+        # Drawing in between renders goes to the shared data.
+        matrix.line((0, 0), (60, 52))
+        expected = matrix.render()
+        assert renderer.render() == expected
+    assert matrix.render() == expected
+
+
+def test_scatter_matches_set_many():
+    rng = random.Random(1)
+    coords = array("i", (rng.randrange(-5, 70) for _ in range(2000)))
+    expected = Braille(64, 48)
+    expected.set_many(zip(coords[0::2], coords[1::2]), True)
+    matrix = Matrix.from_display(Braille(64, 48))
+    with TiledRenderer(matrix, workers=2) as renderer:
+        renderer.scatter(coords[i : i + 200] for i in range(0, len(coords), 200))
+    assert matrix.display.data == expected.data
+
+
+def test_close_hands_back_the_data():
+    matrix = Matrix.from_display(Braille(8, 8))
+    renderer = TiledRenderer(matrix, workers=1)
+    matrix.display[1, 1] = True
+    renderer.close()
+    renderer.close()
+    assert isinstance(matrix.display.data, array)
+    assert matrix.display[1, 1]
+
+
+@pytest.mark.parametrize("kind", [ColorBraille, Unit])
+def test_only_plain_cell_displays(kind):
+    with pytest.raises(TypeError):
+        TiledRenderer(Matrix.from_display(kind(8, 8)))
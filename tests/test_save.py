@@ -0,0 +1,34 @@
+from dotmatrix import Matrix
+from dotmatrix.displays import Braille, Shade, Unit
+
+
+def roundtrip(tmp_path, matrix):
+    path = tmp_path / "matrix.dmx"
+    matrix.save(path)
+    return Matrix.open(path)
+
+
+def test_braille(tmp_path):
+    matrix = Matrix(20, 12, display=Braille)
+    matrix.circle((10, 6), 5)
+    opened = roundtrip(tmp_path, matrix)
+    assert type(opened.display) is Braille
+    assert opened.render() == matrix.render()
+
+
+def test_unit_chars(tmp_path):
+    matrix = Matrix.from_display(Unit(6, 4, chars=(".", "#")))
+    matrix.line((0, 0), (5, 3))
+    opened = roundtrip(tmp_path, matrix)
+    assert opened.display.chars == (".", "#")
+    assert opened.render() == matrix.render()
+
+
+def test_shade_blend_and_palette(tmp_path):
+    matrix = Matrix.from_display(Shade(6, 4, blend="add", palette=" .:#"))
+    matrix.line((0, 0), (5, 3), brush=100)
+    opened = roundtrip(tmp_path, matrix)
+    assert (opened.display.blend, opened.display.palette) == ("add", " .:#")
+    assert opened.render() == matrix.render()
+    opened = roundtrip(tmp_path, Matrix.from_display(Shade(2, 2, palette=("a", "b"))))
+    assert opened.display.palette == ("a", "b")
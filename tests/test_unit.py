@@ -0,0 +1,122 @@
+import random
+from io import BytesIO, StringIO
+
+import pytest
+
+from dotmatrix.displays import Unit
+
+
+def random_unit(width, height, seed, **kwargs):
+    rng = random.Random(seed)
+    display = Unit(width, height, **kwargs)
+    for y in range(height):
+        for x in range(width):
+            display[x, y] = rng.random() < 0.5
+    return display
+
+
+def reference(display):
+    return "\n".join(
+        "".join(display.chars[display[x, y]] for x in range(display.width))
+        for y in range(display.height)
+    )
+
+
+@pytest.mark.parametrize(
+    "chars",
+    [("  ", "██"), (".", "#"), ("·", "●●"), ("  ", "🟦")],
+    ids=["default", "single", "uneven", "astral"],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_render_matches_pixels(chars, seed):
+    display = random_unit(9, 4, seed, chars=chars)
+    assert display.render() == reference(display)
+
+
+def test_write_to_matches_render():
+    display = random_unit(9, 4, 0)
+    text, binary = StringIO(), BytesIO()
+    display.write_to(text)
+    display.write_to(binary)
+    assert text.getvalue() == display.render()
+    assert binary.getvalue() == display.render().encode()
+
+
+def test_pixels_are_bytes_in_row_major_order():
+    display = Unit(3, 2)
+    display[1, 0] = True
+    display[2, 1] = 5
+    assert list(display.data) == [0, 1, 0, 0, 0, 1]
+    assert display[2, 1] is True and display[0, 0] is False
+    display[1, 0] = False
+    assert list(display.data) == [0, 0, 0, 0, 0, 1]
+
+
+@pytest.mark.parametrize("pos", [(-1, 0), (3, 0), (0, 2)])
+def test_out_of_bounds(pos):
+    display = Unit(3, 2)
+    with pytest.raises(IndexError):
+        display[pos] = True
+    with pytest.raises(IndexError):
+        display[pos]
+
+
+def test_bulk_setters():
+    display = Unit(4, 3)
+    display.set_flat([0, 5], True)
+    display.set_row(2, b"\0\7\0\1")
+    display.fill_rect(2, 0, 3, 1, True)
+    assert display.render() == "██  ████\n  ██████\n  ██  ██"
+    with pytest.raises(IndexError):
+        display.set_row(3, b"\0" * 4)
+    with pytest.raises(IndexError):
+        display.fill_rect(2, 0, 4, 1, True)
+
+
+def test_render_diff():
+    display = Unit(4, 2, chars=(".", "#"))
+    assert display.render_diff((1, 1)) == "\x1b[2;2H....\x1b[3;2H...."
+    display[2, 1] = True
+    display[3, 1] = True
+    assert display.render_diff((1, 1)) == "\x1b[3;4H##"
+    assert display.render_diff() == ""
+
+
+def test_render_diff_wide_chars():
+    display = Unit(4, 2)
+    display.render_diff()
+    display[1, 1] = True
+    assert display.render_diff() == "\x1b[2;3H██"
+
+
+def test_copy_is_independent():
+    class Custom(Unit):
+        pass
+
+    display = Custom(3, 2, chars=(".", "#"))
+    display[0, 0] = True
+    copy = display.copy()
+    copy[1, 1] = True
+    assert type(copy) is Custom and copy.chars == (".", "#")
+    assert display.render() == "#..\n..."
+    assert copy.render() == "#..\n.#."
+
+
+@pytest.mark.parametrize(
+    "op, expected", [("or", "##.\n##."), ("and", "#..\n..."), ("xor", ".#.\n##.")]
+)
+def test_blit(op, expected):
+    display, src = Unit(3, 2, chars=(".", "#")), Unit(2, 2)
+    display[0, 0] = True
+    src.fill_rect(0, 0, 1, 1, True)
+    display.blit(src, op=op)
+    assert display.render() == expected
+
+
+def test_from_buffer_shares_data():
+    buf = bytearray(6)
+    display = Unit.from_buffer(buf, 3, 2)
+    display[2, 1] = True
+    assert buf == b"\0\0\0\0\0\1"
+    with pytest.raises(ValueError):
+        Unit.from_buffer(buf, 4, 2)